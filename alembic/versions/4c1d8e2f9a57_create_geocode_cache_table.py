@@ -0,0 +1,39 @@
+"""create geocode cache table
+
+Revision ID: 4c1d8e2f9a57
+Revises: 9b2e4c7d1a36
+Create Date: 2026-10-16 20:41:09.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1d8e2f9a57'
+down_revision: Union[str, None] = '9b2e4c7d1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'geocode_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('provider', sa.String(length=20), nullable=False),
+        sa.Column('lookup_type', sa.String(length=10), nullable=False),
+        sa.Column('lookup_key', sa.String(length=255), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('provider', 'lookup_type', 'lookup_key', name='uq_geocode_cache_lookup')
+    )
+    op.create_index(op.f('ix_geocode_cache_id'), 'geocode_cache', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_geocode_cache_id'), table_name='geocode_cache')
+    op.drop_table('geocode_cache')
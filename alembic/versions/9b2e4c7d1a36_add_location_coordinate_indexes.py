@@ -0,0 +1,37 @@
+"""add latitude/longitude indexes to location tables
+
+Revision ID: 9b2e4c7d1a36
+Revises: d15c4d0a297f
+Create Date: 2026-10-16 09:12:41.532810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e4c7d1a36'
+down_revision: Union[str, None] = 'd15c4d0a297f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOCATION_TABLES = (
+    'influencer_operational_locations',
+    'business_operational_locations',
+    'location_promotion_requests',
+)
+
+
+def upgrade() -> None:
+    # Bounding-box prefilter for nearby searches ranges over both columns
+    for table in LOCATION_TABLES:
+        op.create_index(op.f(f'ix_{table}_latitude'), table, ['latitude'])
+        op.create_index(op.f(f'ix_{table}_longitude'), table, ['longitude'])
+
+
+def downgrade() -> None:
+    for table in reversed(LOCATION_TABLES):
+        op.drop_index(op.f(f'ix_{table}_longitude'), table_name=table)
+        op.drop_index(op.f(f'ix_{table}_latitude'), table_name=table)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Geo Distance Micro-benchmark
+Compares the scalar LocationSearchService.calculate_distance loop with the
+vectorized geo_distance engine used by the nearby-search endpoints
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import time
+
+# Add the project root to the path to import from the app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.services.location.geo_distance import haversine_km_batch, nearest_within_radius
+
+
+def scalar_haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Per-row Haversine as previously run for every location row"""
+    lat1, lng1, lat2, lng2 = map(math.radians, [lat1, lng1, lat2, lng2])
+    dlat = lat2 - lat1
+    dlng = lng2 - lng1
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
+    return 6371 * 2 * math.asin(math.sqrt(a))
+
+
+async def scalar_nearby(origin, points, radius_km, limit):
+    """Scalar path: one awaited distance call per point, then a full sort"""
+    async def calculate_distance(lat1, lng1, lat2, lng2):
+        return scalar_haversine(lat1, lng1, lat2, lng2)
+
+    nearby = []
+    for lat, lng in points:
+        distance = await calculate_distance(origin[0], origin[1], lat, lng)
+        if distance <= radius_km:
+            nearby.append(distance)
+    nearby.sort()
+    return nearby[:limit] if limit else nearby
+
+
+def vectorized_nearby(origin, lats, lngs, radius_km, limit):
+    """Vectorized path: one batch distance call plus top-k selection"""
+    distances = haversine_km_batch(origin[0], origin[1], lats, lngs)
+    return distances[nearest_within_radius(distances, radius_km, limit)]
+
+
+def run(points_count: int, radius_km: float, limit: int, repeats: int):
+    random.seed(42)
+    origin = (51.5074, -0.1278)
+    points = [(random.uniform(35, 65), random.uniform(-15, 25)) for _ in range(points_count)]
+    lats = [p[0] for p in points]
+    lngs = [p[1] for p in points]
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        scalar_result = asyncio.run(scalar_nearby(origin, points, radius_km, limit))
+    scalar_ms = (time.perf_counter() - start) * 1000 / repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        vector_result = vectorized_nearby(origin, lats, lngs, radius_km, limit)
+    vector_ms = (time.perf_counter() - start) * 1000 / repeats
+
+    assert len(scalar_result) == len(vector_result)
+    assert all(abs(a - b) < 1e-6 for a, b in zip(scalar_result, vector_result))
+
+    print(f"points={points_count} radius_km={radius_km} limit={limit} matches={len(vector_result)}")
+    print(f"  scalar     : {scalar_ms:9.3f} ms")
+    print(f"  vectorized : {vector_ms:9.3f} ms")
+    print(f"  speedup    : {scalar_ms / vector_ms:9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs vectorized Haversine search")
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--radius-km", type=float, default=500)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for count in args.points:
+        run(count, args.radius_km, args.limit, args.repeats)
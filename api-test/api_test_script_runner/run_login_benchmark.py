@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Login Throughput Benchmark
+Compares bcrypt verification run inline on the event loop with verification on
+the password hashing pool used by /auth/token, and reports how long the event
+loop was blocked while a burst of logins was processed
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root to the path to import from the app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+async def measure(label: str, logins: int, verify) -> None:
+    """Run a burst of concurrent logins while a heartbeat measures event loop lag"""
+    max_lag_ms = 0.0
+    running = True
+
+    async def heartbeat():
+        nonlocal max_lag_ms
+        interval = 0.005
+        while running:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            max_lag_ms = max(max_lag_ms, (time.perf_counter() - expected) * 1000)
+
+    monitor = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[verify() for _ in range(logins)])
+    elapsed = time.perf_counter() - start
+
+    running = False
+    await monitor
+    assert all(results)
+
+    print(f"  {label:<8}: {elapsed * 1000:9.1f} ms total  {logins / elapsed:8.1f} logins/s  "
+          f"max loop stall {max_lag_ms:8.1f} ms")
+
+
+async def run(logins: int) -> None:
+    from app.core.config import settings
+    from app.services.auth import hash_password, verify_password, verify_and_update_password
+
+    password = "benchmark-password"
+    hashed = hash_password(password)
+
+    async def inline_verify():
+        return verify_password(password, hashed)
+
+    async def pooled_verify():
+        valid, _ = await verify_and_update_password(password, hashed)
+        return valid
+
+    print(f"logins={logins} bcrypt_rounds={settings.BCRYPT_ROUNDS} hash_workers={settings.PASSWORD_HASH_WORKERS}")
+    await measure("inline", logins, inline_verify)
+    await measure("pooled", logins, pooled_verify)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark inline vs pooled bcrypt verification for logins")
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, help="bcrypt cost (defaults to BCRYPT_ROUNDS)")
+    parser.add_argument("--workers", type=int, help="hashing threads (defaults to PASSWORD_HASH_WORKERS)")
+    args = parser.parse_args()
+
+    # Settings are read at import time, so apply overrides first
+    if args.rounds:
+        os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    if args.workers:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+
+    asyncio.run(run(args.logins))
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from typing import Any, Dict
+
+from app.schemas.user import UserRead
+from app.core.dependencies import require_any_role
+from app.core.config import settings
+from app.db.session import engine
+from app.db.pool_metrics import pool_metrics
+
+router = APIRouter(prefix="/admin", tags=["admin-system"])
+
+
+@router.get("/db-pool-stats")
+async def get_db_pool_stats(
+    current_user: UserRead = Depends(require_any_role(["admin", "super_admin"]))
+) -> Dict[str, Any]:
+    """
+    Connection pool usage of the worker process that serves this request.
+    
+    Each gunicorn worker has its own pool, so repeated calls may report
+    different workers; compare them by **pid**.
+    """
+    return {
+        **pool_metrics.snapshot(engine.pool),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout_seconds": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle_seconds": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING
+    }
@@ -2,15 +2,18 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 # from app.api.profile.profile_models import UserRead
 from app.core.security import verify_token
 from app.schemas.user import UserCreate, User, UserRead
 from app.schemas.token import Token, TokenData
-from app.services.auth import hash_password, verify_password, create_access_token
+from app.services.auth import hash_password_async, verify_and_update_password, create_access_token
 from app.db.models import User as UserModel
+from app.db.models.influencer import Influencer
 from app.db.session import get_db
+from app.db.database import get_db_session
+from app.services.principal_cache import principal_cache
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from datetime import timedelta
 import logging
@@ -39,7 +42,7 @@ async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
         new_user = UserModel(
             username=user.username,
             email=user.email,
-            hashed_password=hash_password(user.password),
+            hashed_password=await hash_password_async(user.password),
             first_name="Gbenga",
             last_name="Akinba"
         )
@@ -63,14 +66,21 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
         )
     )
     user = user_result.scalars().first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    valid, new_hash = await verify_and_update_password(form_data.password, user.hashed_password)
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # The bcrypt cost changed since this password was hashed; upgrade it transparently
+        user.hashed_password = new_hash
+        await db.commit()
     access_token = create_access_token(data={"sub": user.username}, expires_delta=timedelta(minutes=30))
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 # Dependency to get the current authenticated user
-async def get_current_user_dependency(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> UserRead:
+async def get_current_user_dependency(token: str = Depends(oauth2_scheme)) -> UserRead:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -81,36 +91,30 @@ async def get_current_user_dependency(token: str = Depends(oauth2_scheme), db: A
     if not username_data or not username_data.username:
         raise credentials_exception
         
-    # Fetch user from database with their roles
-    # Note: We use username from token since that's what we store in the token
-    result = await db.execute(
-        select(UserModel)
-        .options(selectinload(UserModel.roles))
-        .where(UserModel.username == username_data.username)
-    )
-    user = result.scalars().first()
-    if user is None:
-        raise credentials_exception
-    
-    # Check if user has influencer role and get influencer_id
-    influencer_id = None
-    for role in user.roles:
-        if role.name == "influencer":
-            # Fetch the influencer record for this user
-            from app.db.models.influencer import Influencer
-            influencer_result = await db.execute(
-                select(Influencer).where(Influencer.user_id == user.id)
+    async def load_principal() -> UserRead:
+        # The load is shared with concurrent requests for the same user, so it uses its own
+        # session rather than the one belonging to the request that started it
+        async with get_db_session() as session:
+            # Fetch user with their roles and influencer record in one query
+            # Note: We use username from token since that's what we store in the token
+            result = await session.execute(
+                select(UserModel, Influencer.id)
+                .outerjoin(Influencer, Influencer.user_id == UserModel.id)
+                .options(joinedload(UserModel.roles))
+                .where(UserModel.username == username_data.username)
             )
-            influencer = influencer_result.scalars().first()
-            if influencer:
-                influencer_id = influencer.id
-            break
-        
-    logger.info("user ====> %s", user)
-    # Create UserRead with influencer_id
-    user_data = UserRead.from_orm(user)
-    user_data.influencer_id = influencer_id
-    return user_data
+            row = result.unique().first()
+            if row is None:
+                raise credentials_exception
+            user, influencer_id = row
+            
+            # Create UserRead with influencer_id for users with the influencer role
+            user_data = UserRead.from_orm(user)
+            if any(role.name == "influencer" for role in user.roles):
+                user_data.influencer_id = influencer_id
+            return user_data
+    
+    return await principal_cache.get_or_load(username_data.username, load_principal)
 
 # Route to get current user (for API calls)
 @router.post("/user", response_model=UserRead)
@@ -13,7 +13,7 @@ from app.db.models import Business, User
 from app.db.models.country import Country
 from app.core.dependencies import require_role, require_any_role
 from app.db.session import get_db
-from app.services.auth import hash_password
+from app.services.auth import hash_password_async
 from app.core.rate_limiter import business_creation_rate_limit
 
 # Configure logger for this module
@@ -98,7 +98,7 @@ async def create_business_public(
         # Create user (NOT committed yet)
         new_user = User(
             username=business_data.username,
-            hashed_password=hash_password(str(uuid.uuid4())),
+            hashed_password=await hash_password_async(str(uuid.uuid4())),
             first_name=business_data.first_name,
             last_name=business_data.last_name,
             email=business_data.contact_email
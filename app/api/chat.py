@@ -2,7 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from app.services.chat_service import ChatService
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_response_cache import LLMCachePolicy
 from app.api.auth import verify_token
+from app.core.streaming import sse_response
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,6 +14,9 @@ router = APIRouter(prefix="/chat", tags=["chat"])
 
 chat_service = ChatService()
 
+# FAQ-style support questions repeat across users, so near-duplicates share answers
+CHAT_CACHE_POLICY = LLMCachePolicy(namespace="chat", semantic=True)
+
 class ChatMessage(BaseModel):
     message: str
     conversation_history: Optional[List[Dict[str, str]]] = []
@@ -50,7 +56,8 @@ async def send_message(
         response = await chat_service.generate_response(
             message=chat_message.message,
             conversation_history=chat_message.conversation_history,
-            context=context
+            context=context,
+            cache=CHAT_CACHE_POLICY
         )
         
         return ChatResponse(**response)
@@ -62,6 +69,27 @@ async def send_message(
             detail="Failed to process chat message"
         )
 
+@router.post("/message/stream")
+async def stream_message(
+    chat_message: ChatMessage,
+    current_user: dict = Depends(verify_token)
+):
+    """
+    Stream the AI chat assistant's reply as server-sent events
+    """
+    context = chat_message.context or {}
+    context.update({
+        "user_id": current_user.get("id"),
+        "user_type": current_user.get("user_type", "general"),
+        "current_page": context.get("current_page", "contact")
+    })
+    
+    return sse_response(chat_service.stream_response(
+        message=chat_message.message,
+        conversation_history=chat_message.conversation_history,
+        context=context
+    ))
+
 @router.post("/suggestions", response_model=ChatSuggestionsResponse)
 async def get_suggestions(
     request: ChatSuggestionsRequest,
@@ -99,7 +127,8 @@ async def send_message_public(chat_message: ChatMessage):
         response = await chat_service.generate_response(
             message=chat_message.message,
             conversation_history=chat_message.conversation_history,
-            context=context
+            context=context,
+            cache=CHAT_CACHE_POLICY
         )
         
         return ChatResponse(**response)
@@ -110,3 +139,27 @@ async def send_message_public(chat_message: ChatMessage):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to process chat message"
         )
+
+@router.post("/message/public/stream")
+async def stream_message_public(chat_message: ChatMessage):
+    """
+    Stream the AI chat assistant's reply as server-sent events (public endpoint for unauthenticated users)
+    """
+    context = chat_message.context or {}
+    context.update({
+        "user_type": "general",
+        "current_page": context.get("current_page", "contact")
+    })
+    
+    return sse_response(chat_service.stream_response(
+        message=chat_message.message,
+        conversation_history=chat_message.conversation_history,
+        context=context
+    ))
+
+@router.get("/llm-stats")
+async def get_llm_stats(current_user: dict = Depends(verify_token)):
+    """
+    Get LLM gateway concurrency, queue depth and time-to-first-token metrics
+    """
+    return llm_gateway.stats()
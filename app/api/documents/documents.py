@@ -212,7 +212,7 @@ async def generate_document_background(
             }
             
             # Generate document (this is the time-consuming part)
-            file_path = generate_document(template, request.parameters, related_data)
+            file_path = await generate_document(template, request.parameters, related_data)
             
             # Update with success
             doc.file_path = file_path
@@ -327,7 +327,7 @@ Generate a professional, detailed business plan based on this information.Provid
         # Generate the business plan document
         influencer_name = getattr(influencer, 'name', f'Influencer {request.influencer_id}')
         logger.info(f"Generating business plan for influencer '{influencer_name}' (ID: {request.influencer_id}) - {request.product} in {request.industry}")
-        file_path = generate_document(template, parameters, related_data)
+        file_path = await generate_document(template, parameters, related_data)
         
         # Create database record for the generated business plan
         new_doc = GeneratedDocumentModel(
@@ -906,7 +906,7 @@ Generate a professional, personalized collaboration request document based on th
             business_name = getattr(business, 'name', f'Business {request.business_id}')
             influencer_name = getattr(influencer, 'name', f'Influencer {request.influencer_id}')
             logger.info(f"Generating specific collaboration request '{request.campaign_title}' for business '{business_name}' (ID: {request.business_id}) → influencer '{influencer_name}' (ID: {request.influencer_id})")
-            file_path = generate_document(template, parameters, related_data)
+            file_path = await generate_document(template, parameters, related_data)
             
             # Update with success
             doc.file_path = file_path
@@ -1089,7 +1089,7 @@ Generate a professional, comprehensive general collaboration request document ba
             # Generate document
             business_name = getattr(business, 'name', f'Business {request.business_id}')
             logger.info(f"Generating general collaboration request '{request.campaign_title}' for business '{business_name}' (ID: {request.business_id})")
-            file_path = generate_document(template, parameters, related_data)
+            file_path = await generate_document(template, parameters, related_data)
             
             # Update with success
             doc.file_path = file_path
@@ -1265,7 +1265,7 @@ Generate a professional, comprehensive general collaboration request document ba
             # Generate document
             business_name = request.business_profile.get('name', f'Business {request.business_profile.get("id", "N/A")}')
             logger.info(f"Generating public collaboration request '{request.campaign_title}' for business '{business_name}' (ID: {request.business_profile.get('id', 'N/A')})")
-            file_path = generate_document(template, parameters, related_data)
+            file_path = await generate_document(template, parameters, related_data)
             
             # Update with success
             doc.file_path = file_path
@@ -1538,7 +1538,7 @@ Generate a professional, comprehensive market analysis document based on this de
             # Generate document
             business_name = request.business_profile.get('name', f'Business {request.business_profile.get("id", "N/A")}')
             logger.info(f"Generating public market analysis for business '{business_name}' (ID: {request.business_profile.get('id', 'N/A')}) targeting {countries_text}")
-            file_path = generate_document(template, parameters, related_data)
+            file_path = await generate_document(template, parameters, related_data)
             
             # Update with success
             doc.file_path = file_path
@@ -1730,7 +1730,7 @@ Generate a professional, comprehensive 1-month social media plan based on this d
             
             # Generate document
             logger.info(f"Generating public social media plan for influencer '{full_name}' (ID: {document_id})")
-            file_path = generate_document(template, parameters, related_data)
+            file_path = await generate_document(template, parameters, related_data)
             
             # Update with success
             doc.file_path = file_path
@@ -1911,7 +1911,7 @@ Generate a professional, comprehensive business plan based on this detailed fram
             
             # Generate document
             logger.info(f"Generating public business plan for influencer '{full_name}' (ID: {document_id})")
-            file_path = generate_document(template, parameters, related_data)
+            file_path = await generate_document(template, parameters, related_data)
             
             # Update with success
             doc.file_path = file_path
@@ -9,6 +9,7 @@ from datetime import datetime
 from app.core.dependencies import get_db
 from app.services.enhanced_ai_agent_service import EnhancedAIAgentService
 from app.services.ai_agent_service import AIAgentService
+from app.core.streaming import sse_response
 
 router = APIRouter(prefix="/api/enhanced-ai-agents", tags=["Enhanced AI Agents"])
 
@@ -51,6 +52,26 @@ async def execute_agent_with_real_time_data(
         raise HTTPException(status_code=500, detail=f"Failed to execute enhanced agent: {str(e)}")
 
 
+@router.post("/execute-with-real-time-data/stream")
+async def stream_agent_with_real_time_data(
+    request: Dict[str, Any] = Body(...),
+    db: Session = Depends(get_db)
+):
+    """Stream AI agent output with real-time data integration as server-sent events"""
+    agent_id = request.get('agent_id')
+    prompt = request.get('prompt')
+    
+    if not agent_id or not prompt:
+        raise HTTPException(status_code=400, detail="agent_id and prompt are required")
+    
+    return sse_response(enhanced_ai_service.stream_with_real_time_data(
+        agent_id=agent_id,
+        prompt=prompt,
+        context=request.get('context', {}),
+        real_time_data=request.get('real_time_data', {})
+    ))
+
+
 @router.get("/enhanced-recommendations/{user_id}")
 async def get_enhanced_recommendations(
     user_id: int,
@@ -13,7 +13,8 @@ from app.db.models.country import Country
 from app.core.dependencies import require_role, require_any_role
 from app.services.role_management import RoleManagementService
 from app.db.session import get_db
-from app.services.auth import hash_password
+from app.services.auth import hash_password_async
+from app.services.principal_cache import principal_cache
 from app.core.rate_limiter import create_rate_limit_dependency
 from typing import List
 
@@ -79,7 +80,8 @@ async def create_influencer(influencer_data: InfluencerCreate, db: AsyncSession
 influencer_creation_rate_limit = create_rate_limit_dependency(
     max_requests=3,
     window_hours=1,
-    error_message="You have exceeded the limit of 3 influencer profile creation requests per hour. Please try again later."
+    error_message="You have exceeded the limit of 3 influencer profile creation requests per hour. Please try again later.",
+    scope="influencer_creation"
 )
 
 @public_router.post("/create_public", response_model=InfluencerRead, status_code=status.HTTP_201_CREATED)
@@ -146,7 +148,7 @@ async def create_influencer_public(
         # Create user (NOT committed yet)
         new_user = User(
             username=influencer_data.username,
-            hashed_password=hash_password(str(uuid.uuid4())),
+            hashed_password=await hash_password_async(str(uuid.uuid4())),
             first_name=influencer_data.first_name,
             last_name=influencer_data.last_name,
             email=influencer_data.email
@@ -344,12 +346,18 @@ async def update_influencer(influencer_id: int, influencer_data: InfluencerUpdat
 
 @router.delete("/remove_influencer/{influencer_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_role("admin"))])
 async def delete_influencer(influencer_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Influencer).where(Influencer.id == influencer_id))
+    result = await db.execute(
+        select(Influencer).options(selectinload(Influencer.user)).where(Influencer.id == influencer_id)
+    )
     influencer = result.scalars().first()
     if not influencer:
         raise HTTPException(status_code=404, detail="Influencer not found")
+    owner = influencer.user
     await db.delete(influencer)
     await db.commit()
+    # The owner's cached principal still carries this influencer_id
+    if owner is not None:
+        await principal_cache.invalidate_user(owner.id, owner.username)
 
 
 @router.get("/list", response_model=List[InfluencerRead])
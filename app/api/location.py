@@ -1,15 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.dependencies import get_db, get_current_user, get_geocoding_service, get_influencer_location_service, get_business_location_service
+from app.core.dependencies import get_db, get_current_user, get_geocoding_service, get_bulk_geocoding_service, get_influencer_location_service, get_business_location_service
+from app.core.streaming import sse_response
+from app.services.geocoding.bulk_geocoding_service import BulkGeocodingService
 from app.services.location.influencer_location_service import InfluencerLocationService
 from app.services.location.business_location_service import BusinessLocationService
 from app.services.geocoding.geocoding_service_factory import GeocodingServiceFactory
 from app.schemas.location import *
 from app.core.exceptions import AuthorizationError, NotFoundError, DuplicateLocationError
+from app.core.rate_limiter import create_rate_limit_dependency
 
 router = APIRouter()
 
+# Bulk geocoding queues behind the shared provider throttle, so cap each user's batches
+bulk_geocode_rate_limit = create_rate_limit_dependency(
+    max_requests=10,
+    window_hours=1,
+    error_message="You have exceeded the limit of 10 bulk geocoding requests per hour. Please try again later.",
+    scope="bulk_geocode",
+    key_by="user"
+)
+
 @router.post("/geocode", response_model=dict)
 async def geocode_address(
     request: GeocodeRequest,
@@ -21,6 +33,23 @@ async def geocode_address(
         raise HTTPException(status_code=404, detail="Address not found")
     return result
 
+@router.post("/geocode/bulk")
+async def bulk_geocode_addresses(
+    request: BulkGeocodeRequest,
+    current_user = Depends(get_current_user),
+    bulk_geocoding_service: BulkGeocodingService = Depends(get_bulk_geocoding_service),
+    _: bool = Depends(bulk_geocode_rate_limit)
+):
+    """Geocode many addresses, streaming each result as server-sent events as it resolves.
+
+    Every "result" event carries the indexes of the request addresses it answers;
+    a final "done" event summarizes the batch. Requires authentication and is
+    rate limited to 10 requests per hour per user.
+    """
+    return sse_response(bulk_geocoding_service.geocode_stream(
+        [(item.address, item.country_code) for item in request.addresses]
+    ))
+
 @router.post("/reverse-geocode", response_model=dict)
 async def reverse_geocode(
     request: ReverseGeocodeRequest,
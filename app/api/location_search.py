@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from app.core.config import settings
 from app.core.dependencies import get_db, get_current_user, get_location_search_service
 from app.services.location.location_search_service import LocationSearchService
+from app.services.location.geo_grid_cache import get_geo_grid_stats
 
 router = APIRouter()
 
@@ -14,13 +16,14 @@ async def find_influencers_nearby(
     category: Optional[str] = Query(None),
     min_followers: Optional[int] = Query(None, ge=0),
     max_rate: Optional[float] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     search_service: LocationSearchService = Depends(get_location_search_service)
 ):
     """Find influencers within specified radius"""
     try:
         return await search_service.find_influencers_nearby(
-            db, latitude, longitude, radius_km, category, min_followers, max_rate
+            db, latitude, longitude, radius_km, category, min_followers, max_rate, limit
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -32,13 +35,14 @@ async def find_businesses_nearby(
     radius_km: float = Query(50, ge=1, le=500),
     industry: Optional[str] = Query(None),
     verified_only: bool = Query(False),
+    limit: Optional[int] = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     search_service: LocationSearchService = Depends(get_location_search_service)
 ):
     """Find businesses within specified radius"""
     try:
         return await search_service.find_businesses_nearby(
-            db, latitude, longitude, radius_km, industry, verified_only
+            db, latitude, longitude, radius_km, industry, verified_only, limit
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -50,13 +54,19 @@ async def find_promotions_nearby(
     radius_km: float = Query(100, ge=1, le=1000),
     min_budget: Optional[float] = Query(None, ge=0),
     max_budget: Optional[float] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     search_service: LocationSearchService = Depends(get_location_search_service)
 ):
     """Find promotion requests within specified radius"""
     try:
         return await search_service.find_promotion_requests_nearby(
-            db, latitude, longitude, radius_km, min_budget, max_budget
+            db, latitude, longitude, radius_km, min_budget, max_budget, limit
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.get("/nearby/cache-stats")
+async def get_nearby_cache_stats(current_user = Depends(get_current_user)):
+    """Hit/miss and staleness stats for the in-memory location grid caches"""
+    return {"enabled": settings.LOCATION_GRID_CACHE_ENABLED, "grids": get_geo_grid_stats()}
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+from app.core.cache import get_cache_stats
 from app.core.dependencies import get_db
 from app.services.analytics.real_time_analytics import RealTimeAnalyticsService
 from app.services.influencer_marketing.influencer_marketing_service import InfluencerMarketingService
@@ -50,7 +51,8 @@ async def get_engagement_trends(
                 "average_engagement_rate": sum(t.engagement_rate for t in trends) / len(trends) if trends else 0,
                 "total_followers": sum(t.followers for t in trends),
                 "last_updated": datetime.now().isoformat()
-            }
+            },
+            "data_sources": analytics_service.get_last_source_report()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get engagement trends: {str(e)}")
@@ -85,7 +87,8 @@ async def get_market_rates(
                 "average_min_rate": sum(r.rate_range["min"] for r in rates) / len(rates) if rates else 0,
                 "average_max_rate": sum(r.rate_range["max"] for r in rates) / len(rates) if rates else 0,
                 "last_updated": datetime.now().isoformat()
-            }
+            },
+            "data_sources": analytics_service.get_last_source_report()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get market rates: {str(e)}")
@@ -122,7 +125,8 @@ async def get_competitor_analysis(
                 "average_engagement_rate": sum(c.engagement_rate for c in analysis) / len(analysis) if analysis else 0,
                 "average_followers": sum(c.followers for c in analysis) / len(analysis) if analysis else 0,
                 "last_updated": datetime.now().isoformat()
-            }
+            },
+            "data_sources": analytics_service.get_last_source_report()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get competitor analysis: {str(e)}")
@@ -162,7 +166,8 @@ async def get_trending_content(
                 "average_engagement_rate": sum(t.engagement_rate for t in trending) / len(trending) if trending else 0,
                 "average_trend_score": sum(t.trend_score for t in trending) / len(trending) if trending else 0,
                 "last_updated": datetime.now().isoformat()
-            }
+            },
+            "data_sources": analytics_service.get_last_source_report()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get trending content: {str(e)}")
@@ -267,3 +272,12 @@ async def get_analytics_summary(
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get analytics summary: {str(e)}")
+
+
+@router.get("/cache-stats")
+async def get_cache_stats_endpoint() -> Dict[str, Any]:
+    """Get hit, miss, eviction and size counters for every cache namespace"""
+    return {
+        "namespaces": get_cache_stats(),
+        "generated_at": datetime.now().isoformat()
+    }
@@ -2,10 +2,13 @@
 Web Search API endpoints for testing DuckDuckGo functionality
 """
 
+import asyncio
+import time
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
 from app.core.dependencies import get_db
 from app.services.web_search.web_search_factory import WebSearchFactory
 from app.core.config import settings
@@ -190,11 +193,62 @@ async def custom_search(
         raise HTTPException(status_code=500, detail=f"Failed to perform custom search: {str(e)}")
 
 
+def _normalize_url(url: str) -> str:
+    """Key used to spot the same page returned by several queries"""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+async def _run_batch_query(
+    search_service: Any,
+    semaphore: asyncio.Semaphore,
+    query: str,
+    search_type: str
+) -> Dict[str, Any]:
+    """Run one query of a batch, reporting its failure instead of failing the batch"""
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            results = await search_service.search(query, max_results=5)
+            error = None
+        except Exception as e:
+            # e.g. the provider's daily rate limit from _check_rate_limit
+            results = []
+            error = str(e)
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    structured_results = []
+    for result in results:
+        structured_results.append({
+            "title": getattr(result, "title", ""),
+            "url": getattr(result, "url", ""),
+            "snippet": getattr(result, "snippet", ""),
+            "source": getattr(result, "source", "N/A"),
+            "search_type": search_type
+        })
+
+    query_result = {
+        "query": query,
+        "search_type": search_type,
+        "results": structured_results,
+        "total_results": len(structured_results),
+        "duration_ms": duration_ms
+    }
+    if error:
+        query_result["error"] = error
+    return query_result
+
+
 @router.post("/batch-search")
 async def batch_search(
     request: Dict[str, Any] = Body(...)
 ) -> Dict[str, Any]:
-    """Perform multiple web searches in batch"""
+    """Perform multiple web searches concurrently, deduplicating URLs across queries.
+
+    At most WEB_SEARCH_BATCH_CONCURRENCY searches run at once. A URL returned by
+    several queries is kept only in the first query of the request that found it.
+    """
     try:
         if not settings.WEB_SEARCH_ENABLED:
             raise HTTPException(status_code=400, detail="Web search is disabled")
@@ -206,40 +260,51 @@ async def batch_search(
         # Create search service
         search_service = web_search_factory.create_search_service()
         
-        batch_results = []
+        batch_started = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, settings.WEB_SEARCH_BATCH_CONCURRENCY))
         
         async with search_service:
-            for query_data in queries:
-                query = query_data.get("query", "")
-                search_type = query_data.get("search_type", "general")
-                
-                if query:
-                    results = await search_service.search(query, max_results=5)
-                    
-                    structured_results = []
-                    for result in results:
-                        structured_results.append({
-                            "title": getattr(result, "title", ""),
-                            "url": getattr(result, "url", ""),
-                            "snippet": getattr(result, "snippet", ""),
-                            "source": getattr(result, "source", "N/A"),
-                            "search_type": search_type
-                        })
-                    
-                    batch_results.append({
-                        "query": query,
-                        "search_type": search_type,
-                        "results": structured_results,
-                        "total_results": len(structured_results)
-                    })
+            batch_results = await asyncio.gather(*[
+                _run_batch_query(
+                    search_service,
+                    semaphore,
+                    query_data.get("query", ""),
+                    query_data.get("search_type", "general")
+                )
+                for query_data in queries
+                if query_data.get("query", "")
+            ])
+        
+        # gather keeps request order, so the first query to find a URL keeps it
+        seen_urls = set()
+        duplicates_removed = 0
+        for query_result in batch_results:
+            unique_results = []
+            for result in query_result["results"]:
+                key = _normalize_url(result["url"]) if result["url"] else None
+                if key in seen_urls:
+                    continue
+                if key:
+                    seen_urls.add(key)
+                unique_results.append(result)
+            query_result["duplicates_removed"] = len(query_result["results"]) - len(unique_results)
+            query_result["results"] = unique_results
+            query_result["total_results"] = len(unique_results)
+            duplicates_removed += query_result["duplicates_removed"]
         
         return {
             "batch_results": batch_results,
             "total_queries": len(queries),
+            "unique_urls": len(seen_urls),
+            "duplicates_removed": duplicates_removed,
+            "concurrency": settings.WEB_SEARCH_BATCH_CONCURRENCY,
+            "total_duration_ms": round((time.perf_counter() - batch_started) * 1000, 1),
             "search_engine": settings.WEB_SEARCH_ENGINE,
             "timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to perform batch search: {str(e)}")
 
@@ -0,0 +1,428 @@
+"""
+Namespaced TTL/LRU caches with request coalescing and an optional shared backend
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Interface for a store shared between worker processes"""
+
+    name: str = "base"
+    # Key for the HMAC that TTLCache puts on every payload it stores here
+    signing_key: bytes = b""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the stored payload, or None when absent or expired"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, payload: bytes, ttl_seconds: float) -> None:
+        """Store payload, expiring it after ttl_seconds"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self, prefix: str) -> None:
+        """Delete every key starting with prefix"""
+        pass
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared backend on a Redis server, using the optional redis package"""
+
+    name = "redis"
+
+    def __init__(self, url: str, signing_key: bytes):
+        if not signing_key:
+            raise Exception("CACHE_SIGNING_KEY (or SECRET_KEY) must be set to use a shared cache backend")
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            raise Exception("Redis library not installed. Install with: pip install redis")
+        self.url = url
+        self.signing_key = signing_key
+        self._client = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, payload: bytes, ttl_seconds: float) -> None:
+        await self._client.set(key, payload, px=max(int(ttl_seconds * 1000), 1))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def clear(self, prefix: str) -> None:
+        async for key in self._client.scan_iter(match=f"{prefix}*"):
+            await self._client.delete(key)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    stale_until: float
+    size: int
+
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.monotonic()
+
+
+class TTLCache:
+    """Single responsibility: Cache values for one namespace in memory.
+
+    Entries expire after their TTL on the monotonic clock and the least recently
+    used entry is evicted once max_entries is reached. get_or_set() runs one
+    loader per key at a time; concurrent callers missing the same key wait for
+    that load instead of starting their own. With stale_seconds, an expired
+    value keeps being served for that long while a background load replaces it.
+    With a backend, entries are also written to and read from the shared store
+    so every worker sees them, keeping the TTL and stale window they were
+    written with. Those payloads are signed with the backend's
+    signing key and any that fail verification are discarded unread, so a
+    writable store is not enough to get code unpickled in a worker.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int,
+        default_ttl_seconds: float,
+        backend: Optional[CacheBackend] = None
+    ):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.backend = backend
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._bytes = 0
+        self._stats = {
+            "hits": 0, "stale_hits": 0, "backend_hits": 0, "misses": 0, "coalesced": 0,
+            "refreshes": 0, "refresh_errors": 0, "evictions": 0, "expirations": 0, "backend_errors": 0,
+            "backend_rejected": 0
+        }
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        entry = await self._lookup(key)
+        if entry is None or not entry.is_fresh():
+            self._stats["misses"] += 1
+            return default
+        self._stats["hits"] += 1
+        return entry.value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        stale_seconds: float = 0
+    ) -> None:
+        ttl = ttl_seconds or self.default_ttl_seconds
+        payload = self._serialize(value)
+        self._store_local(key, value, ttl, stale_seconds, len(payload) if payload is not None else 0)
+        if self.backend is not None and payload is not None:
+            fresh_until = time.time() + ttl
+            backend_key = self._backend_key(key)
+            try:
+                await self.backend.set(
+                    backend_key,
+                    self._sign(
+                        backend_key,
+                        pickle.dumps((fresh_until, stale_seconds, payload), protocol=pickle.HIGHEST_PROTOCOL)
+                    ),
+                    ttl + stale_seconds
+                )
+            except Exception as e:
+                self._stats["backend_errors"] += 1
+                logger.warning(f"TTLCache[{self.namespace}]: Backend write failed for '{key}': {e}")
+
+    async def delete(self, key: str) -> None:
+        self._drop(key)
+        if self.backend is not None:
+            try:
+                await self.backend.delete(self._backend_key(key))
+            except Exception as e:
+                self._stats["backend_errors"] += 1
+                logger.warning(f"TTLCache[{self.namespace}]: Backend delete failed for '{key}': {e}")
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        if self.backend is not None:
+            try:
+                await self.backend.clear(self._backend_key(""))
+            except Exception as e:
+                self._stats["backend_errors"] += 1
+                logger.warning(f"TTLCache[{self.namespace}]: Backend clear failed: {e}")
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None,
+        stale_seconds: float = 0
+    ) -> Any:
+        """Return the cached value for key, loading and caching it on a miss.
+
+        Loader errors are raised to every waiting caller and nothing is cached.
+        """
+        entry = await self._lookup(key)
+        if entry is not None:
+            if entry.is_fresh():
+                self._stats["hits"] += 1
+                return entry.value
+            # Only entries stored with a stale window outlive their TTL
+            self._stats["stale_hits"] += 1
+            if key not in self._in_flight:
+                self._refresh_in_background(key, loader, ttl_seconds, stale_seconds)
+            return entry.value
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._stats["coalesced"] += 1
+            try:
+                # shield() so a cancelled waiter does not cancel the shared load
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The load was cancelled together with the caller that started it
+                return await self.get_or_set(key, loader, ttl_seconds, stale_seconds)
+
+        self._stats["misses"] += 1
+        return await self._load(key, self._claim(key), loader, ttl_seconds, stale_seconds)
+
+    async def refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None,
+        stale_seconds: float = 0,
+        min_remaining_seconds: float = 0
+    ) -> bool:
+        """Load key again unless its entry stays fresh for min_remaining_seconds.
+
+        Used to warm entries ahead of expiry. Returns whether a load ran.
+        """
+        entry = await self._lookup(key)
+        if entry is not None and entry.expires_at - time.monotonic() > min_remaining_seconds:
+            return False
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            await asyncio.shield(pending)
+            return False
+        self._stats["refreshes"] += 1
+        await self._load(key, self._claim(key), loader, ttl_seconds, stale_seconds)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        served = self._stats["hits"] + self._stats["stale_hits"]
+        lookups = served + self._stats["misses"]
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "default_ttl_seconds": self.default_ttl_seconds,
+            "backend": self.backend.name if self.backend is not None else None,
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0
+        }
+
+    def _claim(self, key: str) -> asyncio.Future:
+        """Register the in-flight load for key that concurrent callers will wait on"""
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        return future
+
+    async def _load(
+        self,
+        key: str,
+        future: asyncio.Future,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float],
+        stale_seconds: float
+    ) -> Any:
+        """Run loader for the load claimed as future and cache its result"""
+        try:
+            value = await loader()
+            await self.set(key, value, ttl_seconds, stale_seconds)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved when nobody else was waiting
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float],
+        stale_seconds: float
+    ) -> None:
+        # Claimed before the task starts so callers arriving meanwhile do not start another
+        future = self._claim(key)
+
+        async def refresh():
+            self._stats["refreshes"] += 1
+            try:
+                await self._load(key, future, loader, ttl_seconds, stale_seconds)
+            except Exception as e:
+                # The stale value keeps being served until its window closes
+                self._stats["refresh_errors"] += 1
+                logger.warning(f"TTLCache[{self.namespace}]: Background refresh failed for '{key}': {e}")
+
+        task = asyncio.create_task(refresh())
+        # Hold a reference so the task is not garbage collected mid-refresh
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _lookup(self, key: str) -> Optional[_Entry]:
+        """Live entry for key, fresh or within its stale window"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.stale_until > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry
+            self._stats["expirations"] += 1
+            self._drop(key)
+
+        if self.backend is None:
+            return None
+        backend_key = self._backend_key(key)
+        try:
+            stored = await self.backend.get(backend_key)
+        except Exception as e:
+            self._stats["backend_errors"] += 1
+            logger.warning(f"TTLCache[{self.namespace}]: Backend read failed for '{key}': {e}")
+            return None
+        if stored is None:
+            return None
+
+        body = self._verify(backend_key, stored)
+        if body is None:
+            self._stats["backend_rejected"] += 1
+            logger.warning(f"TTLCache[{self.namespace}]: Discarding backend entry for '{key}' with an invalid signature")
+            return None
+
+        fresh_until, stale_seconds, payload = pickle.loads(body)
+        # Translate the wall-clock expiry from the worker that wrote it to this worker's monotonic clock;
+        # entries written without a stale window are never served past fresh_until
+        remaining = fresh_until - time.time()
+        if remaining + stale_seconds <= 0:
+            return None
+        self._stats["backend_hits"] += 1
+        return self._store_local(key, pickle.loads(payload), remaining, stale_seconds, len(payload))
+
+    def _store_local(self, key: str, value: Any, ttl_seconds: float, stale_seconds: float, size: int) -> _Entry:
+        self._drop(key)
+        expires_at = time.monotonic() + ttl_seconds
+        entry = self._entries[key] = _Entry(
+            value=value,
+            expires_at=expires_at,
+            stale_until=expires_at + max(stale_seconds, 0),
+            size=size
+        )
+        self._bytes += size
+        while len(self._entries) > self.max_entries:
+            self._stats["evictions"] += 1
+            self._drop(next(iter(self._entries)))
+        return entry
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _serialize(self, value: Any) -> Optional[bytes]:
+        """Pickled value, used for the backend and the byte count"""
+        try:
+            return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"TTLCache[{self.namespace}]: Value for this namespace cannot be pickled: {e}")
+            return None
+
+    def _backend_key(self, key: str) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:{self.namespace}:{key}"
+
+    def _sign(self, backend_key: str, body: bytes) -> bytes:
+        """Prefix body with an HMAC over the key and body, so entries cannot be forged or moved between keys"""
+        return self._signature(backend_key, body) + body
+
+    def _verify(self, backend_key: str, stored: bytes) -> Optional[bytes]:
+        """Body of a signed backend entry, or None when its signature does not match"""
+        signature, body = stored[:_SIGNATURE_SIZE], stored[_SIGNATURE_SIZE:]
+        if not hmac.compare_digest(signature, self._signature(backend_key, body)):
+            return None
+        return body
+
+    def _signature(self, backend_key: str, body: bytes) -> bytes:
+        return hmac.new(self.backend.signing_key, backend_key.encode("utf-8") + b"\0" + body, hashlib.sha256).digest()
+
+
+# Length of the HMAC-SHA256 prefix on backend entries
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+_caches: Dict[str, TTLCache] = {}
+_backend: Optional[CacheBackend] = None
+_backend_initialized = False
+
+
+def _shared_backend() -> Optional[CacheBackend]:
+    global _backend, _backend_initialized
+    if not _backend_initialized:
+        _backend_initialized = True
+        if settings.CACHE_BACKEND_URL:
+            try:
+                _backend = RedisCacheBackend(
+                    settings.CACHE_BACKEND_URL,
+                    (settings.CACHE_SIGNING_KEY or settings.SECRET_KEY or "").encode("utf-8")
+                )
+                logger.info(f"Cache: Using shared {_backend.name} backend")
+            except Exception as e:
+                logger.error(f"Cache: Shared backend unavailable, caching per process only: {e}")
+    return _backend
+
+
+def get_cache(namespace: str, ttl_seconds: float, max_entries: Optional[int] = None) -> TTLCache:
+    """Return the process-wide cache for namespace, creating it on first use"""
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = _caches[namespace] = TTLCache(
+            namespace=namespace,
+            max_entries=max_entries or settings.CACHE_DEFAULT_MAX_ENTRIES,
+            default_ttl_seconds=ttl_seconds,
+            backend=_shared_backend()
+        )
+    return cache
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {namespace: cache.stats() for namespace, cache in _caches.items()}
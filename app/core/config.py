@@ -13,11 +13,24 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))  # existing hashes are upgraded on login
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "60"))  # 0 disables
     STRIPE_API_KEY: str = os.getenv("STRIPE_API_KEY")
     STRIPE_WEBHOOK_SECRET: str = os.getenv("STRIPE_WEBHOOK_SECRET")
     OLLAMA_HOST: str = "http://localhost:11434"
     DOC_STORAGE_PATH: str = "app/static/docs/"
     
+    # Database Engine Settings (pool sizes are per worker process)
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # 0 disables
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "100"))  # asyncpg only
+    
     # AI Agent Configuration
     AI_AGENTS_ENABLED: bool = os.getenv("AI_AGENTS_ENABLED", "true").lower() == "true"
     AI_AGENT_TOOL_CALLING_ENABLED: bool = os.getenv("AI_AGENT_TOOL_CALLING_ENABLED", "true").lower() == "true"
@@ -25,6 +38,8 @@ class Settings(BaseSettings):
     AI_AGENT_MAX_TOKENS: int = int(os.getenv("AI_AGENT_MAX_TOKENS", "2000"))
     AI_AGENT_TEMPERATURE: float = float(os.getenv("AI_AGENT_TEMPERATURE", "0.7"))
     AI_AGENT_TOP_P: float = float(os.getenv("AI_AGENT_TOP_P", "0.9"))
+    AI_AGENT_MAX_PARALLEL_AGENTS: int = int(os.getenv("AI_AGENT_MAX_PARALLEL_AGENTS", "4"))
+    AI_AGENT_TASK_TIMEOUT_SECONDS: float = float(os.getenv("AI_AGENT_TASK_TIMEOUT_SECONDS", "180"))
     
     # AI Agent Orchestration Configuration
     AI_AGENT_ORCHESTRATION_MODE: str = os.getenv("AI_AGENT_ORCHESTRATION_MODE", "llm")  # "llm", "database", "hybrid"
@@ -71,9 +86,14 @@ class Settings(BaseSettings):
     WEB_SEARCH_ENABLED: bool = os.getenv("WEB_SEARCH_ENABLED", "false").lower() == "true"
     WEB_SEARCH_API_KEY: str = os.getenv("WEB_SEARCH_API_KEY", "")
     WEB_SEARCH_ENGINE: str = os.getenv("WEB_SEARCH_ENGINE", "duckduckgo")  # google, bing, duckduckgo
+    WEB_SEARCH_BATCH_CONCURRENCY: int = int(os.getenv("WEB_SEARCH_BATCH_CONCURRENCY", "4"))
+    WEB_SEARCH_CACHE_TTL_SECONDS: int = int(os.getenv("WEB_SEARCH_CACHE_TTL_SECONDS", "900"))
+    DUCKDUCKGO_RACE_SOURCES: bool = os.getenv("DUCKDUCKGO_RACE_SOURCES", "false").lower() == "true"
     
     # Notification System Settings
     NOTIFICATIONS_ENABLED: bool = os.getenv("NOTIFICATIONS_ENABLED", "true").lower() == "true"
+    NOTIFICATION_BULK_CHUNK_SIZE: int = int(os.getenv("NOTIFICATION_BULK_CHUNK_SIZE", "1000"))  # rows per multi-row INSERT / delivery batch
+    NOTIFICATION_DELIVERY_CONCURRENCY: int = int(os.getenv("NOTIFICATION_DELIVERY_CONCURRENCY", "10"))  # emails sent at once by a batch job
     
     # Email Settings
     EMAIL_NOTIFICATIONS_ENABLED: bool = os.getenv("EMAIL_NOTIFICATIONS_ENABLED", "true").lower() == "true"
@@ -105,12 +125,54 @@ class Settings(BaseSettings):
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "deepseek-r1:1.5b")
     OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL")
     
+    # LLM Gateway Settings
+    LLM_MAX_CONCURRENCY_PER_MODEL: int = int(os.getenv("LLM_MAX_CONCURRENCY_PER_MODEL", "2"))
+    LLM_MAX_QUEUE_DEPTH: int = int(os.getenv("LLM_MAX_QUEUE_DEPTH", "50"))
+    LLM_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("LLM_QUEUE_TIMEOUT_SECONDS", "60"))
+    LLM_REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "300"))
+    LLM_RESPONSE_CACHE_ENABLED: bool = os.getenv("LLM_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", "3600"))
+    LLM_RESPONSE_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("LLM_RESPONSE_CACHE_SIMILARITY_THRESHOLD", "0.95"))
+    LLM_RESPONSE_CACHE_EMBEDDING_DIM: int = int(os.getenv("LLM_RESPONSE_CACHE_EMBEDDING_DIM", "768"))
+    
+    # Embedding / Vector Database Settings
+    EMBEDDING_PROVIDER: str = os.getenv("EMBEDDING_PROVIDER", "ollama")  # ollama, hashing
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "nomic-embed-text")
+    EMBEDDING_CACHE_SIZE: int = int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+    EMBEDDING_FALLBACK_RETRY_SECONDS: float = float(os.getenv("EMBEDDING_FALLBACK_RETRY_SECONDS", "30"))  # hashing fallback window after an Ollama failure
+    VECTOR_DB_USER_CONVERSATIONS_DIM: int = int(os.getenv("VECTOR_DB_USER_CONVERSATIONS_DIM", "768"))
+    VECTOR_DB_AGENT_CONTEXTS_DIM: int = int(os.getenv("VECTOR_DB_AGENT_CONTEXTS_DIM", "768"))
+    VECTOR_DB_URL: str = os.getenv("VECTOR_DB_URL", "")  # Qdrant server shared by all workers
+    VECTOR_DB_API_KEY: str = os.getenv("VECTOR_DB_API_KEY", "")
+    VECTOR_DB_PATH: str = os.getenv("VECTOR_DB_PATH", "data/qdrant")  # on-disk store when no server URL is set
+    VECTOR_DB_UPSERT_CHUNK_SIZE: int = int(os.getenv("VECTOR_DB_UPSERT_CHUNK_SIZE", "128"))
+    
+    # Shared Cache Settings
+    CACHE_DEFAULT_MAX_ENTRIES: int = int(os.getenv("CACHE_DEFAULT_MAX_ENTRIES", "1000"))
+    CACHE_BACKEND_URL: str = os.getenv("CACHE_BACKEND_URL", "")  # e.g. redis://localhost:6379/0; empty caches per process
+    CACHE_KEY_PREFIX: str = os.getenv("CACHE_KEY_PREFIX", "viral_together")
+    CACHE_SIGNING_KEY: str = os.getenv("CACHE_SIGNING_KEY", "")  # HMAC key for shared backend entries; defaults to SECRET_KEY
+    
+    # API Rate Limit Settings
+    RATE_LIMIT_STORAGE_URL: str = os.getenv("RATE_LIMIT_STORAGE_URL", "sqlite:///data/rate_limits.db")  # memory://, sqlite:///path or redis://host
+    RATE_LIMIT_MAX_KEYS: int = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))  # memory:// only
+    RATE_LIMIT_SWEEP_INTERVAL_SECONDS: float = float(os.getenv("RATE_LIMIT_SWEEP_INTERVAL_SECONDS", "300"))  # sqlite only
+    
     # WebSocket Settings
     WEBSOCKET_ENABLED: bool = os.getenv("WEBSOCKET_ENABLED", "true").lower() == "true"
     
     # Enhanced AI Agent Settings
     ENHANCED_AI_AGENTS_ENABLED: bool = os.getenv("ENHANCED_AI_AGENTS_ENABLED", "true").lower() == "true"
     REAL_TIME_DATA_CACHE_TTL: int = int(os.getenv("REAL_TIME_DATA_CACHE_TTL", "300"))  # 5 minutes
+    ANALYTICS_SOURCE_TIMEOUT_SECONDS: float = float(os.getenv("ANALYTICS_SOURCE_TIMEOUT_SECONDS", "8"))
+    ANALYTICS_SOURCE_HEDGE_SECONDS: float = float(os.getenv("ANALYTICS_SOURCE_HEDGE_SECONDS", "1.5"))
+    ANALYTICS_STALE_WHILE_REVALIDATE_SECONDS: int = int(os.getenv("ANALYTICS_STALE_WHILE_REVALIDATE_SECONDS", "1800"))
+    ANALYTICS_PREWARM_ENABLED: bool = os.getenv("ANALYTICS_PREWARM_ENABLED", "true").lower() == "true"
+    ANALYTICS_PREWARM_INTERVAL_SECONDS: int = int(os.getenv("ANALYTICS_PREWARM_INTERVAL_SECONDS", "240"))
+    ANALYTICS_PREWARM_LOCK_FILE: str = os.getenv("ANALYTICS_PREWARM_LOCK_FILE", "data/analytics_prewarm.lock")  # one worker per host holds it
+    ANALYTICS_PREWARM_PLATFORMS: str = os.getenv("ANALYTICS_PREWARM_PLATFORMS", "instagram,tiktok,youtube,twitter")  # comma-separated
+    ANALYTICS_PREWARM_CONTENT_TYPES: str = os.getenv("ANALYTICS_PREWARM_CONTENT_TYPES", "sponsored_post")  # comma-separated
     MAX_CONCURRENT_AGENT_REQUESTS: int = int(os.getenv("MAX_CONCURRENT_AGENT_REQUESTS", "10"))
     
     # Social Media API Settings
@@ -124,6 +186,18 @@ class Settings(BaseSettings):
     TIKTOK_CLIENT_KEY: str = os.getenv("TIKTOK_CLIENT_KEY", "")
     TIKTOK_CLIENT_SECRET: str = os.getenv("TIKTOK_CLIENT_SECRET", "")
     
+    # Social Media HTTP Connection Pool Settings (one pool per platform)
+    SOCIAL_MEDIA_HTTP_MAX_CONNECTIONS: int = int(os.getenv("SOCIAL_MEDIA_HTTP_MAX_CONNECTIONS", "100"))
+    SOCIAL_MEDIA_HTTP_MAX_CONNECTIONS_PER_HOST: int = int(os.getenv("SOCIAL_MEDIA_HTTP_MAX_CONNECTIONS_PER_HOST", "20"))
+    SOCIAL_MEDIA_HTTP_KEEPALIVE_SECONDS: float = float(os.getenv("SOCIAL_MEDIA_HTTP_KEEPALIVE_SECONDS", "30"))
+    SOCIAL_MEDIA_HTTP_DNS_CACHE_SECONDS: int = int(os.getenv("SOCIAL_MEDIA_HTTP_DNS_CACHE_SECONDS", "300"))
+    SOCIAL_MEDIA_HTTP_TIMEOUT_SECONDS: float = float(os.getenv("SOCIAL_MEDIA_HTTP_TIMEOUT_SECONDS", "30"))
+    SOCIAL_MEDIA_RATE_LIMIT_BURST: int = int(os.getenv("SOCIAL_MEDIA_RATE_LIMIT_BURST", "10"))
+    SOCIAL_MEDIA_RATE_LIMIT_MAX_WAIT_SECONDS: float = float(os.getenv("SOCIAL_MEDIA_RATE_LIMIT_MAX_WAIT_SECONDS", "30"))
+    SOCIAL_MEDIA_MAX_RETRIES: int = int(os.getenv("SOCIAL_MEDIA_MAX_RETRIES", "3"))
+    SOCIAL_MEDIA_BACKOFF_BASE_SECONDS: float = float(os.getenv("SOCIAL_MEDIA_BACKOFF_BASE_SECONDS", "1"))
+    SOCIAL_MEDIA_BACKOFF_MAX_SECONDS: float = float(os.getenv("SOCIAL_MEDIA_BACKOFF_MAX_SECONDS", "30"))
+    
     # 3rd Party Analytics API Keys
     SOCIALBLADE_API_KEY: str = os.getenv("SOCIALBLADE_API_KEY", "")
     HOOTSUITE_API_KEY: str = os.getenv("HOOTSUITE_API_KEY", "")
@@ -141,10 +215,23 @@ class Settings(BaseSettings):
     LOCATION_SERVICE_PROVIDER: str = os.getenv("LOCATION_SERVICE_PROVIDER", "openstreetmap")  # openstreetmap, google
     DEFAULT_SEARCH_RADIUS_KM: int = int(os.getenv("DEFAULT_SEARCH_RADIUS_KM", "50"))
     MAX_SEARCH_RADIUS_KM: int = int(os.getenv("MAX_SEARCH_RADIUS_KM", "500"))
+    LOCATION_GRID_CACHE_ENABLED: bool = os.getenv("LOCATION_GRID_CACHE_ENABLED", "true").lower() == "true"
+    LOCATION_GRID_CELL_SIZE_DEG: float = float(os.getenv("LOCATION_GRID_CELL_SIZE_DEG", "0.5"))
+    LOCATION_GRID_CACHE_MAX_AGE_SECONDS: int = int(os.getenv("LOCATION_GRID_CACHE_MAX_AGE_SECONDS", "300"))  # full reload interval
     
     # OpenStreetMap Settings
     OSM_USER_AGENT: str = os.getenv("OSM_USER_AGENT", "ViralTogether/1.0")
     OSM_BASE_URL: str = os.getenv("OSM_BASE_URL", "https://nominatim.openstreetmap.org")
+    NOMINATIM_REQUESTS_PER_SECOND: float = float(os.getenv("NOMINATIM_REQUESTS_PER_SECOND", "1"))  # Nominatim usage policy
+    NOMINATIM_MAX_WAIT_SECONDS: float = float(os.getenv("NOMINATIM_MAX_WAIT_SECONDS", "30"))
+    
+    # Geocoding Cache and HTTP Settings
+    GEOCODE_CACHE_PERSISTENT: bool = os.getenv("GEOCODE_CACHE_PERSISTENT", "true").lower() == "true"
+    GEOCODE_CACHE_TTL_DAYS: int = int(os.getenv("GEOCODE_CACHE_TTL_DAYS", "30"))
+    GEOCODE_REVERSE_PRECISION: int = int(os.getenv("GEOCODE_REVERSE_PRECISION", "4"))  # decimals, ~11m
+    GEOCODING_HTTP_MAX_CONNECTIONS: int = int(os.getenv("GEOCODING_HTTP_MAX_CONNECTIONS", "20"))
+    GEOCODING_HTTP_TIMEOUT_SECONDS: float = float(os.getenv("GEOCODING_HTTP_TIMEOUT_SECONDS", "10"))
+    GEOCODING_BULK_CONCURRENCY: int = int(os.getenv("GEOCODING_BULK_CONCURRENCY", "4"))  # provider calls in flight per bulk request
     
     # Google Maps Settings (for future use)
     GOOGLE_MAPS_API_KEY: str = os.getenv("GOOGLE_MAPS_API_KEY", "")
@@ -3,7 +3,8 @@ from app.api.auth import get_current_user
 from app.schemas.user import UserRead
 from typing import List
 from app.db.session import get_db
-from app.services.vector_db import VectorDatabaseService
+from app.core.config import settings
+from app.services.vector_db import VectorDatabaseService, get_vector_db_service
 from app.services.agent_coordinator_service import AgentCoordinatorService
 from app.services.agent_response_service import AgentResponseService
 from app.services.user_agent_association_service import UserAgentAssociationService
@@ -12,6 +13,7 @@ from app.services.location.influencer_location_service import InfluencerLocation
 from app.services.location.business_location_service import BusinessLocationService
 from app.services.location.location_search_service import LocationSearchService
 from app.services.geocoding.geocoding_service_factory import GeocodingServiceFactory
+from app.services.geocoding.bulk_geocoding_service import BulkGeocodingService
 from app.services.location.location_promotion_service import LocationPromotionService
 
 import logging
@@ -54,7 +56,7 @@ def require_role(required_role: str):
 
 # Vector database dependency
 def get_vector_db() -> VectorDatabaseService:
-    return VectorDatabaseService()
+    return get_vector_db_service()
 
 
 # AI Agent service dependencies
@@ -87,6 +89,12 @@ def get_location_search_service() -> LocationSearchService:
 def get_geocoding_service():
     return GeocodingServiceFactory.create_geocoding_service()
 
+def get_bulk_geocoding_service() -> BulkGeocodingService:
+    return BulkGeocodingService(
+        GeocodingServiceFactory.create_geocoding_service(),
+        max_concurrency=settings.GEOCODING_BULK_CONCURRENCY
+    )
+
 def get_location_promotion_service() -> LocationPromotionService:
     return LocationPromotionService()
 
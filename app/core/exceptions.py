@@ -17,3 +17,15 @@ class GeocodingError(Exception):
 class DuplicateLocationError(Exception):
     """Raised when trying to save a location with duplicate coordinates for the same entity"""
     pass
+
+class LLMQueueTimeoutError(Exception):
+    """Raised when an LLM request cannot get a model slot in time"""
+    pass
+
+class OutboundRateLimitError(Exception):
+    """Raised when an outbound API request would wait too long for its rate limit"""
+    pass
+
+class VectorStoreUnavailableError(Exception):
+    """Raised when the configured vector store cannot be opened by this process"""
+    pass
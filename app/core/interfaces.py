@@ -97,6 +97,11 @@ class ISocialMediaAPIService(ABC):
         """Get user metrics from social media platform"""
         pass
     
+    @abstractmethod
+    async def get_user_metrics_batch(self, usernames: List[str]) -> Dict[str, SocialMediaMetrics]:
+        """Get metrics for several users, keyed by username; users that cannot be found are left out"""
+        pass
+    
     @abstractmethod
     async def get_trending_hashtags(self, platform: str, limit: int = 20) -> List[TrendingContent]:
         """Get trending hashtags for a platform"""
@@ -1,97 +1,455 @@
+"""
+Sliding-window request rate limits for API endpoints and request slot reservations for
+outbound APIs, optionally shared between workers
+"""
+
+import asyncio
+import logging
+import math
+import os
+import sqlite3
+import threading
 import time
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.security.utils import get_authorization_scheme_param
 
-class RateLimiter:
-    def __init__(self):
-        # Rate limiting storage: {ip_address: [(timestamp, count), ...]}
-        self.rate_limit_storage: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
-    
-    def check_rate_limit(
-        self, 
-        ip_address: str, 
-        max_requests: int = 3, 
-        window_hours: int = 1
-    ) -> bool:
-        """
-        Check if the IP address has exceeded the rate limit.
-        Returns True if request is allowed, False if rate limited.
-        """
-        current_time = time.time()
-        window_seconds = window_hours * 3600
-        
-        # Clean old entries (older than window)
-        self.rate_limit_storage[ip_address] = [
-            (timestamp, count) for timestamp, count in self.rate_limit_storage[ip_address]
-            if current_time - timestamp < window_seconds
-        ]
-        
-        # Count total requests in the window
-        total_requests = sum(count for _, count in self.rate_limit_storage[ip_address])
-        
-        if total_requests >= max_requests:
-            return False
-        
-        # Add current request
-        self.rate_limit_storage[ip_address].append((current_time, 1))
-        return True
+from app.core.config import settings
+from app.core.security import verify_token
 
-# Global rate limiter instance
-rate_limiter = RateLimiter()
+logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after_seconds: float
 
-# Specific rate limiter for business creation
-def business_creation_rate_limit(request: Request):
+
+def _sliding_window(
+    state: Optional[Tuple[float, int, int]],
+    now: float,
+    max_requests: int,
+    window_seconds: float
+) -> Tuple[Tuple[float, int, int], RateLimitResult]:
+    """Apply one request to a sliding-window counter.
+
+    state is (window_start, previous_count, current_count). The number of requests
+    in the last window_seconds is estimated as the current fixed window's count plus
+    the previous window's count weighted by how much of it still overlaps, so each
+    key needs two counters instead of a timestamp per request. Rejected requests
+    are not counted. Returns the new state and the decision.
     """
-    Dependency for rate limiting business creation endpoint.
-    Limits to 3 requests per hour with custom error message.
+    window_start = math.floor(now / window_seconds) * window_seconds
+    previous_count, current_count = 0, 0
+    if state is not None:
+        stored_start, stored_previous, stored_current = state
+        if stored_start == window_start:
+            previous_count, current_count = stored_previous, stored_current
+        elif stored_start == window_start - window_seconds:
+            previous_count = stored_current
+
+    elapsed = now - window_start
+    estimated = previous_count * (1 - elapsed / window_seconds) + current_count
+    if estimated + 1 > max_requests:
+        if previous_count and current_count < max_requests:
+            # Wait until enough of the previous window has slid out
+            retry_after = window_seconds * (1 - (max_requests - 1 - current_count) / previous_count) - elapsed
+        else:
+            retry_after = window_seconds - elapsed
+        decision = RateLimitResult(False, max_requests, 0, max(retry_after, 1.0))
+        return (window_start, previous_count, current_count), decision
+
+    current_count += 1
+    remaining = max(int(max_requests - estimated - 1), 0)
+    return (window_start, previous_count, current_count), RateLimitResult(True, max_requests, remaining, 0.0)
+
+
+def _reserve_slot(
+    next_free: Optional[float],
+    now: float,
+    interval_seconds: float,
+    max_wait_seconds: float
+) -> Tuple[Optional[float], Optional[float]]:
+    """Reserve the next request slot of a key that allows one request per interval_seconds.
+
+    next_free is when the key's next slot opens. Returns the new next_free and the
+    seconds to wait for the reserved slot, or (next_free, None) without reserving
+    when that wait would exceed max_wait_seconds.
     """
-    client_ip = request.client.host
-    
-    if not rate_limiter.check_rate_limit(client_ip, max_requests=3, window_hours=1):
-        raise HTTPException(
-            status_code=429,
-            detail={
-                "error": "Rate limit exceeded",
-                "message": "You have exceeded the limit of 3 business profile creation requests per hour. Please try again later.",
-                "limit": "3 requests per hour",
-                "reset_time": "1 hour from now"
-            }
+    slot = max(now, next_free or 0.0)
+    wait = slot - now
+    if wait > max_wait_seconds:
+        return next_free, None
+    return slot + interval_seconds, wait
+
+
+class RateLimitBackend(ABC):
+    """Interface for the store holding the per-key window counters and request slots"""
+
+    name: str = "base"
+
+    @abstractmethod
+    async def hit(self, key: str, max_requests: int, window_seconds: float) -> RateLimitResult:
+        """Count one request for key if it is within the limit"""
+        pass
+
+    @abstractmethod
+    async def reserve(self, key: str, interval_seconds: float, max_wait_seconds: float) -> Optional[float]:
+        """Reserve key's next request slot; returns the seconds until it opens, or None if too far away"""
+        pass
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Counters held by this process only, so each worker enforces its own limit.
+
+    Keys are kept in least-recently-used order; keys idle for two windows no
+    longer affect any decision and are evicted from the front of the order as
+    new requests arrive, and at most max_keys are kept. Slot keys name outbound
+    APIs, so there are few of them and they are never evicted.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # {key: (window_start, previous_count, current_count, expires_at)}
+        self._counters: "OrderedDict[str, Tuple[float, int, int, float]]" = OrderedDict()
+        # {key: next_free}
+        self._slots: Dict[str, float] = {}
+
+    async def hit(self, key: str, max_requests: int, window_seconds: float) -> RateLimitResult:
+        now = time.time()
+        stored = self._counters.pop(key, None)
+        state = stored[:3] if stored is not None and stored[3] > now else None
+        state, decision = _sliding_window(state, now, max_requests, window_seconds)
+        self._counters[key] = (*state, state[0] + 2 * window_seconds)
+        self._evict(now)
+        return decision
+
+    async def reserve(self, key: str, interval_seconds: float, max_wait_seconds: float) -> Optional[float]:
+        next_free, wait = _reserve_slot(self._slots.get(key), time.time(), interval_seconds, max_wait_seconds)
+        if wait is not None:
+            self._slots[key] = next_free
+        return wait
+
+    def _evict(self, now: float) -> None:
+        while self._counters:
+            oldest_key, oldest = next(iter(self._counters.items()))
+            if oldest[3] > now and len(self._counters) <= self.max_keys:
+                break
+            del self._counters[oldest_key]
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Counters in a SQLite file shared by every worker on this host.
+
+    Each hit or reservation runs in one IMMEDIATE transaction, so concurrent
+    workers never count or reserve the same slot twice. Queries run on a worker
+    thread to keep the event loop free. Expired keys are deleted every
+    sweep_interval_seconds.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, sweep_interval_seconds: float):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        self._connection = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, window_start REAL NOT NULL, previous_count INTEGER NOT NULL, "
+            "current_count INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS ix_rate_limits_expires_at ON rate_limits (expires_at)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_slots (key TEXT PRIMARY KEY, next_free REAL NOT NULL)"
         )
-    
-    return True
+
+    async def hit(self, key: str, max_requests: int, window_seconds: float) -> RateLimitResult:
+        return await asyncio.to_thread(self._hit, key, max_requests, window_seconds)
+
+    def _hit(self, key: str, max_requests: int, window_seconds: float) -> RateLimitResult:
+        with self._lock:
+            now = time.time()
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT window_start, previous_count, current_count FROM rate_limits "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+                state, decision = _sliding_window(row, now, max_requests, window_seconds)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits VALUES (?, ?, ?, ?, ?)",
+                    (key, *state, state[0] + 2 * window_seconds)
+                )
+                self._sweep(now)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return decision
+
+    async def reserve(self, key: str, interval_seconds: float, max_wait_seconds: float) -> Optional[float]:
+        return await asyncio.to_thread(self._reserve, key, interval_seconds, max_wait_seconds)
+
+    def _reserve(self, key: str, interval_seconds: float, max_wait_seconds: float) -> Optional[float]:
+        with self._lock:
+            now = time.time()
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT next_free FROM rate_limit_slots WHERE key = ?", (key,)
+                ).fetchone()
+                next_free, wait = _reserve_slot(row[0] if row else None, now, interval_seconds, max_wait_seconds)
+                if wait is not None:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO rate_limit_slots VALUES (?, ?)", (key, next_free)
+                    )
+                self._sweep(now)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return wait
+
+    def _sweep(self, now: float) -> None:
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.sweep_interval_seconds
+            self._connection.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+            self._connection.execute("DELETE FROM rate_limit_slots WHERE next_free <= ?", (now,))
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Counters on a Redis server shared by every host, using the optional redis package.
+
+    The sliding-window update and the slot reservation each run as one Lua
+    script so they are atomic; Redis expires idle keys itself.
+    """
+
+    name = "redis"
+
+    SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local max_requests = tonumber(ARGV[2])
+    local window = tonumber(ARGV[3])
+    local window_start = math.floor(now / window) * window
+    local stored = redis.call('HMGET', KEYS[1], 'start', 'previous', 'current')
+    local previous, current = 0, 0
+    if tonumber(stored[1]) == window_start then
+        previous, current = tonumber(stored[2]), tonumber(stored[3])
+    elseif tonumber(stored[1]) == window_start - window then
+        previous = tonumber(stored[3])
+    end
+    local elapsed = now - window_start
+    local estimated = previous * (1 - elapsed / window) + current
+    local allowed = 0
+    if estimated + 1 <= max_requests then
+        allowed = 1
+        current = current + 1
+    end
+    redis.call('HSET', KEYS[1], 'start', window_start, 'previous', previous, 'current', current)
+    redis.call('PEXPIREAT', KEYS[1], math.ceil((window_start + 2 * window) * 1000))
+    return {allowed, previous, current}
+    """
+
+    RESERVE_SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local interval = tonumber(ARGV[2])
+    local max_wait = tonumber(ARGV[3])
+    local slot = math.max(now, tonumber(redis.call('GET', KEYS[1]) or '0'))
+    if slot - now > max_wait then
+        return false
+    end
+    redis.call('SET', KEYS[1], tostring(slot + interval))
+    redis.call('PEXPIREAT', KEYS[1], math.ceil((slot + interval) * 1000))
+    -- Lua numbers are truncated to integers in replies, so the wait is returned as a string
+    return tostring(slot - now)
+    """
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            raise Exception("Redis library not installed. Install with: pip install redis")
+        self.url = url
+        self._client = redis_asyncio.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+        self._reserve_script = self._client.register_script(self.RESERVE_SCRIPT)
+
+    async def hit(self, key: str, max_requests: int, window_seconds: float) -> RateLimitResult:
+        now = time.time()
+        allowed, previous_count, current_count = await self._script(
+            keys=[f"{settings.CACHE_KEY_PREFIX}:rate_limit:{key}"],
+            args=[now, max_requests, window_seconds]
+        )
+        if allowed:
+            # Recompute remaining and retry_after locally from the counters before this hit
+            current_count -= 1
+        window_start = math.floor(now / window_seconds) * window_seconds
+        _, decision = _sliding_window(
+            (window_start, int(previous_count), int(current_count)), now, max_requests, window_seconds
+        )
+        decision.allowed = bool(allowed)
+        return decision
+
+    async def reserve(self, key: str, interval_seconds: float, max_wait_seconds: float) -> Optional[float]:
+        wait = await self._reserve_script(
+            keys=[f"{settings.CACHE_KEY_PREFIX}:rate_limit_slot:{key}"],
+            args=[time.time(), interval_seconds, max_wait_seconds]
+        )
+        return float(wait) if wait is not None else None
+
+
+def create_rate_limit_backend(url: str) -> RateLimitBackend:
+    """Backend for RATE_LIMIT_STORAGE_URL: memory://, sqlite:///path or redis://host"""
+    if url.startswith("sqlite:///"):
+        return SQLiteRateLimitBackend(url[len("sqlite:///"):], settings.RATE_LIMIT_SWEEP_INTERVAL_SECONDS)
+    if url.startswith(("redis://", "rediss://")):
+        return RedisRateLimitBackend(url)
+    return MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+
+class RateLimiter:
+    """Single responsibility: Decide whether a request key is within its rate limit.
+
+    Uses the backend from RATE_LIMIT_STORAGE_URL, created on first use so each
+    gunicorn worker opens its own connection after forking. If that backend
+    cannot be created, limits fall back to per-process memory. If it fails
+    during a check, the request is allowed rather than turning a storage
+    outage into an API outage; a failed slot reservation is made in this
+    process's memory instead, so outbound requests stay spaced per worker.
+    """
+
+    def __init__(self, storage_url: str):
+        self.storage_url = storage_url
+        self._backend: Optional[RateLimitBackend] = None
+        self._local_slots = MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        if self._backend is None:
+            try:
+                self._backend = create_rate_limit_backend(self.storage_url)
+            except Exception as e:
+                logger.error(f"RateLimiter: Storage '{self.storage_url}' unavailable, limiting per process only: {e}")
+                self._backend = MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+            logger.info(f"RateLimiter: Using {self._backend.name} backend")
+        return self._backend
+
+    async def check_rate_limit(
+        self,
+        key: str,
+        max_requests: int = 3,
+        window_hours: float = 1
+    ) -> RateLimitResult:
+        """Count a request for key and report whether it is allowed"""
+        try:
+            return await self.backend.hit(key, max_requests, window_hours * 3600)
+        except Exception as e:
+            logger.warning(f"RateLimiter: {self.backend.name} backend failed, allowing request for '{key}': {e}")
+            return RateLimitResult(True, max_requests, max_requests, 0.0)
+
+    async def reserve_slot(self, key: str, interval_seconds: float, max_wait_seconds: float) -> Optional[float]:
+        """Reserve the next slot of key, which allows one request per interval_seconds across workers.
+
+        Returns the seconds to wait before making the request, or None if the
+        next free slot is more than max_wait_seconds away.
+        """
+        try:
+            return await self.backend.reserve(key, interval_seconds, max_wait_seconds)
+        except Exception as e:
+            logger.warning(f"RateLimiter: {self.backend.name} backend failed, reserving '{key}' in this process: {e}")
+            return await self._local_slots.reserve(key, interval_seconds, max_wait_seconds)
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter(settings.RATE_LIMIT_STORAGE_URL)
+
+
+def _token_subject(request: Request) -> Optional[str]:
+    """Username from a valid bearer token, or None for anonymous requests"""
+    scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return verify_token(token, ValueError()).username
+    except Exception:
+        return None
+
+
+def _rate_limit_key(request: Request, scope: str, key_by: str) -> str:
+    if key_by == "user":
+        username = _token_subject(request)
+        if username:
+            return f"{scope}:user:{username}"
+    client_ip = request.client.host if request.client else "unknown"
+    return f"{scope}:ip:{client_ip}"
+
 
 # Generic rate limiter dependency factory
 def create_rate_limit_dependency(
     max_requests: int = 3,
-    window_hours: int = 1,
-    error_message: str = "Rate limit exceeded"
+    window_hours: float = 1,
+    error_message: str = "Rate limit exceeded",
+    scope: Optional[str] = None,
+    key_by: str = "ip"
 ):
     """
     Factory function to create rate limiting dependencies.
-    
+
     Args:
         max_requests: Maximum number of requests allowed
         window_hours: Time window in hours
         error_message: Custom error message
+        scope: Name of the limit; endpoints with different scopes are counted separately
+            (defaults to the request path)
+        key_by: "ip" to limit each client address, or "user" to limit each authenticated
+            user (anonymous requests fall back to their IP)
     """
-    def rate_limit_dependency(request: Request):
-        client_ip = request.client.host
-        
-        if not rate_limiter.check_rate_limit(client_ip, max_requests, window_hours):
+    if key_by not in ("ip", "user"):
+        raise ValueError(f"key_by must be 'ip' or 'user', not '{key_by}'")
+
+    async def rate_limit_dependency(request: Request):
+        key = _rate_limit_key(request, scope or request.url.path, key_by)
+        result = await rate_limiter.check_rate_limit(key, max_requests, window_hours)
+
+        if not result.allowed:
+            retry_after = math.ceil(result.retry_after_seconds)
             raise HTTPException(
                 status_code=429,
                 detail={
                     "error": "Rate limit exceeded",
                     "message": error_message,
-                    "limit": f"{max_requests} requests per {window_hours} hour(s)",
-                    "reset_time": f"{window_hours} hour(s) from now"
-                }
+                    "limit": f"{max_requests} requests per {window_hours:g} hour(s)",
+                    "reset_time": f"{retry_after} second(s) from now"
+                },
+                headers={"Retry-After": str(retry_after)}
             )
-        
+
         return True
-    
-    return rate_limit_dependency 
\ No newline at end of file
+
+    return rate_limit_dependency
+
+
+# Specific rate limiter for business creation
+business_creation_rate_limit = create_rate_limit_dependency(
+    max_requests=3,
+    window_hours=1,
+    error_message="You have exceeded the limit of 3 business profile creation requests per hour. Please try again later.",
+    scope="business_creation"
+)
@@ -0,0 +1,29 @@
+"""
+Server-sent events helpers for streaming endpoints
+"""
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi.responses import StreamingResponse
+
+
+def sse_event(payload: Dict[str, Any]) -> str:
+    """Encode a payload as one SSE message, using its type as the event name"""
+    return f"event: {payload.get('type', 'message')}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+def sse_response(events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """Stream event dicts to the client as text/event-stream"""
+    async def body():
+        async for event in events:
+            yield sse_event(event)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop reverse proxies such as nginx from buffering the stream
+            "X-Accel-Buffering": "no"
+        }
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, JSON, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -13,8 +13,8 @@ class InfluencerOperationalLocation(Base):
     region_code = Column(String(10))
     country_code = Column(String(2), nullable=False)
     country_name = Column(String(100), nullable=False)
-    latitude = Column(Numeric(9, 6), nullable=False)
-    longitude = Column(Numeric(9, 6), nullable=False)
+    latitude = Column(Numeric(9, 6), nullable=False, index=True)
+    longitude = Column(Numeric(9, 6), nullable=False, index=True)
     postcode = Column(String(20))
     time_zone = Column(String(50))
     is_primary = Column(Boolean, default=False)
@@ -35,8 +35,8 @@ class BusinessOperationalLocation(Base):
     region_code = Column(String(10))
     country_code = Column(String(2), nullable=False)
     country_name = Column(String(100), nullable=False)
-    latitude = Column(Numeric(9, 6), nullable=False)
-    longitude = Column(Numeric(9, 6), nullable=False)
+    latitude = Column(Numeric(9, 6), nullable=False, index=True)
+    longitude = Column(Numeric(9, 6), nullable=False, index=True)
     postcode = Column(String(20))
     time_zone = Column(String(50))
     is_primary = Column(Boolean, default=False)
@@ -53,8 +53,8 @@ class LocationPromotionRequest(Base):
     id = Column(Integer, primary_key=True, index=True)
     business_id = Column(Integer, ForeignKey("businesses.id"), nullable=False)
     promotion_id = Column(Integer, ForeignKey("promotions.id"), nullable=False)
-    latitude = Column(Numeric(9, 6), nullable=False)
-    longitude = Column(Numeric(9, 6), nullable=False)
+    latitude = Column(Numeric(9, 6), nullable=False, index=True)
+    longitude = Column(Numeric(9, 6), nullable=False, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"))
     city = Column(String(100))
     region_name = Column(String(100))
@@ -69,3 +69,18 @@ class LocationPromotionRequest(Base):
     business = relationship("Business", back_populates="location_promotion_requests")
     promotion = relationship("Promotion", back_populates="location_requests")
     country = relationship("Country")
+
+class GeocodeCacheEntry(Base):
+    """Single responsibility: Persist geocoding provider results between restarts"""
+    __tablename__ = "geocode_cache"
+    __table_args__ = (
+        UniqueConstraint("provider", "lookup_type", "lookup_key", name="uq_geocode_cache_lookup"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    provider = Column(String(20), nullable=False)
+    lookup_type = Column(String(10), nullable=False)  # forward, reverse
+    lookup_key = Column(String(255), nullable=False)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
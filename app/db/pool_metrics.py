@@ -0,0 +1,65 @@
+"""
+Connection pool instrumentation for the async database engine
+"""
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+# Recent checkout waits kept for the percentiles in snapshot()
+WAIT_SAMPLE_SIZE = 1000
+
+
+class PoolMetrics:
+    """Single responsibility: Record how long requests wait for a pooled connection.
+
+    Counters are per process, so every gunicorn worker reports its own pool.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waits_ms: Deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        waits = sorted(self.waits_ms)
+        return {
+            "pid": os.getpid(),
+            "pool_class": type(pool).__name__,
+            "pool_size": pool.size() if hasattr(pool, "size") else None,
+            "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+            "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+            "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "checkout_wait_ms": {
+                "avg": round(sum(waits) / len(waits), 2) if waits else None,
+                "p50": round(waits[len(waits) // 2], 2) if waits else None,
+                "p95": round(waits[min(int(len(waits) * 0.95), len(waits) - 1)], 2) if waits else None,
+                "max": round(waits[-1], 2) if waits else None
+            }
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout waits in pool_metrics.
+
+    The wait includes opening a new overflow connection when the pool has none idle.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        pool_metrics.checkouts += 1
+        pool_metrics.waits_ms.append((time.perf_counter() - started) * 1000)
+        return connection
@@ -1,10 +1,33 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
-from typing import AsyncGenerator
+from app.db.pool_metrics import InstrumentedAsyncPool
+from typing import Any, AsyncGenerator, Dict
 
-# Create async engine for PostgreSQL
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+
+def _connect_args(database_url: str) -> Dict[str, Any]:
+    """asyncpg-specific connection settings; other drivers use their defaults"""
+    if "asyncpg" not in (database_url or ""):
+        return {}
+    connect_args: Dict[str, Any] = {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+    return connect_args
+
+
+# Create async engine for PostgreSQL. Each gunicorn worker gets its own pool, so the
+# server sees up to workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=InstrumentedAsyncPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=_connect_args(settings.DATABASE_URL)
+)
 
 # Create async session
 # SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
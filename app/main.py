@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
@@ -45,6 +46,7 @@ from app.api.location_search import router as location_search_router
 from app.api.location_promotion_requests import router as location_promotion_router
 from app.api.users.user_profile import router as user_profile_router
 from app.api.admin.admin_users import router as admin_users_router
+from app.api.admin.admin_system import router as admin_system_router
 from app.api.analytics.analytics import router as analytics_router
 from app.api.unified_influencer_profile import router as unified_influencer_profile_router
 from app.api.real_time_analytics import router as real_time_analytics_router
@@ -57,6 +59,12 @@ from app.services.notification_service import notification_service
 from app.services.email_service import email_service
 from app.services.twitter_service import twitter_service
 from app.services.websocket_service import websocket_service
+from app.core.config import settings
+from app.core.exceptions import VectorStoreUnavailableError
+from app.services.vector_db import get_vector_db_service
+from app.services.analytics.cache_prewarmer import analytics_cache_prewarmer
+from app.services.social_media.session_pool import social_media_session_pool
+from app.services.geocoding.geocoding_service_factory import GeocodingServiceFactory
 
 app = FastAPI(swagger_ui_parameters={
     "syntaxHighlight": {"theme": "obsidian"},
@@ -81,6 +89,27 @@ async def startup_event():
         websocket_service=websocket_service
     )
     logger.info("Notification system initialized successfully")
+    
+    # Open the shared vector store and create its collections before the first request;
+    # a store this worker cannot open is a deployment error and fails startup
+    try:
+        await asyncio.to_thread(get_vector_db_service().warm_up)
+    except VectorStoreUnavailableError:
+        raise
+    except Exception as e:
+        logger.error(f"Vector database warm-up failed: {e}")
+    
+    # Keep popular trending content and market rates cached ahead of requests
+    if settings.ANALYTICS_PREWARM_ENABLED:
+        analytics_cache_prewarmer.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks started on app startup"""
+    await analytics_cache_prewarmer.stop()
+    await social_media_session_pool.close()
+    await GeocodingServiceFactory.close_clients()
 
 # Register routers
 app.include_router(auth.router, prefix="/auth")
@@ -113,6 +142,7 @@ app.include_router(location_search_router, tags=["location-search"])
 app.include_router(location_promotion_router, tags=["location-promotion-requests"])
 app.include_router(user_profile_router, tags=["user-profile"])
 app.include_router(admin_users_router, tags=["admin-users"])
+app.include_router(admin_system_router, tags=["admin-system"])
 app.include_router(analytics_router, prefix="/api/analytics", tags=["analytics"])
 app.include_router(unified_influencer_profile_router, tags=["unified-influencer-profile"])
 app.include_router(real_time_analytics_router, tags=["real-time-analytics"])
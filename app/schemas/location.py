@@ -72,6 +72,9 @@ class GeocodeRequest(BaseModel):
     address: str = Field(..., min_length=1)
     country_code: Optional[str] = Field(None, min_length=2, max_length=2)
 
+class BulkGeocodeRequest(BaseModel):
+    addresses: List[GeocodeRequest] = Field(..., min_length=1, max_length=1000)
+
 class ReverseGeocodeRequest(BaseModel):
     latitude: Decimal = Field(..., ge=-90, le=90)
     longitude: Decimal = Field(..., ge=-180, le=180)
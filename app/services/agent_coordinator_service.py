@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from typing import List, Dict, Any, Optional
+import asyncio
 import uuid
 import json
 import ollama
@@ -261,7 +262,8 @@ class AgentCoordinatorService:
     async def get_context_for_agent_task(self, user_id: int, current_prompt: str, agent_id: int, context_window: int = 10) -> Dict:
         """Get context for agent task"""
         # Get conversation history from vector DB
-        conversation_history = self.vector_db.retrieve_user_conversations(
+        conversation_history = await asyncio.to_thread(
+            self.vector_db.retrieve_user_conversations,
             user_id=user_id,
             query=current_prompt,
             limit=context_window
@@ -295,3 +297,55 @@ class AgentCoordinatorService:
                 "context_window": context_window
             }
         }
+
+    async def get_contexts_for_agent_tasks(
+        self, user_id: int, current_prompt: str, agent_ids: List[int], context_window: int = 10
+    ) -> Dict[int, Dict]:
+        """Get get_context_for_agent_task contexts for several agents with one vector search and one query"""
+        # The conversation history depends only on the user and prompt, so it is shared by every agent
+        conversation_history = await asyncio.to_thread(
+            self.vector_db.retrieve_user_conversations,
+            user_id=user_id,
+            query=current_prompt,
+            limit=context_window
+        )
+        
+        # Each agent's 5 most recent responses
+        ranked = select(
+            AIAgentResponse.agent_id,
+            AIAgentResponse.task_id,
+            AIAgentResponse.response,
+            AIAgentResponse.response_type,
+            AIAgentResponse.created_at,
+            func.row_number().over(
+                partition_by=AIAgentResponse.agent_id,
+                order_by=AIAgentResponse.created_at.desc()
+            ).label("position")
+        ).where(AIAgentResponse.agent_id.in_(agent_ids)).subquery()
+        
+        result = await self.db.execute(
+            select(ranked).where(ranked.c.position <= 5).order_by(ranked.c.agent_id, ranked.c.position)
+        )
+        
+        responses_by_agent: Dict[int, List[Dict]] = {agent_id: [] for agent_id in agent_ids}
+        for row in result:
+            responses_by_agent[row.agent_id].append({
+                "task_id": row.task_id,
+                "response": row.response,
+                "response_type": row.response_type,
+                "created_at": row.created_at.isoformat()
+            })
+        
+        return {
+            agent_id: {
+                "current_prompt": current_prompt,
+                "conversation_history": conversation_history,
+                "agent_responses": responses_by_agent[agent_id],
+                "context_metadata": {
+                    "user_id": user_id,
+                    "agent_id": agent_id,
+                    "context_window": context_window
+                }
+            }
+            for agent_id in agent_ids
+        }
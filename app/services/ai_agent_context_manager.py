@@ -2,6 +2,7 @@
 AI Agent Context Manager following SOLID principles
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List
 from app.services.ai_agent_interfaces import IContextManager
@@ -22,7 +23,8 @@ class AIAgentContextManager(IContextManager):
             logger.info(f"AIAgentContextManager: Getting smart context for query '{user_query}' with agent type '{agent_type}' (max_tokens: {max_tokens})")
             
             # Search vector database for relevant data
-            relevant_data = self.vector_db.retrieve_agent_context(
+            relevant_data = await asyncio.to_thread(
+                self.vector_db.retrieve_agent_context,
                 agent_uuid=f"agent_{agent_type}",
                 query=user_query,
                 limit=3  # Get top 3 most relevant results
@@ -48,14 +50,14 @@ class AIAgentContextManager(IContextManager):
         try:
             logger.info(f"AIAgentContextManager: Storing {len(data)} items for agent type '{agent_type}'")
             
-            for item in data:
-                # Store each item in vector database
-                self.vector_db.store_agent_context(
-                    agent_uuid=f"agent_{agent_type}",
-                    context_text=f"{item.get('title', '')} {item.get('content', '')}",
-                    context_type="search_result",
-                    metadata=item
-                )
+            # Embed and upsert all items in one batch, off the event loop
+            await asyncio.to_thread(
+                self.vector_db.store_agent_contexts,
+                agent_uuid=f"agent_{agent_type}",
+                context_texts=[f"{item.get('title', '')} {item.get('content', '')}" for item in data],
+                context_type="search_result",
+                metadatas=data
+            )
             
             logger.info(f"AIAgentContextManager: Successfully stored {len(data)} items")
             
@@ -70,8 +72,12 @@ class AIAgentContextManager(IContextManager):
         formatted_context = []
         for item in relevant_data:
             context_text = item.get('context_text', '')
-            similarity_score = item.get('similarity_score', 0.0)
+            similarity_score = item.get('similarity_score')
             
-            formatted_context.append(f"Relevance: {similarity_score:.2f} - {context_text}")
+            # Unscored items come from the scroll fallback when the query could not be embedded
+            if similarity_score is None:
+                formatted_context.append(f"Relevance: n/a - {context_text}")
+            else:
+                formatted_context.append(f"Relevance: {similarity_score:.2f} - {context_text}")
         
         return "\n".join(formatted_context)
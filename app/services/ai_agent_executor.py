@@ -3,13 +3,17 @@ AI Agent Executor following SOLID principles
 """
 
 import logging
-import threading
 from typing import Dict, Any, List
 from app.services.ai_agent_interfaces import IAIExecutor
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_response_cache import LLMCachePolicy
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Prompts from AIAgentPromptBuilder embed the retrieved context, so only exact repeats are reused
+AGENT_PROMPT_CACHE_POLICY = LLMCachePolicy(namespace="agent_prompts", ttl_seconds=900)
+
 
 class AIAgentExecutor(IAIExecutor):
     """AI Agent executor implementation"""
@@ -17,20 +21,6 @@ class AIAgentExecutor(IAIExecutor):
     def __init__(self):
         self.ollama_model = settings.OLLAMA_MODEL
         self.ollama_base_url = settings.OLLAMA_BASE_URL
-        
-        # Connection pooling for Ollama client
-        self._ollama_client = None
-        self._client_lock = threading.Lock()
-    
-    def _get_ollama_client(self):
-        """Get or create Ollama client with connection pooling"""
-        if self._ollama_client is None:
-            with self._client_lock:
-                if self._ollama_client is None:
-                    import ollama
-                    self._ollama_client = ollama.Client(host=self.ollama_base_url)
-                    logger.info(f"Created new Ollama client connection to {self.ollama_base_url}")
-        return self._ollama_client
     
     async def execute_with_tools(self, prompt: str, tools: List[Dict[str, Any]], agent_type: str) -> str:
         """Execute AI with tool calling support"""
@@ -62,12 +52,12 @@ class AIAgentExecutor(IAIExecutor):
             
             logger.info(f"AIAgentExecutor: Calling Ollama with model: {self.ollama_model}")
             
-            # Call Ollama using connection pool
-            client = self._get_ollama_client()
-            response = client.chat(
+            # Call Ollama through the shared async gateway
+            response = await llm_gateway.chat(
                 model=self.ollama_model,
                 messages=messages,
-                options=request_options
+                options=request_options,
+                cache=AGENT_PROMPT_CACHE_POLICY
             )
             
             ai_response = response.get("message", {}).get("content", "")
@@ -1,14 +1,16 @@
+import asyncio
 from typing import Dict, Any, List
 from datetime import datetime
 from app.services.agent_coordinator_service import AgentCoordinatorService
-from app.services.vector_db import VectorDatabaseService
+from app.services.vector_db import get_vector_db_service
 from app.services.agent_response_service import AgentResponseService
 from app.services.ai_agent_service import AIAgentService
 from app.core.dependencies import get_db, get_vector_db, get_agent_coordinator_service
+from app.core.config import settings
 
 class AIAgentOrchestrator:
     def __init__(self):
-        self.vector_db = VectorDatabaseService()
+        self.vector_db = get_vector_db_service()
         self.ai_agent_service = AIAgentService()
         
     async def get_agent_recommendations(self, user_profile: Dict[str, Any], 
@@ -18,23 +20,26 @@ class AIAgentOrchestrator:
         
         try:
             # Create services directly instead of using dependency functions
-            vector_db = VectorDatabaseService()
-            coordinator = AgentCoordinatorService(db_session, vector_db)  # Pass the database session
+            coordinator = AgentCoordinatorService(db_session, self.vector_db)  # Pass the database session
             
             # Create comprehensive prompt for AI analysis
             analysis_prompt = self._create_analysis_prompt(user_profile, analysis_result)
             
-            # Store analysis context in vector DB
-            self.vector_db.store_user_conversation(
-                user_id=user_profile["user"].id,
-                conversation_text=analysis_prompt,
-                conversation_type="analysis_request",
-                metadata={
-                    "analysis_type": "influencer_profile",
-                    "timestamp": analysis_result["analysis_timestamp"].isoformat(),
-                    "improvement_areas": analysis_result["improvement_areas"]
-                }
-            )
+            # Store analysis context in vector DB; skipped when it cannot be embedded
+            try:
+                await asyncio.to_thread(
+                    self.vector_db.store_user_conversation,
+                    user_id=user_profile["user"].id,
+                    conversation_text=analysis_prompt,
+                    conversation_type="analysis_request",
+                    metadata={
+                        "analysis_type": "influencer_profile",
+                        "timestamp": analysis_result["analysis_timestamp"].isoformat(),
+                        "improvement_areas": analysis_result["improvement_areas"]
+                    }
+                )
+            except Exception as e:
+                print(f"⚠️ Skipped storing analysis context: {str(e)}")
             
             # 1. CREATE COORDINATION SESSION using existing method
             coordination_uuid = await coordinator.create_coordination_session(
@@ -112,45 +117,13 @@ class AIAgentOrchestrator:
                         "task_assigned": True
                     })
             
-            # 4. EXECUTE AGENT ANALYSIS with real Ollama integration
-            agent_responses = []
-            for task in agent_tasks:
-                try:
-                    # Get context using existing method
-                    context = await coordinator.get_context_for_agent_task(
-                        user_id=user_profile["user"].id,
-                        current_prompt=analysis_prompt,
-                        agent_id=task["agent_id"],
-                        context_window=10
-                    )
-                    
-                    # Execute agent task using the new AI agent service
-                    response = await self.ai_agent_service.execute_agent_task(
-                        agent_id=task["agent_id"],
-                        prompt=analysis_prompt,
-                        context=context,
-                        agent_type=task["agent_type"]
-                    )
-                    
-                    # Record agent response
-                    self._record_agent_response(
-                        agent_id=task["agent_id"],
-                        task_id=f"analysis_{user_profile['user'].id}_{datetime.now().timestamp()}",
-                        response=response["response"],
-                        response_type="influencer_analysis"
-                    )
-                    
-                    agent_responses.append(response)
-                    
-                except Exception as e:
-                    print(f"❌ Error executing agent task {task['agent_id']}: {str(e)}")
-                    agent_responses.append({
-                        "agent_id": task["agent_id"],
-                        "agent_type": task["agent_type"],
-                        "focus_area": "general",
-                        "response": f"Error: {str(e)}",
-                        "status": "error"
-                    })
+            # 4. EXECUTE AGENT ANALYSIS with real Ollama integration, all agents concurrently
+            agent_responses = await self._execute_agent_tasks(
+                coordinator=coordinator,
+                agent_tasks=agent_tasks,
+                analysis_prompt=analysis_prompt,
+                user_id=user_profile["user"].id
+            )
             
             # 5. HANDLE AGENT HANDOFFS if needed
             handoff_results = await self._handle_agent_handoffs(
@@ -208,6 +181,72 @@ class AIAgentOrchestrator:
                 "timestamp": datetime.now()
             }
         
+    async def _execute_agent_tasks(self, coordinator: AgentCoordinatorService, agent_tasks: List[Dict],
+                                   analysis_prompt: str, user_id: int) -> List[Dict]:
+        """Run every assigned agent concurrently and collect whatever finished in time.
+        
+        At most AI_AGENT_MAX_PARALLEL_AGENTS agents run at once and each is cut off after
+        AI_AGENT_TASK_TIMEOUT_SECONDS; failed or timed out agents get an error entry so
+        the remaining results are still returned, in agent_tasks order.
+        """
+        if not agent_tasks:
+            return []
+        
+        # Contexts are loaded up front because the coordinator's session cannot be shared by concurrent tasks
+        try:
+            contexts = await coordinator.get_contexts_for_agent_tasks(
+                user_id=user_id,
+                current_prompt=analysis_prompt,
+                agent_ids=[task["agent_id"] for task in agent_tasks],
+                context_window=10
+            )
+        except Exception as e:
+            print(f"❌ Error loading agent contexts: {str(e)}")
+            return [self._agent_error_response(task, f"Error: {str(e)}") for task in agent_tasks]
+        
+        semaphore = asyncio.Semaphore(settings.AI_AGENT_MAX_PARALLEL_AGENTS)
+        
+        async def run_task(task: Dict) -> Dict:
+            async with semaphore:
+                try:
+                    response = await asyncio.wait_for(
+                        self.ai_agent_service.execute_agent_task(
+                            agent_id=task["agent_id"],
+                            prompt=analysis_prompt,
+                            context=contexts[task["agent_id"]],
+                            agent_type=task["agent_type"]
+                        ),
+                        timeout=settings.AI_AGENT_TASK_TIMEOUT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    print(f"❌ Agent task {task['agent_id']} timed out after {settings.AI_AGENT_TASK_TIMEOUT_SECONDS}s")
+                    return self._agent_error_response(
+                        task, f"Error: timed out after {settings.AI_AGENT_TASK_TIMEOUT_SECONDS}s", status="timeout"
+                    )
+                except Exception as e:
+                    print(f"❌ Error executing agent task {task['agent_id']}: {str(e)}")
+                    return self._agent_error_response(task, f"Error: {str(e)}")
+            
+            # Record agent response
+            self._record_agent_response(
+                agent_id=task["agent_id"],
+                task_id=f"analysis_{user_id}_{datetime.now().timestamp()}",
+                response=response["response"],
+                response_type="influencer_analysis"
+            )
+            return response
+        
+        return list(await asyncio.gather(*(run_task(task) for task in agent_tasks)))
+    
+    def _agent_error_response(self, task: Dict, message: str, status: str = "error") -> Dict:
+        return {
+            "agent_id": task["agent_id"],
+            "agent_type": task["agent_type"],
+            "focus_area": "general",
+            "response": message,
+            "status": status
+        }
+        
     def _create_analysis_prompt(self, user_profile: Dict[str, Any], 
                                     analysis_result: Dict[str, Any]) -> str:
         """Create comprehensive analysis prompt"""
@@ -332,6 +371,9 @@ class AIAgentOrchestrator:
         # Example: Check for conflicting pricing recommendations
         pricing_recommendations = []
         for response in agent_responses:
+            # Failed or timed out agents made no recommendation
+            if response.get("status") != "success":
+                continue
             if "pricing" in response["response"].lower():
                 pricing_recommendations.append({
                     "agent_id": response["agent_id"],
@@ -377,24 +419,27 @@ class AIAgentOrchestrator:
         
         try:
             # Create services directly
-            vector_db = VectorDatabaseService()
-            coordinator = AgentCoordinatorService(db_session, vector_db)
+            coordinator = AgentCoordinatorService(db_session, self.vector_db)
             
             # Create custom prompt based on text content
             custom_prompt = self.create_prompt_based_on_text_content(text_content, user_profile)
             
-            # Store custom analysis context in vector DB
+            # Store custom analysis context in vector DB; skipped when it cannot be embedded
             if user_profile and user_profile.get('user'):
-                self.vector_db.store_user_conversation(
-                    user_id=user_profile["user"].id,
-                    conversation_text=custom_prompt,
-                    conversation_type="custom_text_analysis",
-                    metadata={
-                        "analysis_type": "custom_text",
-                        "timestamp": datetime.now().isoformat(),
-                        "content_length": len(text_content)
-                    }
-                )
+                try:
+                    await asyncio.to_thread(
+                        self.vector_db.store_user_conversation,
+                        user_id=user_profile["user"].id,
+                        conversation_text=custom_prompt,
+                        conversation_type="custom_text_analysis",
+                        metadata={
+                            "analysis_type": "custom_text",
+                            "timestamp": datetime.now().isoformat(),
+                            "content_length": len(text_content)
+                        }
+                    )
+                except Exception as e:
+                    print(f"⚠️ Skipped storing custom analysis context: {str(e)}")
             
             # Create coordination session
             coordination_uuid = await coordinator.create_coordination_session(
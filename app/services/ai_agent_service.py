@@ -1,4 +1,3 @@
-import ollama
 import requests
 import json
 import logging
@@ -7,9 +6,14 @@ from datetime import datetime
 from app.core.config import settings
 from app.services.mcp_client import MCPClient
 from app.services.enhanced_ai_agent_service import EnhancedAIAgentService
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_response_cache import LLMCachePolicy
 
 logger = logging.getLogger(__name__)
 
+# Orchestrator analysis prompts repeat for users with matching profiles
+AGENT_TASK_CACHE_POLICY = LLMCachePolicy(namespace="agent_tasks", ttl_seconds=900)
+
 class AIAgentService:
     """Enhanced AI Agent Service with Ollama integration, tool calling, and MCP connectivity"""
     
@@ -106,12 +110,11 @@ class AIAgentService:
             # Call Ollama with tool calling support
             if tools:
                 print(f"🔍 DEBUG: AI Agent Service - Calling Ollama with tools for agent {agent_id}")
-                client = ollama.Client(host=self.base_url)
-                response = client.chat(
+                response = await llm_gateway.chat(
                     model=self.model,
                     messages=messages,
                     options=options,
-                    stream=False
+                    cache=AGENT_TASK_CACHE_POLICY
                 )
                 
                 # Handle tool calls if present
@@ -131,24 +134,21 @@ class AIAgentService:
                         })
                     
                     # Get final response after tool execution
-                    client = ollama.Client(host=self.base_url)
-                    final_response = client.chat(
+                    final_response = await llm_gateway.chat(
                         model=self.model,
                         messages=messages,
-                        options=options,
-                        stream=False
+                        options=options
                     )
                     
                     response = final_response
             else:
                 # Standard response without tool calling
                 print(f"🔍 DEBUG: AI Agent Service - Calling Ollama without tools for agent {agent_id}")
-                client = ollama.Client(host=self.base_url)
-                response = client.chat(
+                response = await llm_gateway.chat(
                     model=self.model,
                     messages=messages,
                     options=options,
-                    stream=False
+                    cache=AGENT_TASK_CACHE_POLICY
                 )
             
             # Extract response content
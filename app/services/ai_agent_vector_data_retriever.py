@@ -2,6 +2,7 @@
 Vector Database Data Retriever following SOLID principles
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List
 from app.services.ai_agent_interfaces import IDataRetriever
@@ -22,7 +23,8 @@ class VectorDataRetriever(IDataRetriever):
             logger.info(f"VectorDataRetriever: Searching for query '{query}' with agent type '{agent_type}' (limit: {limit})")
             
             # Search vector database for relevant data
-            relevant_data = self.vector_db.retrieve_agent_context(
+            relevant_data = await asyncio.to_thread(
+                self.vector_db.retrieve_agent_context,
                 agent_uuid=f"agent_{agent_type}",
                 query=query,
                 limit=limit
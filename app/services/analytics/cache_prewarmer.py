@@ -0,0 +1,135 @@
+"""
+Scheduled refresh of the analytics cache entries most requests depend on
+"""
+
+import asyncio
+import fcntl
+import logging
+import os
+from typing import Dict, IO, List, Optional
+
+from app.core.config import settings
+from app.services.analytics.real_time_analytics import RealTimeAnalyticsService
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsCachePrewarmer:
+    """Single responsibility: Keep popular trending content and market rates cached.
+
+    Every interval_seconds, each (platform, all categories) trending entry and
+    each (platform, content_type) market rate entry that would expire before the
+    next run is reloaded, so callers such as InfluencerMarketingService and the
+    enhanced agents are served from the cache instead of waiting on the sources.
+
+    Warming only helps other workers through a shared cache backend, so it does
+    not start without one. Every worker runs the loop, but only the one holding
+    an exclusive lock on lock_path refreshes; the others retry the lock each
+    interval and take over when the holder exits.
+    """
+
+    def __init__(
+        self,
+        analytics_service: RealTimeAnalyticsService,
+        platforms: List[str],
+        content_types: List[str],
+        interval_seconds: float,
+        lock_path: str
+    ):
+        self.analytics_service = analytics_service
+        self.platforms = platforms
+        self.content_types = content_types
+        self.interval_seconds = interval_seconds
+        self.lock_path = lock_path
+        self._task: Optional[asyncio.Task] = None
+        self._lock_file: Optional[IO] = None
+
+    async def run_once(self) -> Dict[str, int]:
+        """Refresh every combination due to expire before the next run"""
+        # A refresh can take up to the source deadline, so leave room for it
+        min_remaining = self.interval_seconds + settings.ANALYTICS_SOURCE_TIMEOUT_SECONDS
+        refreshes = [
+            self.analytics_service.refresh_trending_content(platform, min_remaining_seconds=min_remaining)
+            for platform in self.platforms
+        ] + [
+            self.analytics_service.refresh_market_rates(platform, content_type, min_remaining_seconds=min_remaining)
+            for platform in self.platforms
+            for content_type in self.content_types
+        ]
+        results = await asyncio.gather(*refreshes, return_exceptions=True)
+
+        summary = {
+            "refreshed": sum(1 for result in results if result is True),
+            "skipped": sum(1 for result in results if result is False),
+            "failed": sum(1 for result in results if isinstance(result, Exception))
+        }
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"AnalyticsCachePrewarmer: Refresh failed: {result}")
+        logger.info(f"AnalyticsCachePrewarmer: {summary}")
+        return summary
+
+    async def run(self) -> None:
+        while True:
+            try:
+                if self._acquire_lock():
+                    await self.run_once()
+            except Exception as e:
+                logger.error(f"AnalyticsCachePrewarmer: Run failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+    def _acquire_lock(self) -> bool:
+        """Whether this process holds the prewarm lock, taking it if it is free"""
+        if self._lock_file is not None:
+            return True
+        directory = os.path.dirname(self.lock_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        logger.info(f"AnalyticsCachePrewarmer: Worker {os.getpid()} is warming the shared analytics cache")
+        return True
+
+    def _release_lock(self) -> None:
+        if self._lock_file is not None:
+            # Closing the file releases the lock
+            self._lock_file.close()
+            self._lock_file = None
+
+    def start(self) -> None:
+        if self.analytics_service.cache.backend is None:
+            logger.info("AnalyticsCachePrewarmer: No shared cache backend configured, not warming per-worker caches")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+            logger.info(
+                f"AnalyticsCachePrewarmer: Warming {len(self.platforms)} platforms every {self.interval_seconds}s"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._release_lock()
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+analytics_cache_prewarmer = AnalyticsCachePrewarmer(
+    analytics_service=RealTimeAnalyticsService(),
+    platforms=_split(settings.ANALYTICS_PREWARM_PLATFORMS),
+    content_types=_split(settings.ANALYTICS_PREWARM_CONTENT_TYPES),
+    interval_seconds=settings.ANALYTICS_PREWARM_INTERVAL_SECONDS,
+    lock_path=settings.ANALYTICS_PREWARM_LOCK_FILE
+)
@@ -2,6 +2,7 @@
 Data Source Factory for managing different types of data sources
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from abc import ABC, abstractmethod
@@ -23,6 +24,11 @@ class BaseDataSource(ABC):
         """Get user metrics from this data source"""
         pass
     
+    async def get_user_metrics_batch(self, usernames: List[str], platform: str) -> Dict[str, SocialMediaMetrics]:
+        """Get metrics for several users on one platform, keyed by username"""
+        results = await asyncio.gather(*(self.get_user_metrics(username, platform) for username in usernames))
+        return {username: metrics for username, metrics in zip(usernames, results) if metrics}
+    
     @abstractmethod
     async def get_trending_content(self, platform: str, category: str = None) -> List[TrendingContent]:
         """Get trending content from this data source"""
@@ -247,6 +253,28 @@ class DirectAPIDataSource(BaseDataSource):
         
         return None
     
+    async def get_user_metrics_batch(self, usernames: List[str], platform: str) -> Dict[str, SocialMediaMetrics]:
+        """Get metrics for several users through the platform's multi-user lookups"""
+        try:
+            if self._is_platform_enabled(platform):
+                social_service = self.social_media_factory.create_social_media_service(platform)
+                async with social_service:
+                    return await social_service.get_user_metrics_batch(usernames)
+            
+        except Exception as e:
+            logger.error(f"Direct API DataSource: Error getting user metrics for {len(usernames)} accounts on {platform}: {e}")
+        
+        return {}
+    
+    @staticmethod
+    def _is_platform_enabled(platform: str) -> bool:
+        return {
+            "twitter": settings.DIRECT_API_TWITTER_ENABLED,
+            "youtube": settings.DIRECT_API_YOUTUBE_ENABLED,
+            "tiktok": settings.DIRECT_API_TIKTOK_ENABLED,
+            "instagram": settings.DIRECT_API_INSTAGRAM_ENABLED
+        }.get(platform, False)
+    
     async def get_trending_content(self, platform: str, category: str = None) -> List[TrendingContent]:
         """Get trending content from direct APIs"""
         try:
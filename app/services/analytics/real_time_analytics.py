@@ -4,17 +4,23 @@ Real-time analytics service implementation with multi-source data architecture
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from contextvars import ContextVar
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
 from datetime import datetime, timedelta
 from app.core.interfaces import IAnalyticsService, SocialMediaMetrics, MarketRate, CompetitorAnalysis, TrendingContent
 from app.services.social_media.social_media_factory import SocialMediaFactory
 from app.services.web_search.web_search_factory import WebSearchFactory
 from app.services.mcp_client import MCPClient
 from app.services.analytics.data_source_factory import DataSourceFactory, BaseDataSource
+from app.core.cache import get_cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Per-source outcome of the most recent fan-out in the current request
+_source_report: ContextVar[Optional[Dict[str, Any]]] = ContextVar("analytics_source_report", default=None)
+
 
 class RealTimeAnalyticsService(IAnalyticsService):
     """Real-time analytics service implementation with multi-source data architecture"""
@@ -27,42 +33,15 @@ class RealTimeAnalyticsService(IAnalyticsService):
             mcp_client=self.mcp_client,
             social_media_factory=self.social_media_factory
         )
-        self.cache = {}  # Simple in-memory cache
-        self.cache_ttl = settings.REAL_TIME_DATA_CACHE_TTL
+        self.cache = get_cache("real_time_analytics", ttl_seconds=settings.REAL_TIME_DATA_CACHE_TTL)
     
     async def get_engagement_trends(self, user_id: int, days: int = 30) -> List[SocialMediaMetrics]:
         """Get engagement trends for a user using multi-source data architecture"""
         try:
-            cache_key = f"engagement_trends_{user_id}_{days}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]['data']
-            
-            # Get user's social media accounts (this would come from database)
-            user_accounts = await self._get_user_social_accounts(user_id)
-            
-            all_metrics = []
-            for account in user_accounts:
-                platform = account['platform']
-                username = account['username']
-                
-                # Get metrics from all enabled data sources
-                metrics_data = await self._get_metrics_from_all_sources(username, platform)
-                
-                # Add all metrics from different sources
-                for source_name, metrics in metrics_data.items():
-                    if metrics:
-                        all_metrics.append(metrics)
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': all_metrics,
-                'timestamp': datetime.now()
-            }
-            
-            return all_metrics
-            
+            return await self._cached(
+                f"engagement_trends_{user_id}_{days}",
+                lambda: self._load_engagement_trends(user_id)
+            )
         except Exception as e:
             logger.error(f"Failed to get engagement trends: {e}")
             return []
@@ -70,40 +49,11 @@ class RealTimeAnalyticsService(IAnalyticsService):
     async def get_market_rates(self, platform: str, content_type: str) -> List[MarketRate]:
         """Get current market rates for content using multi-source data architecture"""
         try:
-            cache_key = f"market_rates_{platform}_{content_type}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]['data']
-            
-            # Get market rates from all enabled data sources
-            rates_data = await self._get_market_rates_from_all_sources(platform, content_type)
-            
-            # Combine all market rates from different sources
-            all_market_rates = []
-            for source_name, rates_list in rates_data.items():
-                all_market_rates.extend(rates_list)
-            
-            # If no rates from data sources, fall back to web search
-            if not all_market_rates:
-                search_service = self.web_search_factory.create_search_service()
-                
-                async with search_service:
-                    # Search for current market rates
-                    query = f"{platform} influencer rates {content_type} 2024"
-                    search_results = await search_service.search(query, max_results=10)
-                    
-                    # Parse market rates from search results
-                    all_market_rates = self._parse_market_rates_from_search(search_results, platform, content_type)
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': all_market_rates,
-                'timestamp': datetime.now()
-            }
-            
-            return all_market_rates
-            
+            return await self._cached(
+                self._market_rates_key(platform, content_type),
+                lambda: self._load_market_rates(platform, content_type),
+                stale_seconds=settings.ANALYTICS_STALE_WHILE_REVALIDATE_SECONDS
+            )
         except Exception as e:
             logger.error(f"Failed to get market rates: {e}")
             return []
@@ -111,28 +61,11 @@ class RealTimeAnalyticsService(IAnalyticsService):
     async def get_competitor_analysis(self, user_id: int, competitors: List[str]) -> List[CompetitorAnalysis]:
         """Get competitor analysis using multi-source data architecture"""
         try:
-            cache_key = f"competitor_analysis_{user_id}_{hash(tuple(competitors))}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]['data']
-            
-            # Get competitor analysis from all enabled data sources
-            analysis_data = await self._get_competitor_analysis_from_all_sources(user_id, competitors)
-            
-            # Combine all competitor analysis from different sources
-            all_competitor_analyses = []
-            for source_name, analysis_list in analysis_data.items():
-                all_competitor_analyses.extend(analysis_list)
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': all_competitor_analyses,
-                'timestamp': datetime.now()
-            }
-            
-            return all_competitor_analyses
-            
+            return await self._cached(
+                # Joined rather than hash()ed so the key is the same in every worker process
+                f"competitor_analysis_{user_id}_{','.join(competitors)}",
+                lambda: self._load_competitor_analysis(user_id, competitors)
+            )
         except Exception as e:
             logger.error(f"Failed to get competitor analysis: {e}")
             return []
@@ -141,119 +74,262 @@ class RealTimeAnalyticsService(IAnalyticsService):
         """Get trending content for a platform using multi-source data architecture"""
         logger.info(f"Starting to get trending content for platform: {platform}, category: {category or 'all'}")
         try:
-            cache_key = f"trending_content_{platform}_{category or 'all'}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                cached_data = self.cache[cache_key]['data']
-                logger.info(f"Cache hit for {platform} trending content: {len(cached_data)} items found")
-                return cached_data
-            else:
-                logger.info(f"Cache miss for {platform} trending content, fetching fresh data")
-            
-            # Get trending content from all enabled data sources
-            trending_data = await self._get_trending_from_all_sources(platform, category)
-            
-            # Combine all trending content from different sources
-            all_trending_content = []
-            total_items = 0
-            for source_name, trending_list in trending_data.items():
-                all_trending_content.extend(trending_list)
-                total_items += len(trending_list)
-                logger.info(f"Data source {source_name} returned {len(trending_list)} trending items for {platform}")
-            
-            logger.info(f"Combined {total_items} trending items from {len(trending_data)} data sources for {platform}")
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': all_trending_content,
-                'timestamp': datetime.now()
-            }
-            
-            return all_trending_content
-            
+            trending_content = await self._cached(
+                self._trending_content_key(platform, category),
+                lambda: self._load_trending_content(platform, category),
+                stale_seconds=settings.ANALYTICS_STALE_WHILE_REVALIDATE_SECONDS
+            )
+            if _source_report.get()["cached"]:
+                logger.info(f"Cache hit for {platform} trending content: {len(trending_content)} items found")
+            return trending_content
         except Exception as e:
             logger.error(f"Failed to get trending content: {e}")
             return []
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache entry is still valid"""
-        if cache_key not in self.cache:
-            return False
+    def get_last_source_report(self) -> Optional[Dict[str, Any]]:
+        """Which data sources answered in time for the last lookup made by the current request"""
+        return _source_report.get()
+    
+    async def refresh_trending_content(self, platform: str, category: str = None, min_remaining_seconds: float = 0) -> bool:
+        """Reload cached trending content unless it stays fresh for min_remaining_seconds"""
+        return await self.cache.refresh(
+            self._trending_content_key(platform, category),
+            lambda: self._load_entry(lambda: self._load_trending_content(platform, category)),
+            stale_seconds=settings.ANALYTICS_STALE_WHILE_REVALIDATE_SECONDS,
+            min_remaining_seconds=min_remaining_seconds
+        )
+    
+    async def refresh_market_rates(self, platform: str, content_type: str, min_remaining_seconds: float = 0) -> bool:
+        """Reload cached market rates unless they stay fresh for min_remaining_seconds"""
+        return await self.cache.refresh(
+            self._market_rates_key(platform, content_type),
+            lambda: self._load_entry(lambda: self._load_market_rates(platform, content_type)),
+            stale_seconds=settings.ANALYTICS_STALE_WHILE_REVALIDATE_SECONDS,
+            min_remaining_seconds=min_remaining_seconds
+        )
+    
+    @staticmethod
+    def _trending_content_key(platform: str, category: Optional[str]) -> str:
+        return f"trending_content_{platform}_{category or 'all'}"
+    
+    @staticmethod
+    def _market_rates_key(platform: str, content_type: str) -> str:
+        return f"market_rates_{platform}_{content_type}"
+    
+    async def _cached(
+        self,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Tuple[Any, Dict[str, Any]]]],
+        stale_seconds: float = 0
+    ):
+        """Serve cache_key from the cache or run loader once for every concurrent caller.
         
-        cache_entry = self.cache[cache_key]
-        age = (datetime.now() - cache_entry['timestamp']).seconds
+        loader returns (data, per-source statuses); both are cached so the source
+        report can be rebuilt on a hit. With stale_seconds, an expired entry is
+        returned immediately and reloaded in the background.
+        """
+        loaded = False
         
-        return age < self.cache_ttl
+        async def load() -> Dict[str, Any]:
+            nonlocal loaded
+            loaded = True
+            return await self._load_entry(loader)
+        
+        entry = await self.cache.get_or_set(cache_key, load, stale_seconds=stale_seconds)
+        _source_report.set({"cached": not loaded, "fetched_at": entry['fetched_at'], "sources": entry['sources']})
+        return entry['data']
+    
+    @staticmethod
+    async def _load_entry(loader: Callable[[], Awaitable[Tuple[Any, Dict[str, Any]]]]) -> Dict[str, Any]:
+        data, sources = await loader()
+        return {'data': data, 'fetched_at': datetime.now().isoformat(), 'sources': sources}
     
-    async def _get_metrics_from_all_sources(self, username: str, platform: str) -> Dict[str, Optional[SocialMediaMetrics]]:
-        """Get metrics from all enabled data sources"""
-        metrics_data = {}
+    async def _load_engagement_trends(self, user_id: int) -> Tuple[List[SocialMediaMetrics], Dict[str, Any]]:
+        # Get user's social media accounts (this would come from database)
+        user_accounts = await self._get_user_social_accounts(user_id)
         
-        # Get all enabled data sources
-        data_sources = self.data_source_factory.get_all_sources()
+        # One batched lookup per platform, all platforms concurrently; each fans out to all sources
+        usernames_by_platform: Dict[str, List[str]] = {}
+        for account in user_accounts:
+            usernames_by_platform.setdefault(account['platform'], []).append(account['username'])
+        platform_results = await asyncio.gather(*(
+            self._get_metrics_batch_from_all_sources(usernames, platform)
+            for platform, usernames in usernames_by_platform.items()
+        ))
         
-        for source in data_sources:
-            try:
-                metrics = await source.get_user_metrics(username, platform)
-                metrics_data[source.source_name] = metrics
-            except Exception as e:
-                logger.warning(f"Failed to get metrics from {source.source_name} for {username} on {platform}: {e}")
-                metrics_data[source.source_name] = None
+        all_metrics = []
+        sources = {}
+        for (platform, usernames), (metrics_data, platform_sources) in zip(usernames_by_platform.items(), platform_results):
+            for username in usernames:
+                sources[f"{platform}:{username}"] = platform_sources
+                
+                # Add all metrics from different sources
+                for source_name, metrics_by_username in metrics_data.items():
+                    metrics = metrics_by_username.get(username)
+                    if metrics:
+                        all_metrics.append(metrics)
         
-        return metrics_data
+        return all_metrics, sources
     
-    async def _get_trending_from_all_sources(self, platform: str, category: str = None) -> Dict[str, List[TrendingContent]]:
-        """Get trending content from all enabled data sources"""
-        trending_data = {}
+    async def _load_market_rates(self, platform: str, content_type: str) -> Tuple[List[MarketRate], Dict[str, Any]]:
+        # Get market rates from all enabled data sources
+        sources_task = asyncio.create_task(self._get_market_rates_from_all_sources(platform, content_type))
         
-        # Get all enabled data sources
-        data_sources = self.data_source_factory.get_all_sources()
-        logger.info(f"Using {len(data_sources)} data sources for {platform}: {[s.source_name for s in data_sources]}")
+        # Hedge: if the sources are slow, start the web search fallback alongside them
+        search_task = None
+        done, _ = await asyncio.wait({sources_task}, timeout=settings.ANALYTICS_SOURCE_HEDGE_SECONDS)
+        if not done:
+            search_task = asyncio.create_task(self._search_market_rates(platform, content_type))
         
-        for source in data_sources:
-            try:
-                trending = await source.get_trending_content(platform, category)
-                trending_data[source.source_name] = trending
-            except Exception as e:
-                logger.warning(f"Failed to get trending content from {source.source_name} for {platform}: {e}")
-                trending_data[source.source_name] = []
+        try:
+            rates_data, sources = await sources_task
+        except BaseException:
+            if search_task:
+                search_task.cancel()
+            raise
         
-        return trending_data
+        # Combine all market rates from different sources
+        all_market_rates = []
+        for source_name, rates_list in rates_data.items():
+            all_market_rates.extend(rates_list)
+        
+        if all_market_rates:
+            if search_task:
+                search_task.cancel()
+        else:
+            # If no rates from data sources, fall back to web search
+            all_market_rates = await (search_task or self._search_market_rates(platform, content_type))
+            sources["web_search"] = {"status": "ok" if all_market_rates else "empty", "hedged": search_task is not None}
+        
+        return all_market_rates, sources
     
-    async def _get_market_rates_from_all_sources(self, platform: str, content_type: str) -> Dict[str, List[MarketRate]]:
-        """Get market rates from all enabled data sources"""
-        rates_data = {}
+    async def _load_competitor_analysis(self, user_id: int, competitors: List[str]) -> Tuple[List[CompetitorAnalysis], Dict[str, Any]]:
+        # Get competitor analysis from all enabled data sources
+        analysis_data, sources = await self._get_competitor_analysis_from_all_sources(user_id, competitors)
         
-        # Get all enabled data sources
-        data_sources = self.data_source_factory.get_all_sources()
+        # Combine all competitor analysis from different sources
+        all_competitor_analyses = []
+        for source_name, analysis_list in analysis_data.items():
+            all_competitor_analyses.extend(analysis_list)
+        
+        return all_competitor_analyses, sources
+    
+    async def _load_trending_content(self, platform: str, category: Optional[str]) -> Tuple[List[TrendingContent], Dict[str, Any]]:
+        logger.info(f"Cache miss for {platform} trending content, fetching fresh data")
+        
+        # Get trending content from all enabled data sources
+        trending_data, sources = await self._get_trending_from_all_sources(platform, category)
         
-        for source in data_sources:
-            try:
-                rates = await source.get_market_rates(platform, content_type)
-                rates_data[source.source_name] = rates
-            except Exception as e:
-                logger.warning(f"Failed to get market rates from {source.source_name} for {platform}: {e}")
-                rates_data[source.source_name] = []
+        # Combine all trending content from different sources
+        all_trending_content = []
+        total_items = 0
+        for source_name, trending_list in trending_data.items():
+            all_trending_content.extend(trending_list)
+            total_items += len(trending_list)
+            logger.info(f"Data source {source_name} returned {len(trending_list)} trending items for {platform}")
         
-        return rates_data
+        logger.info(f"Combined {total_items} trending items from {len(trending_data)} data sources for {platform}")
+        return all_trending_content, sources
     
-    async def _get_competitor_analysis_from_all_sources(self, user_id: int, competitors: List[str]) -> Dict[str, List[CompetitorAnalysis]]:
-        """Get competitor analysis from all enabled data sources"""
-        analysis_data = {}
+    async def _gather_from_sources(
+        self,
+        operation: str,
+        fetch: Callable[[BaseDataSource], Awaitable[Any]],
+        empty: Callable[[], Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Query all enabled data sources concurrently.
         
-        # Get all enabled data sources
+        Each source gets ANALYTICS_SOURCE_TIMEOUT_SECONDS. Once one source has returned
+        data, the others get at most ANALYTICS_SOURCE_HEDGE_SECONDS more before they are
+        cancelled. Sources that fail or miss the deadline contribute `empty()`.
+        Returns (results by source name, status by source name).
+        """
         data_sources = self.data_source_factory.get_all_sources()
+        results = {source.source_name: empty() for source in data_sources}
+        statuses: Dict[str, Dict[str, Any]] = {}
+        if not data_sources:
+            return results, statuses
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + settings.ANALYTICS_SOURCE_TIMEOUT_SECONDS
+        hedge_deadline = None
+        tasks = {asyncio.create_task(fetch(source)): source for source in data_sources}
+        pending = set(tasks)
+        
+        while pending:
+            wait_until = deadline if hedge_deadline is None else min(deadline, hedge_deadline)
+            remaining = wait_until - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                source_name = tasks[task].source_name
+                latency_ms = round((loop.time() - started) * 1000, 1)
+                if task.exception() is not None:
+                    logger.warning(f"Failed to get {operation} from {source_name}: {task.exception()}")
+                    statuses[source_name] = {"status": "error", "latency_ms": latency_ms, "error": str(task.exception())}
+                    continue
+                result = task.result()
+                results[source_name] = result if result is not None else empty()
+                statuses[source_name] = {"status": "ok" if result else "empty", "latency_ms": latency_ms}
+                if result and hedge_deadline is None:
+                    hedge_deadline = loop.time() + settings.ANALYTICS_SOURCE_HEDGE_SECONDS
         
-        for source in data_sources:
-            try:
-                analysis = await source.get_competitor_analysis(user_id, competitors)
-                analysis_data[source.source_name] = analysis
-            except Exception as e:
-                logger.warning(f"Failed to get competitor analysis from {source.source_name}: {e}")
-                analysis_data[source.source_name] = []
+        for task in pending:
+            task.cancel()
+            source_name = tasks[task].source_name
+            hedged = hedge_deadline is not None and hedge_deadline < deadline
+            logger.warning(f"{source_name} did not return {operation} in time, skipping it")
+            statuses[source_name] = {"status": "hedged" if hedged else "timeout"}
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         
-        return analysis_data
+        return results, statuses
+    
+    async def _get_metrics_batch_from_all_sources(self, usernames: List[str], platform: str) -> Tuple[Dict[str, Dict[str, SocialMediaMetrics]], Dict[str, Dict[str, Any]]]:
+        """Get metrics for several accounts on one platform from all enabled data sources"""
+        return await self._gather_from_sources(
+            f"metrics for {len(usernames)} accounts on {platform}",
+            lambda source: source.get_user_metrics_batch(usernames, platform),
+            dict
+        )
+    
+    async def _get_trending_from_all_sources(self, platform: str, category: str = None) -> Tuple[Dict[str, List[TrendingContent]], Dict[str, Dict[str, Any]]]:
+        """Get trending content from all enabled data sources"""
+        return await self._gather_from_sources(
+            f"trending content for {platform}",
+            lambda source: source.get_trending_content(platform, category),
+            list
+        )
+    
+    async def _get_market_rates_from_all_sources(self, platform: str, content_type: str) -> Tuple[Dict[str, List[MarketRate]], Dict[str, Dict[str, Any]]]:
+        """Get market rates from all enabled data sources"""
+        return await self._gather_from_sources(
+            f"market rates for {platform}",
+            lambda source: source.get_market_rates(platform, content_type),
+            list
+        )
+    
+    async def _get_competitor_analysis_from_all_sources(self, user_id: int, competitors: List[str]) -> Tuple[Dict[str, List[CompetitorAnalysis]], Dict[str, Dict[str, Any]]]:
+        """Get competitor analysis from all enabled data sources"""
+        return await self._gather_from_sources(
+            "competitor analysis",
+            lambda source: source.get_competitor_analysis(user_id, competitors),
+            list
+        )
+    
+    async def _search_market_rates(self, platform: str, content_type: str) -> List[MarketRate]:
+        """Parse market rates from a web search, used when the data sources have none"""
+        search_service = self.web_search_factory.create_search_service()
+        
+        async with search_service:
+            # Search for current market rates
+            query = f"{platform} influencer rates {content_type} 2024"
+            search_results = await search_service.search(query, max_results=10)
+            
+            # Parse market rates from search results
+            return self._parse_market_rates_from_search(search_results, platform, content_type)
 
     async def _get_user_social_accounts(self, user_id: int) -> List[Dict[str, str]]:
         """Get user's social media accounts from database"""
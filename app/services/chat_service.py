@@ -1,11 +1,20 @@
-import ollama
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from app.core.config import settings
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_response_cache import LLMCachePolicy
+from app.services.thinking_filter import ThinkingStreamFilter
 import json
 
 logger = logging.getLogger(__name__)
 
+CHAT_OPTIONS = {
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "max_tokens": 1000,
+    "stop": ["<|endoftext|>", "<|im_end|>"]
+}
+
 class ChatService:
     def __init__(self):
         self.model = settings.OLLAMA_MODEL
@@ -15,50 +24,24 @@ class ChatService:
         self, 
         message: str, 
         conversation_history: List[Dict[str, str]] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        cache: Optional[LLMCachePolicy] = None
     ) -> Dict[str, Any]:
         """
-        Generate a response using Ollama with conversation history and context
+        Generate a response using Ollama with conversation history and context.
+        Pass a cache policy to answer repeated questions from the response cache.
         """
         try:
-            # Prepare conversation history for Ollama
-            messages = []
-            
-            # Add system context if provided
-            if context:
-                system_context = self._build_system_context(context)
-                messages.append({
-                    "role": "system",
-                    "content": system_context
-                })
-            
-            # Add conversation history
-            if conversation_history:
-                for msg in conversation_history[-10:]:  # Limit to last 10 messages
-                    messages.append({
-                        "role": msg.get("role", "user"),
-                        "content": msg.get("content", "")
-                    })
-            
-            # Add current message
-            messages.append({
-                "role": "user",
-                "content": message
-            })
+            messages = self._build_messages(message, conversation_history, context)
             
             logger.info(f"🤖 CHAT: Sending {len(messages)} messages to Ollama")
             
-            # Call Ollama with custom base URL
-            client = ollama.Client(host=self.base_url)
-            response = client.chat(
+            # Call Ollama through the shared async gateway
+            response = await llm_gateway.chat(
                 model=self.model,
                 messages=messages,
-                options={
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "max_tokens": 1000,
-                    "stop": ["<|endoftext|>", "<|im_end|>"]
-                }
+                options=CHAT_OPTIONS,
+                cache=cache
             )
 
             logger.info(f"🤖 CHAT: Response: {response}")
@@ -71,7 +54,7 @@ class ChatService:
                     "success": True,
                     "message": assistant_message,
                     "model": self.model,
-                    "tokens_used": response.get("usage", {}).get("total_tokens", 0)
+                    "tokens_used": response.get("prompt_eval_count", 0) + response.get("eval_count", 0)
                 }
             else:
                 logger.error("🤖 CHAT: Invalid response format from Ollama")
@@ -89,6 +72,74 @@ class ChatService:
                 "error": str(e)
             }
     
+    async def stream_response(
+        self,
+        message: str,
+        conversation_history: List[Dict[str, str]] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a response as token events, dropping thinking content as it arrives
+        """
+        messages = self._build_messages(message, conversation_history, context)
+        logger.info(f"🤖 CHAT: Streaming {len(messages)} messages from Ollama")
+        
+        thinking_filter = ThinkingStreamFilter()
+        tokens_used = 0
+        try:
+            async for chunk in llm_gateway.stream_chat(model=self.model, messages=messages, options=CHAT_OPTIONS):
+                content = thinking_filter.feed(chunk.get("message", {}).get("content", ""))
+                if content:
+                    yield {"type": "token", "content": content}
+                if chunk.get("done"):
+                    tokens_used = chunk.get("prompt_eval_count", 0) + chunk.get("eval_count", 0)
+            
+            content = thinking_filter.flush()
+            if content:
+                yield {"type": "token", "content": content}
+            yield {"type": "done", "model": self.model, "tokens_used": tokens_used}
+        except Exception as e:
+            logger.error(f"🤖 CHAT: Error streaming response: {str(e)}")
+            yield {
+                "type": "error",
+                "message": "Sorry, I'm experiencing technical difficulties. Please try again later.",
+                "error": str(e)
+            }
+    
+    def _build_messages(
+        self,
+        message: str,
+        conversation_history: Optional[List[Dict[str, str]]],
+        context: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """Prepare system context, recent history and the current message for Ollama"""
+        # Prepare conversation history for Ollama
+        messages = []
+
+        # Add system context if provided
+        if context:
+            system_context = self._build_system_context(context)
+            messages.append({
+                "role": "system",
+                "content": system_context
+            })
+
+        # Add conversation history
+        if conversation_history:
+            for msg in conversation_history[-10:]:  # Limit to last 10 messages
+                messages.append({
+                    "role": msg.get("role", "user"),
+                    "content": msg.get("content", "")
+                })
+
+        # Add current message
+        messages.append({
+            "role": "user",
+            "content": message
+        })
+        
+        return messages
+    
     def _build_system_context(self, context: Dict[str, Any]) -> str:
         """
         Build system context for the AI based on available information
@@ -1,4 +1,4 @@
-import ollama
+import asyncio
 import markdown
 import re
 from reportlab.lib.pagesizes import letter
@@ -10,6 +10,7 @@ from PIL import Image, ImageDraw
 from jinja2 import Template
 from app.core.config import settings
 from app.db.models.document_templates import DocumentTemplate
+from app.services.llm_gateway import llm_gateway
 from typing import Union, Optional, List
 import uuid
 import logging
@@ -293,7 +294,7 @@ def generate_simple_pdf_fallback(content: str, file_path: str) -> None:
     c.save()
     logger.info(f"Fallback PDF generated: {file_path}")
 
-def generate_document(template: Optional[Union[DocumentTemplate, object]], params: dict, related_data: dict) -> str:
+async def generate_document(template: Optional[Union[DocumentTemplate, object]], params: dict, related_data: dict) -> str:
     """Enhanced document generator that handles optional templates for development speed"""
     
     # Handle missing or minimal template scenarios
@@ -329,9 +330,8 @@ def generate_document(template: Optional[Union[DocumentTemplate, object]], param
             # logger.info(f"Input prompt: {generated_text[:100]}...")
             if '{{' not in generated_text:  # Only if we have a complete prompt
                 
-                # Use Ollama Client with custom base URL
-                client = ollama.Client(host=settings.OLLAMA_BASE_URL)
-                response = client.chat(
+                # Generate through the shared async gateway so the event loop is not blocked
+                response = await llm_gateway.chat(
                     model=settings.OLLAMA_MODEL,
                     messages=[{
                         'role': 'system', 
@@ -357,6 +357,11 @@ def generate_document(template: Optional[Union[DocumentTemplate, object]], param
         # Ultimate fallback
         generated_text = f"Document generated with parameters: {params}"
     
+    # PDF/image rendering is CPU and disk bound, so keep it off the event loop
+    return await asyncio.to_thread(_write_document_file, generated_text, file_format, template_id)
+
+def _write_document_file(generated_text: str, file_format: str, template_id) -> str:
+    """Render generated text to a file in DOC_STORAGE_PATH and return its path"""
     # Create unique filename
     unique_id = str(uuid.uuid4())[:8]
     file_path = f"{settings.DOC_STORAGE_PATH}/doc_{template_id}_{unique_id}.{file_format}"
@@ -0,0 +1,266 @@
+"""
+Text embedding providers and cache used by the vector database
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, List, Sequence, Tuple
+
+import httpx
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class IEmbeddingProvider(ABC):
+    """Interface for text embedding providers"""
+
+    name: str = "base"
+
+    @property
+    def vector_space(self) -> str:
+        """Identifies the vector space this provider produces; vectors from different spaces are not comparable"""
+        return self.name
+
+    @abstractmethod
+    def embed_batch(self, texts: Sequence[str], dimension: int) -> List[List[float]]:
+        """Embed every text into a vector of the given dimension"""
+        pass
+
+    def embed_batch_with_space(self, texts: Sequence[str], dimension: int) -> Tuple[List[List[float]], str]:
+        """Embed every text and report the vector space the returned vectors belong to"""
+        return self.embed_batch(texts, dimension), self.vector_space
+
+
+class HashingEmbeddingProvider(IEmbeddingProvider):
+    """Deterministic offline embeddings from hashed word and character n-grams.
+
+    Features are hashed into `dimension` signed buckets and weighted with
+    sublinear term frequency, then L2-normalised, so texts sharing words or
+    word fragments end up close under cosine similarity.
+    """
+
+    name = "hashing"
+    _token_pattern = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self, char_ngram_sizes: Sequence[int] = (3, 4, 5)):
+        self.char_ngram_sizes = tuple(char_ngram_sizes)
+
+    def embed_batch(self, texts: Sequence[str], dimension: int) -> List[List[float]]:
+        matrix = np.zeros((len(texts), dimension), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            counts: Dict[str, int] = {}
+            for feature in self._features(text):
+                counts[feature] = counts.get(feature, 0) + 1
+
+            for feature, count in counts.items():
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % dimension
+                sign = 1.0 if digest[4] & 1 else -1.0
+                matrix[row, bucket] += sign * (1.0 + math.log(count))
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).tolist()
+
+    def _features(self, text: str) -> List[str]:
+        tokens = self._token_pattern.findall(text.lower())
+        features = [f"w:{token}" for token in tokens]
+        features.extend(f"b:{first} {second}" for first, second in zip(tokens, tokens[1:]))
+
+        for token in tokens:
+            padded = f"<{token}>"
+            for size in self.char_ngram_sizes:
+                features.extend(f"c:{padded[i:i + size]}" for i in range(max(len(padded) - size + 1, 0)))
+        return features
+
+
+class OllamaEmbeddingProvider(IEmbeddingProvider):
+    """Embeddings from a local Ollama embedding model.
+
+    Errors are raised; wrap the provider in FallbackEmbeddingProvider to answer
+    them offline. The client is synchronous; async callers run it with
+    asyncio.to_thread.
+    """
+
+    name = "ollama"
+
+    def __init__(self, base_url: str, model: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self._client = httpx.Client(base_url=self.base_url, timeout=timeout)
+        self._supports_batch_endpoint = True
+
+    @property
+    def vector_space(self) -> str:
+        return f"{self.name}:{self.model}"
+
+    def embed_batch(self, texts: Sequence[str], dimension: int) -> List[List[float]]:
+        vectors = self._request_embeddings(list(texts))
+        if any(len(vector) != dimension for vector in vectors):
+            raise ValueError(f"Model '{self.model}' returned vectors of size {len(vectors[0])}, expected {dimension}")
+        return vectors
+
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed all texts in one /api/embed call, or one /api/embeddings call per text on older servers"""
+        if self._supports_batch_endpoint:
+            response = self._client.post("/api/embed", json={"model": self.model, "input": texts})
+            if response.status_code != 404:
+                response.raise_for_status()
+                return response.json()["embeddings"]
+            self._supports_batch_endpoint = False
+            logger.info("OllamaEmbeddingProvider: /api/embed not available, falling back to per-text /api/embeddings")
+
+        vectors = []
+        for text in texts:
+            response = self._client.post("/api/embeddings", json={"model": self.model, "prompt": text})
+            response.raise_for_status()
+            vectors.append(response.json()["embedding"])
+        return vectors
+
+
+class FallbackEmbeddingProvider(IEmbeddingProvider):
+    """Embeds with a primary provider and answers its failures with a fallback provider.
+
+    Fallback vectors live in the fallback's vector space, which embed_batch_with_space
+    reports so callers can tag and search them separately. After a failure the
+    primary is skipped for retry_seconds instead of waiting on its timeout per call.
+    """
+
+    def __init__(self, primary: IEmbeddingProvider, fallback: IEmbeddingProvider, retry_seconds: float = 30.0):
+        self.primary = primary
+        self.fallback = fallback
+        self.retry_seconds = retry_seconds
+        self.name = primary.name
+        self.fallback_batches = 0
+        self._primary_retry_at = 0.0
+
+    @property
+    def vector_space(self) -> str:
+        return self.primary.vector_space
+
+    def embed_batch(self, texts: Sequence[str], dimension: int) -> List[List[float]]:
+        return self.embed_batch_with_space(texts, dimension)[0]
+
+    def embed_batch_with_space(self, texts: Sequence[str], dimension: int) -> Tuple[List[List[float]], str]:
+        if time.monotonic() >= self._primary_retry_at:
+            try:
+                return self.primary.embed_batch(texts, dimension), self.primary.vector_space
+            except Exception as e:
+                self._primary_retry_at = time.monotonic() + self.retry_seconds
+                logger.warning(
+                    f"FallbackEmbeddingProvider: {self.primary.vector_space} failed, using {self.fallback.vector_space} "
+                    f"for the next {self.retry_seconds:.0f}s: {e}"
+                )
+
+        self.fallback_batches += 1
+        return self.fallback.embed_batch(texts, dimension), self.fallback.vector_space
+
+
+class EmbeddingService:
+    """Embeds texts through a provider with an LRU cache keyed by text hash and dimension.
+
+    Only vectors in the provider's own vector space are cached, so fallback vectors
+    are recomputed once the primary provider is reachable again.
+    """
+
+    def __init__(self, provider: IEmbeddingProvider, cache_size: int = 10000):
+        self.provider = provider
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, text: str, dimension: int) -> List[float]:
+        return self.embed_batch([text], dimension)[0]
+
+    def embed_with_space(self, text: str, dimension: int) -> Tuple[List[float], str]:
+        vectors, spaces = self.embed_batch_with_spaces([text], dimension)
+        return vectors[0], spaces[0]
+
+    def embed_batch(self, texts: Sequence[str], dimension: int) -> List[List[float]]:
+        return self.embed_batch_with_spaces(texts, dimension)[0]
+
+    def embed_batch_with_spaces(self, texts: Sequence[str], dimension: int) -> Tuple[List[List[float]], List[str]]:
+        """Embed texts in one provider call, serving repeated and cached texts from the cache.
+
+        Returns the vectors and, per vector, the vector space it was embedded in.
+        """
+        keys = [self._cache_key(text, dimension) for text in texts]
+        preferred_space = self.provider.vector_space
+        vectors: Dict[str, List[float]] = {}
+        spaces: Dict[str, str] = {}
+        missing: Dict[str, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in vectors or key in missing:
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    vectors[key] = cached
+                    spaces[key] = preferred_space
+                    self.hits += 1
+                else:
+                    missing[key] = text
+                    self.misses += 1
+
+        if missing:
+            embedded, space = self.provider.embed_batch_with_space(list(missing.values()), dimension)
+            with self._lock:
+                for key, vector in zip(missing, embedded):
+                    vectors[key] = vector
+                    spaces[key] = space
+                    if space == preferred_space:
+                        self._cache[key] = vector
+                        self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return [vectors[key] for key in keys], [spaces[key] for key in keys]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "provider": self.provider.name,
+            "vector_space": self.provider.vector_space,
+            "fallback_batches": getattr(self.provider, "fallback_batches", 0),
+            "cache_entries": len(self._cache),
+            "cache_size": self.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    @staticmethod
+    def _cache_key(text: str, dimension: int) -> str:
+        return f"{dimension}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+def create_embedding_provider() -> IEmbeddingProvider:
+    """Build the provider selected by EMBEDDING_PROVIDER; Ollama falls back to offline hashing embeddings"""
+    if settings.EMBEDDING_PROVIDER == "ollama":
+        return FallbackEmbeddingProvider(
+            OllamaEmbeddingProvider(
+                base_url=settings.OLLAMA_BASE_URL or settings.OLLAMA_HOST,
+                model=settings.EMBEDDING_MODEL
+            ),
+            HashingEmbeddingProvider(),
+            retry_seconds=settings.EMBEDDING_FALLBACK_RETRY_SECONDS
+        )
+    return HashingEmbeddingProvider()
+
+
+# Shared by every VectorDatabaseService instance so cached embeddings are reused process-wide
+embedding_service = EmbeddingService(create_embedding_provider(), cache_size=settings.EMBEDDING_CACHE_SIZE)
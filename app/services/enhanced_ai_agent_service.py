@@ -4,15 +4,17 @@ Enhanced AI Agent Service with real-time data integration
 
 import asyncio
 import logging
-import threading
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from datetime import datetime
+from app.core.cache import get_cache
 from app.core.interfaces import IAIAgentService
 from app.services.web_search.web_search_factory import WebSearchFactory
 from app.services.social_media.social_media_factory import SocialMediaFactory
 from app.services.analytics.real_time_analytics import RealTimeAnalyticsService
 from app.services.influencer_marketing.influencer_marketing_service import InfluencerMarketingService
 from app.services.enhanced_ai_agent_service_v2 import EnhancedAIAgentServiceV2
+from app.services.llm_gateway import llm_gateway
+from app.services.thinking_filter import ThinkingStreamFilter
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -33,92 +35,33 @@ class EnhancedAIAgentService(IAIAgentService):
         self.ollama_model = settings.OLLAMA_MODEL
         self.ollama_base_url = settings.OLLAMA_BASE_URL
         
-        # Connection pooling for Ollama client
-        self._ollama_client = None
-        self._client_lock = threading.Lock()
-        
-        # Simple in-memory cache
-        self._cache = {}
-        self._cache_lock = threading.Lock()
-    
-    def _get_ollama_client(self):
-        """Get or create Ollama client with connection pooling"""
-        if self._ollama_client is None:
-            with self._client_lock:
-                if self._ollama_client is None:
-                    import ollama
-                    self._ollama_client = ollama.Client(host=self.ollama_base_url)
-                    logger.info(f"Created new Ollama client connection to {self.ollama_base_url}")
-        return self._ollama_client
-    
-    def _get_cache_key(self, key_type: str, **kwargs) -> str:
-        """Generate cache key"""
-        return f"{key_type}:{':'.join(f'{k}={v}' for k, v in sorted(kwargs.items()))}"
-    
-    def _get_from_cache(self, cache_key: str, max_age_seconds: int = 300) -> Optional[Any]:
-        """Get item from cache if not expired"""
-        with self._cache_lock:
-            if cache_key in self._cache:
-                cached_item = self._cache[cache_key]
-                if datetime.now().timestamp() - cached_item['timestamp'] < max_age_seconds:
-                    logger.info(f"Cache hit for key: {cache_key}")
-                    return cached_item['data']
-                else:
-                    # Remove expired item
-                    del self._cache[cache_key]
-                    logger.info(f"Cache expired for key: {cache_key}")
-        return None
-    
-    def _set_cache(self, cache_key: str, data: Any):
-        """Set item in cache"""
-        with self._cache_lock:
-            self._cache[cache_key] = {
-                'data': data,
-                'timestamp': datetime.now().timestamp()
-            }
-            logger.info(f"Cached data for key: {cache_key}")
+        self._cache = get_cache("enhanced_ai_agent", ttl_seconds=300)
     
     async def _get_trending_content_with_cache(self, platform: str):
         """Get trending content with caching"""
-        cache_key = self._get_cache_key('trending_content', platform=platform)
-        cached_data = self._get_from_cache(cache_key, max_age_seconds=600)  # 10 minutes cache
-        
-        if cached_data is not None:
-            logger.info(f"Cache hit for {platform} trending content: {len(cached_data)} items (TTL: 10 minutes)")
-            return cached_data
-        
-        logger.info(f"Cache miss for {platform} trending content, fetching fresh data from analytics service")
-        # Fetch fresh data
-        data = await self.analytics_service.get_trending_content(platform)
-        self._set_cache(cache_key, data)
-        logger.info(f"Cached {len(data)} trending items for {platform} (TTL: 10 minutes)")
+        data = await self._cache.get_or_set(
+            f"trending_content:platform={platform}",
+            lambda: self.analytics_service.get_trending_content(platform),
+            ttl_seconds=600  # 10 minutes cache
+        )
+        logger.info(f"Trending content for {platform}: {len(data)} items (TTL: 10 minutes)")
         return data
     
     async def _get_engagement_trends_with_cache(self, user_id: int, days: int = 30):
         """Get engagement trends with caching"""
-        cache_key = self._get_cache_key('engagement_trends', user_id=user_id, days=days)
-        cached_data = self._get_from_cache(cache_key, max_age_seconds=300)  # 5 minutes cache
-        
-        if cached_data is not None:
-            return cached_data
-        
-        # Fetch fresh data
-        data = await self.analytics_service.get_engagement_trends(user_id, days=days)
-        self._set_cache(cache_key, data)
-        return data
+        return await self._cache.get_or_set(
+            f"engagement_trends:days={days}:user_id={user_id}",
+            lambda: self.analytics_service.get_engagement_trends(user_id, days=days),
+            ttl_seconds=300  # 5 minutes cache
+        )
     
     async def _get_market_rates_with_cache(self, platform: str, content_type: str):
         """Get market rates with caching"""
-        cache_key = self._get_cache_key('market_rates', platform=platform, content_type=content_type)
-        cached_data = self._get_from_cache(cache_key, max_age_seconds=900)  # 15 minutes cache
-        
-        if cached_data is not None:
-            return cached_data
-        
-        # Fetch fresh data
-        data = await self.analytics_service.get_market_rates(platform, content_type)
-        self._set_cache(cache_key, data)
-        return data
+        return await self._cache.get_or_set(
+            f"market_rates:content_type={content_type}:platform={platform}",
+            lambda: self.analytics_service.get_market_rates(platform, content_type),
+            ttl_seconds=900  # 15 minutes cache
+        )
     
     async def execute_with_real_time_data(
         self, 
@@ -193,6 +136,63 @@ class EnhancedAIAgentService(IAIAgentService):
             logger.error(f"Enhanced AI agent execution failed: {e}")
             return self._get_fallback_response(agent_id, agent_type, str(e))
     
+    async def stream_with_real_time_data(
+        self, 
+        agent_id: int, 
+        prompt: str, 
+        context: Dict[str, Any],
+        real_time_data: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream agent output as events while Ollama generates it.
+        
+        Uses the direct Ollama path of the legacy implementation, since the V2
+        pipeline only returns complete responses. Thinking content is filtered
+        out incrementally.
+        """
+        agent_type = context.get('agent_type', 'general')
+        try:
+            enhanced_prompt = self._enhance_prompt_with_real_time_data(prompt, real_time_data, agent_type)
+            additional_context = await self._gather_additional_context(agent_type, context, real_time_data)
+            
+            yield {
+                "type": "start",
+                "agent_id": agent_id,
+                "agent_type": agent_type,
+                "focus_area": self._get_focus_area(agent_type)
+            }
+            
+            thinking_filter = ThinkingStreamFilter()
+            async for chunk in llm_gateway.stream_chat(
+                model=self.ollama_model,
+                messages=self._build_ollama_messages(enhanced_prompt, additional_context, agent_type),
+                options=self._ollama_options()
+            ):
+                content = thinking_filter.feed(chunk.get("message", {}).get("content", ""))
+                if content:
+                    yield {"type": "token", "content": content}
+            
+            content = thinking_filter.flush()
+            if content:
+                yield {"type": "token", "content": content}
+            
+            yield {
+                "type": "done",
+                "status": "success",
+                "real_time_data_used": {
+                    "data_types": list(real_time_data.keys()),
+                    "data_freshness": "real-time",
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+            
+        except Exception as e:
+            logger.error(f"Enhanced AI agent streaming failed: {e}")
+            yield {
+                "type": "error",
+                "status": "error",
+                "message": f"Unable to provide real-time recommendations due to: {e}. Please try again later."
+            }
+    
     async def get_enhanced_recommendations(
         self, 
         user_id: int, 
@@ -379,6 +379,23 @@ Use the real-time data above to provide current, actionable recommendations that
         
         return additional_context
     
+    def _build_ollama_messages(self, prompt: str, context: Dict[str, Any], agent_type: str) -> List[Dict[str, str]]:
+        """Build the system and user messages sent to Ollama"""
+        system_context = self._build_enhanced_system_context(agent_type, context)
+        logger.info(f"AI system context built with {len(system_context)} characters")
+        
+        return [
+            {"role": "system", "content": system_context},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _ollama_options(self) -> Dict[str, Any]:
+        return {
+            "temperature": settings.AI_AGENT_TEMPERATURE,
+            "top_p": settings.AI_AGENT_TOP_P,
+            "max_tokens": settings.AI_AGENT_MAX_TOKENS
+        }
+    
     async def _execute_with_ollama(
         self, 
         prompt: str, 
@@ -387,33 +404,18 @@ Use the real-time data above to provide current, actionable recommendations that
     ) -> str:
         """Execute with Ollama using enhanced prompt"""
         try:
-            import ollama
-            
             logger.info(f"AI starting to work on Internet data for agent type: {agent_type}")
             logger.info(f"AI prompt length: {len(prompt)} characters")
             logger.info(f"AI context data types: {list(context.keys())}")
             
-            # Build system context
-            system_context = self._build_enhanced_system_context(agent_type, context)
-            logger.info(f"AI system context built with {len(system_context)} characters")
-            
-            # Prepare messages
-            messages = [
-                {"role": "system", "content": system_context},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_ollama_messages(prompt, context, agent_type)
             
             logger.info(f"AI calling Ollama with model: {self.ollama_model}")
-            # Call Ollama using connection pool
-            client = self._get_ollama_client()
-            response = client.chat(
+            # Call Ollama through the shared async gateway
+            response = await llm_gateway.chat(
                 model=self.ollama_model,
                 messages=messages,
-                options={
-                    "temperature": settings.AI_AGENT_TEMPERATURE,
-                    "top_p": settings.AI_AGENT_TOP_P,
-                    "max_tokens": settings.AI_AGENT_MAX_TOKENS
-                }
+                options=self._ollama_options()
             )
             
             ai_response = response.get("message", {}).get("content", "")
@@ -3,13 +3,12 @@ Enhanced AI Agent Service V2 with Vector Database, MCP Tool Calling, and Smart C
 Following SOLID principles
 """
 
-import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from app.core.interfaces import IAIAgentService
 from app.services.ai_agent_interfaces import IEnhancedAIAgent, IDataRetriever, IContextManager, IToolCaller, IPromptBuilder, IAIExecutor
-from app.services.vector_db import VectorDatabaseService
+from app.services.vector_db import get_vector_db_service
 from app.services.mcp_client import MCPClient
 from app.services.ai_agent_vector_data_retriever import VectorDataRetriever
 from app.services.ai_agent_context_manager import AIAgentContextManager
@@ -28,7 +27,7 @@ class EnhancedAIAgentServiceV2(IAIAgentService, IEnhancedAIAgent):
     
     def __init__(self):
         # Initialize core services
-        self.vector_db = VectorDatabaseService()
+        self.vector_db = get_vector_db_service()
         self.mcp_client = MCPClient()
         
         # Initialize component services following SOLID principles
@@ -42,10 +41,6 @@ class EnhancedAIAgentServiceV2(IAIAgentService, IEnhancedAIAgent):
         self.web_search_factory = WebSearchFactory()
         self.analytics_service = RealTimeAnalyticsService()
         self.influencer_service = InfluencerMarketingService()
-        
-        # Simple in-memory cache
-        self._cache = {}
-        self._cache_lock = asyncio.Lock()
     
     async def process_request(self, user_id: int, agent_type: str, user_query: str) -> Dict[str, Any]:
         """Process user request with enhanced architecture"""
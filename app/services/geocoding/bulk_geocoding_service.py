@@ -0,0 +1,91 @@
+"""
+Bulk geocoding for onboarding many operational locations at once
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.services.geocoding.geocode_cache import geocode_cache, FORWARD
+from app.services.interfaces.geocoding_service_interface import IGeocodingService
+
+logger = logging.getLogger(__name__)
+
+
+class BulkGeocodingService:
+    """Single responsibility: Geocode a list of addresses, yielding results as they resolve.
+
+    Duplicate addresses (after normalization) are geocoded once. Cached results
+    are yielded first; misses go to the provider at most max_concurrency at a
+    time, so a large batch queues behind the provider throttle in small steps
+    rather than all at once.
+    """
+
+    def __init__(self, geocoding_service: IGeocodingService, max_concurrency: int):
+        self.geocoding_service = geocoding_service
+        self.max_concurrency = max_concurrency
+
+    async def geocode_stream(self, requests: Sequence[Tuple[str, Optional[str]]]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one "result" event per unique (address, country_code), then a "done" summary.
+
+        Each result lists the indexes of the requests it answers.
+        """
+        started = time.perf_counter()
+        groups: Dict[str, Dict[str, Any]] = {}
+        for index, (address, country_code) in enumerate(requests):
+            key = geocode_cache.forward_key(address, country_code)
+            group = groups.setdefault(key, {"address": address, "country_code": country_code, "indexes": []})
+            group["indexes"].append(index)
+
+        provider = self.geocoding_service.provider
+        cached = await geocode_cache.peek_many(provider, FORWARD, list(groups))
+        for key, result in cached.items():
+            yield self._result_event(groups[key], result, cached=True)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def resolve(key: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            async with semaphore:
+                group = groups[key]
+                return key, await self.geocoding_service.geocode_address(group["address"], group["country_code"])
+
+        tasks = [asyncio.create_task(resolve(key)) for key in groups if key not in cached]
+        found = len(cached)
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                key, result = await next_result
+                found += result is not None
+                yield self._result_event(groups[key], result, cached=False)
+        finally:
+            # The client may disconnect before every address is resolved
+            for task in tasks:
+                task.cancel()
+
+        logger.info(
+            f"BulkGeocodingService: {len(requests)} addresses, {len(groups)} unique, "
+            f"{len(cached)} cached, {len(tasks)} sent to {provider}"
+        )
+        yield {
+            "type": "done",
+            "total": len(requests),
+            "unique": len(groups),
+            "cached": len(cached),
+            "geocoded": len(tasks),
+            "found": found,
+            "not_found": len(groups) - found,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    @staticmethod
+    def _result_event(group: Dict[str, Any], result: Optional[Dict[str, Any]], cached: bool) -> Dict[str, Any]:
+        return {
+            "type": "result",
+            "indexes": group["indexes"],
+            "address": group["address"],
+            "country_code": group["country_code"],
+            "found": result is not None,
+            "cached": cached,
+            "result": result
+        }
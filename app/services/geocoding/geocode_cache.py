@@ -0,0 +1,164 @@
+"""
+Two-level cache for geocoding results: in process, then the geocode_cache table
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.db.database import get_db_session
+from app.db.models.location import GeocodeCacheEntry
+
+logger = logging.getLogger(__name__)
+
+FORWARD = "forward"
+REVERSE = "reverse"
+
+
+class _NoResult(Exception):
+    """Raised inside a cache load so an empty provider answer is not cached"""
+
+
+class GeocodeCache:
+    """Single responsibility: Remember provider answers for addresses and coordinates.
+
+    Forward lookups are keyed by the normalized address and country code, reverse
+    lookups by coordinates rounded to reverse_precision decimals, so nearby points
+    share an entry. Entries live in memory and, when persistent, in the
+    geocode_cache table so they survive restarts and are shared between workers.
+    Database errors are logged and treated as misses.
+    """
+
+    def __init__(self, ttl_seconds: float, reverse_precision: int, persistent: bool):
+        self.ttl_seconds = ttl_seconds
+        self.reverse_precision = reverse_precision
+        self.persistent = persistent
+        self.memory = get_cache("geocoding", ttl_seconds=ttl_seconds)
+        self._stats = {"db_hits": 0, "provider_calls": 0, "db_errors": 0}
+
+    @staticmethod
+    def forward_key(address: str, country_code: Optional[str] = None) -> str:
+        return f"{' '.join(address.lower().split())}|{(country_code or '').lower()}"[:255]
+
+    def reverse_key(self, latitude: float, longitude: float) -> str:
+        return f"{round(latitude, self.reverse_precision)},{round(longitude, self.reverse_precision)}"
+
+    async def lookup(
+        self,
+        provider: str,
+        lookup_type: str,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, calling loader (the provider) on a miss.
+
+        Concurrent lookups of the same key share one load. Empty results are not cached.
+        """
+        try:
+            return await self.memory.get_or_set(
+                f"{provider}:{lookup_type}:{key}",
+                lambda: self._load(provider, lookup_type, key, loader)
+            )
+        except _NoResult:
+            return None
+
+    async def peek_many(self, provider: str, lookup_type: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Cached results for whichever keys have one, reading the table in one query"""
+        found: Dict[str, Dict[str, Any]] = {}
+        for key in keys:
+            result = await self.memory.get(f"{provider}:{lookup_type}:{key}")
+            if result is not None:
+                found[key] = result
+
+        missing = [key for key in keys if key not in found]
+        if self.persistent and missing:
+            try:
+                async with get_db_session() as db:
+                    rows = (await db.execute(
+                        select(GeocodeCacheEntry.lookup_key, GeocodeCacheEntry.result).where(
+                            GeocodeCacheEntry.provider == provider,
+                            GeocodeCacheEntry.lookup_type == lookup_type,
+                            GeocodeCacheEntry.lookup_key.in_(missing),
+                            GeocodeCacheEntry.updated_at >= datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+                        )
+                    )).all()
+            except Exception as e:
+                self._stats["db_errors"] += 1
+                logger.warning(f"GeocodeCache: Bulk lookup of {len(missing)} {lookup_type} keys failed: {e}")
+                rows = []
+            for key, result in rows:
+                self._stats["db_hits"] += 1
+                found[key] = result
+                await self.memory.set(f"{provider}:{lookup_type}:{key}", result)
+        return found
+
+    async def _load(
+        self,
+        provider: str,
+        lookup_type: str,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        if self.persistent:
+            result = await self._read(provider, lookup_type, key)
+            if result is not None:
+                self._stats["db_hits"] += 1
+                return result
+
+        self._stats["provider_calls"] += 1
+        result = await loader()
+        if result is None:
+            raise _NoResult()
+        if self.persistent:
+            await self._write(provider, lookup_type, key, result)
+        return result
+
+    async def _read(self, provider: str, lookup_type: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            async with get_db_session() as db:
+                return (await db.execute(
+                    select(GeocodeCacheEntry.result).where(
+                        GeocodeCacheEntry.provider == provider,
+                        GeocodeCacheEntry.lookup_type == lookup_type,
+                        GeocodeCacheEntry.lookup_key == key,
+                        GeocodeCacheEntry.updated_at >= datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+                    )
+                )).scalar_one_or_none()
+        except Exception as e:
+            self._stats["db_errors"] += 1
+            logger.warning(f"GeocodeCache: Lookup failed for {lookup_type} '{key}': {e}")
+            return None
+
+    async def _write(self, provider: str, lookup_type: str, key: str, result: Dict[str, Any]) -> None:
+        try:
+            async with get_db_session() as db:
+                statement = insert(GeocodeCacheEntry).values(
+                    provider=provider,
+                    lookup_type=lookup_type,
+                    lookup_key=key,
+                    result=result
+                )
+                await db.execute(statement.on_conflict_do_update(
+                    constraint="uq_geocode_cache_lookup",
+                    set_={"result": statement.excluded.result, "updated_at": datetime.utcnow()}
+                ))
+                await db.commit()
+        except Exception as e:
+            self._stats["db_errors"] += 1
+            logger.warning(f"GeocodeCache: Store failed for {lookup_type} '{key}': {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "persistent": self.persistent, "memory": self.memory.stats()}
+
+
+# Shared by every geocoding service instance, whichever provider built it
+geocode_cache = GeocodeCache(
+    ttl_seconds=settings.GEOCODE_CACHE_TTL_DAYS * 86400,
+    reverse_precision=settings.GEOCODE_REVERSE_PRECISION,
+    persistent=settings.GEOCODE_CACHE_PERSISTENT
+)
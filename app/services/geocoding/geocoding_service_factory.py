@@ -2,12 +2,64 @@ from app.core.config import settings
 from app.services.interfaces.geocoding_service_interface import IGeocodingService, ILocationSearchInterface
 from app.services.geocoding.openstreetmap_service import OpenStreetMapService
 from app.services.geocoding.google_maps_service import GoogleMapsService
+from app.services.social_media.rate_limiter import SharedThrottle
+import asyncio
+import httpx
 import logging
+from typing import Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
 class GeocodingServiceFactory:
-    """Factory for creating geocoding services based on configuration"""
+    """Factory for creating geocoding services based on configuration.
+    
+    Services share one pooled httpx client per provider, and every OpenStreetMap
+    service shares one throttle whose slots are reserved in the shared rate limit
+    storage, so all workers together stay within Nominatim's usage policy.
+    """
+    
+    _clients: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+    # Requests are queued and spaced out across workers, never sent in a burst
+    nominatim_throttle = SharedThrottle("nominatim", settings.NOMINATIM_REQUESTS_PER_SECOND)
+    
+    @classmethod
+    def get_http_client(cls, provider: str) -> httpx.AsyncClient:
+        """Return the shared client for provider, creating it on first use"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        entry = cls._clients.get(provider)
+        # Pooled connections belong to the loop they were opened on
+        if entry is not None and entry[0] is loop and not entry[1].is_closed:
+            return entry[1]
+        
+        client = httpx.AsyncClient(
+            timeout=settings.GEOCODING_HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.GEOCODING_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GEOCODING_HTTP_MAX_CONNECTIONS
+            )
+        )
+        cls._clients[provider] = (loop, client)
+        logger.info(f"Created pooled HTTP client for {provider} geocoding")
+        return client
+    
+    @classmethod
+    async def close_clients(cls) -> None:
+        """Close the pooled clients; awaited on application shutdown"""
+        for provider, (_, client) in list(cls._clients.items()):
+            await client.aclose()
+            del cls._clients[provider]
+    
+    @classmethod
+    def _create(cls, provider: str):
+        if provider == "google":
+            return GoogleMapsService(client=cls.get_http_client("google"))
+        return OpenStreetMapService(
+            client=cls.get_http_client("openstreetmap"),
+            throttle=cls.nominatim_throttle
+        )
     
     @staticmethod
     def create_geocoding_service() -> IGeocodingService:
@@ -16,13 +68,13 @@ class GeocodingServiceFactory:
         
         if provider == "openstreetmap":
             logger.info("Using OpenStreetMap geocoding service")
-            return OpenStreetMapService()
+            return GeocodingServiceFactory._create("openstreetmap")
         elif provider == "google":
             logger.info("Using Google Maps geocoding service")
-            return GoogleMapsService()
+            return GeocodingServiceFactory._create("google")
         else:
             logger.warning(f"Unknown geocoding provider: {provider}. Falling back to OpenStreetMap")
-            return OpenStreetMapService()
+            return GeocodingServiceFactory._create("openstreetmap")
     
     @staticmethod
     def create_location_search_service() -> ILocationSearchInterface:
@@ -31,10 +83,10 @@ class GeocodingServiceFactory:
         
         if provider == "openstreetmap":
             logger.info("Using OpenStreetMap location search service")
-            return OpenStreetMapService()
+            return GeocodingServiceFactory._create("openstreetmap")
         elif provider == "google":
             logger.info("Using Google Maps location search service")
-            return GoogleMapsService()
+            return GeocodingServiceFactory._create("google")
         else:
             logger.warning(f"Unknown location search provider: {provider}. Falling back to OpenStreetMap")
-            return OpenStreetMapService()
+            return GeocodingServiceFactory._create("openstreetmap")
@@ -3,21 +3,38 @@ import asyncio
 from typing import Dict, List, Optional, Tuple
 from app.services.interfaces.geocoding_service_interface import IGeocodingService, ILocationSearchInterface
 from app.core.config import settings
+from app.services.geocoding.geocode_cache import geocode_cache, FORWARD, REVERSE
 import logging
 
 logger = logging.getLogger(__name__)
 
 class GoogleMapsService(IGeocodingService, ILocationSearchInterface):
-    """Google Maps implementation of geocoding and location search services"""
+    """Google Maps implementation of geocoding and location search services.
+
+    Built by GeocodingServiceFactory with the shared HTTP client; geocoding
+    results are served from geocode_cache when possible.
+    """
+    
+    provider = "google"
     
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient):
         self.api_key = settings.GOOGLE_MAPS_API_KEY
         self.base_url = settings.GOOGLE_MAPS_BASE_URL
+        self.client = client
         
         if not self.api_key:
             raise ValueError("Google Maps API key is required")
     
     async def geocode_address(self, address: str, country_code: Optional[str] = None) -> Optional[Dict]:
+        """Convert address to coordinates, from the geocode cache when possible"""
+        return await geocode_cache.lookup(
+            self.provider,
+            FORWARD,
+            geocode_cache.forward_key(address, country_code),
+            lambda: self._geocode_address(address, country_code)
+        )
+    
+    async def _geocode_address(self, address: str, country_code: Optional[str] = None) -> Optional[Dict]:
         """Convert address to coordinates using Google Maps Geocoding API"""
         try:
             params = {
@@ -29,39 +46,47 @@ class GoogleMapsService(IGeocodingService, ILocationSearchInterface):
             if country_code:
                 params["components"] = f"country:{country_code}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/maps/api/geocode/json",
-                    params=params
-                )
-                response.raise_for_status()
+            response = await self.client.get(
+                f"{self.base_url}/maps/api/geocode/json",
+                params=params
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            if data["status"] == "OK" and data["results"]:
+                result = data["results"][0]
+                location = result["geometry"]["location"]
                 
-                data = response.json()
-                if data["status"] == "OK" and data["results"]:
-                    result = data["results"][0]
-                    location = result["geometry"]["location"]
-                    
-                    # Extract address components
-                    address_components = result.get("address_components", [])
-                    address_data = self._extract_address_components(address_components)
-                    
-                    return {
-                        "latitude": location["lat"],
-                        "longitude": location["lng"],
-                        "display_name": result["formatted_address"],
-                        "city": address_data.get("city"),
-                        "region": address_data.get("state"),
-                        "country": address_data.get("country"),
-                        "postcode": address_data.get("postal_code"),
-                        "country_code": address_data.get("country_code", "").upper()
-                    }
-                return None
+                # Extract address components
+                address_components = result.get("address_components", [])
+                address_data = self._extract_address_components(address_components)
                 
+                return {
+                    "latitude": location["lat"],
+                    "longitude": location["lng"],
+                    "display_name": result["formatted_address"],
+                    "city": address_data.get("city"),
+                    "region": address_data.get("state"),
+                    "country": address_data.get("country"),
+                    "postcode": address_data.get("postal_code"),
+                    "country_code": address_data.get("country_code", "").upper()
+                }
+            return None
+            
         except Exception as e:
             logger.error(f"Google Maps geocoding error: {e}")
             return None
     
     async def reverse_geocode(self, latitude: float, longitude: float) -> Optional[Dict]:
+        """Convert coordinates to address, from the geocode cache when possible"""
+        return await geocode_cache.lookup(
+            self.provider,
+            REVERSE,
+            geocode_cache.reverse_key(latitude, longitude),
+            lambda: self._reverse_geocode(latitude, longitude)
+        )
+    
+    async def _reverse_geocode(self, latitude: float, longitude: float) -> Optional[Dict]:
         """Convert coordinates to address using Google Maps Reverse Geocoding API"""
         try:
             params = {
@@ -70,29 +95,28 @@ class GoogleMapsService(IGeocodingService, ILocationSearchInterface):
                 "output": "json"
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/maps/api/geocode/json",
-                    params=params
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                if data["status"] == "OK" and data["results"]:
-                    result = data["results"][0]
-                    address_components = result.get("address_components", [])
-                    address_data = self._extract_address_components(address_components)
-                    
-                    return {
-                        "display_name": result["formatted_address"],
-                        "city": address_data.get("city"),
-                        "region": address_data.get("state"),
-                        "country": address_data.get("country"),
-                        "postcode": address_data.get("postal_code"),
-                        "country_code": address_data.get("country_code", "").upper()
-                    }
-                return None
+            response = await self.client.get(
+                f"{self.base_url}/maps/api/geocode/json",
+                params=params
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            if data["status"] == "OK" and data["results"]:
+                result = data["results"][0]
+                address_components = result.get("address_components", [])
+                address_data = self._extract_address_components(address_components)
                 
+                return {
+                    "display_name": result["formatted_address"],
+                    "city": address_data.get("city"),
+                    "region": address_data.get("state"),
+                    "country": address_data.get("country"),
+                    "postcode": address_data.get("postal_code"),
+                    "country_code": address_data.get("country_code", "").upper()
+                }
+            return None
+            
         except Exception as e:
             logger.error(f"Google Maps reverse geocoding error: {e}")
             return None
@@ -106,24 +130,23 @@ class GoogleMapsService(IGeocodingService, ILocationSearchInterface):
                 "output": "json"
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/maps/api/place/autocomplete/json",
-                    params=params
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                if data["status"] == "OK":
-                    results = []
-                    for place in data["predictions"][:limit]:
-                        # Get place details for coordinates
-                        place_details = await self._get_place_details(place["place_id"])
-                        if place_details:
-                            results.append(place_details)
-                    return results
-                return []
-                
+            response = await self.client.get(
+                f"{self.base_url}/maps/api/place/autocomplete/json",
+                params=params
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            if data["status"] == "OK":
+                results = []
+                for place in data["predictions"][:limit]:
+                    # Get place details for coordinates
+                    place_details = await self._get_place_details(place["place_id"])
+                    if place_details:
+                        results.append(place_details)
+                return results
+            return []
+            
         except Exception as e:
             logger.error(f"Google Maps location search error: {e}")
             return []
@@ -138,31 +161,30 @@ class GoogleMapsService(IGeocodingService, ILocationSearchInterface):
                 "output": "json"
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/maps/api/place/details/json",
-                    params=params
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                if data["status"] == "OK":
-                    result = data["result"]
-                    location = result["geometry"]["location"]
-                    address_components = result.get("address_components", [])
-                    address_data = self._extract_address_components(address_components)
-                    
-                    return {
-                        "display_name": result["formatted_address"],
-                        "latitude": location["lat"],
-                        "longitude": location["lng"],
-                        "city": address_data.get("city"),
-                        "region": address_data.get("state"),
-                        "country": address_data.get("country"),
-                        "country_code": address_data.get("country_code", "").upper()
-                    }
-                return None
+            response = await self.client.get(
+                f"{self.base_url}/maps/api/place/details/json",
+                params=params
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            if data["status"] == "OK":
+                result = data["result"]
+                location = result["geometry"]["location"]
+                address_components = result.get("address_components", [])
+                address_data = self._extract_address_components(address_components)
                 
+                return {
+                    "display_name": result["formatted_address"],
+                    "latitude": location["lat"],
+                    "longitude": location["lng"],
+                    "city": address_data.get("city"),
+                    "region": address_data.get("state"),
+                    "country": address_data.get("country"),
+                    "country_code": address_data.get("country_code", "").upper()
+                }
+            return None
+            
         except Exception as e:
             logger.error(f"Google Maps place details error: {e}")
             return None
@@ -2,20 +2,48 @@ import httpx
 import asyncio
 from typing import Dict, List, Optional, Tuple
 from app.services.interfaces.geocoding_service_interface import IGeocodingService, ILocationSearchInterface
+from app.services.geocoding.geocode_cache import geocode_cache, FORWARD, REVERSE
+from app.services.social_media.rate_limiter import SharedThrottle
+from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 class OpenStreetMapService(IGeocodingService, ILocationSearchInterface):
-    """OpenStreetMap implementation of geocoding and location search services"""
+    """OpenStreetMap implementation of geocoding and location search services.
+
+    Built by GeocodingServiceFactory with the shared HTTP client and Nominatim
+    throttle; geocoding results are served from geocode_cache when possible.
+    """
+    
+    provider = "openstreetmap"
     
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient, throttle: Optional[SharedThrottle] = None):
         self.base_url = "https://nominatim.openstreetmap.org"
         self.headers = {
             "User-Agent": "ViralTogether/1.0 (https://viraltogether.com; contact@viraltogether.com)"
         }
+        self.client = client
+        self.throttle = throttle
+    
+    async def _get(self, path: str, params: Dict):
+        """GET a Nominatim endpoint, waiting for a throttle slot first"""
+        if self.throttle is not None:
+            await self.throttle.acquire(settings.NOMINATIM_MAX_WAIT_SECONDS)
+        response = await self.client.get(f"{self.base_url}{path}", params=params, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
     
     async def geocode_address(self, address: str, country_code: Optional[str] = None) -> Optional[Dict]:
+        """Convert address to coordinates, from the geocode cache when possible"""
+        return await geocode_cache.lookup(
+            self.provider,
+            FORWARD,
+            geocode_cache.forward_key(address, country_code),
+            lambda: self._geocode_address(address, country_code)
+        )
+    
+    async def _geocode_address(self, address: str, country_code: Optional[str] = None) -> Optional[Dict]:
         """Convert address to coordinates using Nominatim API"""
         try:
             params = {
@@ -28,36 +56,37 @@ class OpenStreetMapService(IGeocodingService, ILocationSearchInterface):
             if country_code:
                 params["countrycodes"] = country_code
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/search",
-                    params=params,
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                if data:
-                    location = data[0]
-                    return {
-                        "latitude": float(location["lat"]),
-                        "longitude": float(location["lon"]),
-                        "display_name": location["display_name"],
-                        "city": location.get("address", {}).get("city") or 
-                               location.get("address", {}).get("town") or
-                               location.get("address", {}).get("village"),
-                        "region": location.get("address", {}).get("state"),
-                        "country": location.get("address", {}).get("country"),
-                        "postcode": location.get("address", {}).get("postcode"),
-                        "country_code": location.get("address", {}).get("country_code", "").upper()
-                    }
-                return None
+            data = await self._get("/search", params)
+            if data:
+                location = data[0]
+                return {
+                    "latitude": float(location["lat"]),
+                    "longitude": float(location["lon"]),
+                    "display_name": location["display_name"],
+                    "city": location.get("address", {}).get("city") or 
+                           location.get("address", {}).get("town") or
+                           location.get("address", {}).get("village"),
+                    "region": location.get("address", {}).get("state"),
+                    "country": location.get("address", {}).get("country"),
+                    "postcode": location.get("address", {}).get("postcode"),
+                    "country_code": location.get("address", {}).get("country_code", "").upper()
+                }
+            return None
                 
         except Exception as e:
             logger.error(f"Geocoding error: {e}")
             return None
     
     async def reverse_geocode(self, latitude: float, longitude: float) -> Optional[Dict]:
+        """Convert coordinates to address, from the geocode cache when possible"""
+        return await geocode_cache.lookup(
+            self.provider,
+            REVERSE,
+            geocode_cache.reverse_key(latitude, longitude),
+            lambda: self._reverse_geocode(latitude, longitude)
+        )
+    
+    async def _reverse_geocode(self, latitude: float, longitude: float) -> Optional[Dict]:
         """Convert coordinates to address using Nominatim API"""
         try:
             params = {
@@ -67,26 +96,18 @@ class OpenStreetMapService(IGeocodingService, ILocationSearchInterface):
                 "addressdetails": 1
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/reverse",
-                    params=params,
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                if data:
-                    address = data.get("address", {})
-                    return {
-                        "display_name": data["display_name"],
-                        "city": address.get("city") or address.get("town") or address.get("village"),
-                        "region": address.get("state"),
-                        "country": address.get("country"),
-                        "postcode": address.get("postcode"),
-                        "country_code": address.get("country_code", "").upper()
-                    }
-                return None
+            data = await self._get("/reverse", params)
+            if data:
+                address = data.get("address", {})
+                return {
+                    "display_name": data["display_name"],
+                    "city": address.get("city") or address.get("town") or address.get("village"),
+                    "region": address.get("state"),
+                    "country": address.get("country"),
+                    "postcode": address.get("postcode"),
+                    "country_code": address.get("country_code", "").upper()
+                }
+            return None
                 
         except Exception as e:
             logger.error(f"Reverse geocoding error: {e}")
@@ -102,29 +123,21 @@ class OpenStreetMapService(IGeocodingService, ILocationSearchInterface):
                 "addressdetails": 1
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/search",
-                    params=params,
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                return [
-                    {
-                        "display_name": item["display_name"],
-                        "latitude": float(item["lat"]),
-                        "longitude": float(item["lon"]),
-                        "city": item.get("address", {}).get("city") or 
-                               item.get("address", {}).get("town") or
-                               item.get("address", {}).get("village"),
-                        "region": item.get("address", {}).get("state"),
-                        "country": item.get("address", {}).get("country"),
-                        "country_code": item.get("address", {}).get("country_code", "").upper()
-                    }
-                    for item in data
-                ]
+            data = await self._get("/search", params)
+            return [
+                {
+                    "display_name": item["display_name"],
+                    "latitude": float(item["lat"]),
+                    "longitude": float(item["lon"]),
+                    "city": item.get("address", {}).get("city") or 
+                           item.get("address", {}).get("town") or
+                           item.get("address", {}).get("village"),
+                    "region": item.get("address", {}).get("state"),
+                    "country": item.get("address", {}).get("country"),
+                    "country_code": item.get("address", {}).get("country_code", "").upper()
+                }
+                for item in data
+            ]
                 
         except Exception as e:
             logger.error(f"Location search error: {e}")
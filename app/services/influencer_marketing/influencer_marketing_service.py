@@ -6,6 +6,7 @@ import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from app.core.cache import get_cache
 from app.core.interfaces import IInfluencerMarketingService, IRealTimeDataService
 from app.services.analytics.real_time_analytics import RealTimeAnalyticsService
 from app.services.web_search.web_search_factory import WebSearchFactory
@@ -19,65 +20,15 @@ class InfluencerMarketingService(IInfluencerMarketingService, IRealTimeDataServi
     def __init__(self):
         self.analytics_service = RealTimeAnalyticsService()
         self.web_search_factory = WebSearchFactory()
-        self.cache = {}
-        self.cache_ttl = 600  # 10 minutes
+        self.cache = get_cache("influencer_marketing", ttl_seconds=600)  # 10 minutes
     
     async def get_brand_partnership_opportunities(self, user_id: int) -> List[Dict[str, Any]]:
         """Get brand partnership opportunities"""
         try:
-            cache_key = f"brand_opportunities_{user_id}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]['data']
-            
-            # Get user profile and metrics
-            user_profile = await self._get_user_profile(user_id)
-            engagement_trends = await self.analytics_service.get_engagement_trends(user_id, days=30)
-            
-            # Search for brand opportunities
-            search_service = self.web_search_factory.create_search_service()
-            
-            async with search_service:
-                # Search for brand partnership opportunities
-                opportunities = []
-                
-                # Search for brands looking for influencers
-                brand_search_queries = [
-                    f"brands looking for {user_profile.get('niche', 'influencers')} influencers",
-                    f"brand partnerships {user_profile.get('platform', 'social media')}",
-                    f"influencer marketing opportunities {user_profile.get('location', '')}",
-                    f"brand collaborations {user_profile.get('follower_range', '')} followers"
-                ]
-                
-                for query in brand_search_queries:
-                    search_results = await search_service.search(query, max_results=5)
-                    
-                    for result in search_results:
-                        opportunity = {
-                            'title': result.title,
-                            'description': result.snippet,
-                            'url': result.url,
-                            'source': result.source,
-                            'relevance_score': self._calculate_relevance_score(result, user_profile),
-                            'opportunity_type': self._classify_opportunity_type(result),
-                            'requirements': self._extract_requirements(result),
-                            'compensation_range': self._extract_compensation_range(result),
-                            'discovered_at': datetime.now()
-                        }
-                        opportunities.append(opportunity)
-            
-            # Sort by relevance score
-            opportunities.sort(key=lambda x: x['relevance_score'], reverse=True)
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': opportunities[:20],  # Limit to top 20
-                'timestamp': datetime.now()
-            }
-            
-            return opportunities[:20]
-            
+            return await self.cache.get_or_set(
+                f"brand_opportunities_{user_id}",
+                lambda: self._find_brand_partnership_opportunities(user_id)
+            )
         except Exception as e:
             logger.error(f"Failed to get brand partnership opportunities: {e}")
             return []
@@ -85,48 +36,10 @@ class InfluencerMarketingService(IInfluencerMarketingService, IRealTimeDataServi
     async def get_content_recommendations(self, user_id: int, platform: str) -> List[Dict[str, Any]]:
         """Get content recommendations based on trends"""
         try:
-            cache_key = f"content_recommendations_{user_id}_{platform}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]['data']
-            
-            # Get trending content for the platform
-            trending_content = await self.analytics_service.get_trending_content(platform)
-            
-            # Get user's niche and audience
-            user_profile = await self._get_user_profile(user_id)
-            
-            # Generate content recommendations
-            recommendations = []
-            
-            for trend in trending_content:
-                if self._is_relevant_to_user(trend, user_profile):
-                    recommendation = {
-                        'trending_hashtag': trend.hashtag,
-                        'platform': platform,
-                        'trend_score': trend.trend_score,
-                        'engagement_rate': trend.engagement_rate,
-                        'content_ideas': self._generate_content_ideas(trend, user_profile),
-                        'posting_timing': self._get_optimal_posting_time(platform),
-                        'hashtag_strategy': self._get_hashtag_strategy(trend),
-                        'content_format': self._get_optimal_content_format(platform),
-                        'estimated_reach': self._estimate_reach(user_profile, trend),
-                        'discovered_at': datetime.now()
-                    }
-                    recommendations.append(recommendation)
-            
-            # Sort by trend score and relevance
-            recommendations.sort(key=lambda x: x['trend_score'], reverse=True)
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': recommendations[:15],  # Limit to top 15
-                'timestamp': datetime.now()
-            }
-            
-            return recommendations[:15]
-            
+            return await self.cache.get_or_set(
+                f"content_recommendations_{user_id}_{platform}",
+                lambda: self._build_content_recommendations(user_id, platform)
+            )
         except Exception as e:
             logger.error(f"Failed to get content recommendations: {e}")
             return []
@@ -134,56 +47,10 @@ class InfluencerMarketingService(IInfluencerMarketingService, IRealTimeDataServi
     async def get_pricing_recommendations(self, user_id: int) -> Dict[str, Any]:
         """Get pricing recommendations based on market analysis"""
         try:
-            cache_key = f"pricing_recommendations_{user_id}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]['data']
-            
-            # Get user metrics and market rates
-            user_profile = await self._get_user_profile(user_id)
-            engagement_trends = await self.analytics_service.get_engagement_trends(user_id, days=30)
-            
-            # Get market rates for user's platforms
-            market_rates = []
-            for platform in user_profile.get('platforms', []):
-                platform_rates = await self.analytics_service.get_market_rates(platform, 'sponsored_post')
-                market_rates.extend(platform_rates)
-            
-            # Calculate recommended pricing
-            pricing_recommendations = {
-                'current_metrics': {
-                    'average_engagement_rate': self._calculate_average_engagement(engagement_trends),
-                    'follower_count': user_profile.get('total_followers', 0),
-                    'platforms': user_profile.get('platforms', [])
-                },
-                'market_analysis': {
-                    'average_market_rates': self._calculate_average_market_rates(market_rates),
-                    'rate_trends': self._analyze_rate_trends(market_rates),
-                    'competitive_positioning': self._analyze_competitive_position(user_profile, market_rates)
-                },
-                'recommended_rates': {
-                    'sponsored_post': self._calculate_sponsored_post_rate(user_profile, market_rates),
-                    'story_post': self._calculate_story_post_rate(user_profile, market_rates),
-                    'video_content': self._calculate_video_content_rate(user_profile, market_rates),
-                    'long_term_partnership': self._calculate_long_term_rate(user_profile, market_rates)
-                },
-                'pricing_strategy': {
-                    'value_proposition': self._generate_value_proposition(user_profile),
-                    'negotiation_tips': self._get_negotiation_tips(user_profile, market_rates),
-                    'rate_adjustment_factors': self._get_rate_adjustment_factors(user_profile)
-                },
-                'generated_at': datetime.now()
-            }
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': pricing_recommendations,
-                'timestamp': datetime.now()
-            }
-            
-            return pricing_recommendations
-            
+            return await self.cache.get_or_set(
+                f"pricing_recommendations_{user_id}",
+                lambda: self._build_pricing_recommendations(user_id)
+            )
         except Exception as e:
             logger.error(f"Failed to get pricing recommendations: {e}")
             return {}
@@ -191,82 +58,10 @@ class InfluencerMarketingService(IInfluencerMarketingService, IRealTimeDataServi
     async def get_growth_strategies(self, user_id: int) -> List[Dict[str, Any]]:
         """Get growth strategies based on current trends"""
         try:
-            cache_key = f"growth_strategies_{user_id}"
-            
-            # Check cache first
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]['data']
-            
-            # Get user profile and competitor analysis
-            user_profile = await self._get_user_profile(user_id)
-            competitors = user_profile.get('competitors', [])
-            competitor_analysis = await self.analytics_service.get_competitor_analysis(user_id, competitors)
-            
-            # Get trending content across platforms
-            all_trending = []
-            for platform in user_profile.get('platforms', []):
-                trending = await self.analytics_service.get_trending_content(platform)
-                all_trending.extend(trending)
-            
-            # Generate growth strategies
-            strategies = []
-            
-            # Content strategy
-            content_strategy = {
-                'strategy_type': 'content_optimization',
-                'title': 'Content Optimization Strategy',
-                'description': 'Optimize content based on trending topics and competitor analysis',
-                'action_items': self._generate_content_action_items(all_trending, competitor_analysis),
-                'expected_impact': '15-25% engagement increase',
-                'time_to_implement': '2-4 weeks',
-                'priority': 'high'
-            }
-            strategies.append(content_strategy)
-            
-            # Engagement strategy
-            engagement_strategy = {
-                'strategy_type': 'engagement_optimization',
-                'title': 'Engagement Optimization Strategy',
-                'description': 'Improve engagement rates through better audience interaction',
-                'action_items': self._generate_engagement_action_items(user_profile, competitor_analysis),
-                'expected_impact': '10-20% engagement rate increase',
-                'time_to_implement': '1-2 weeks',
-                'priority': 'high'
-            }
-            strategies.append(engagement_strategy)
-            
-            # Growth strategy
-            growth_strategy = {
-                'strategy_type': 'audience_growth',
-                'title': 'Audience Growth Strategy',
-                'description': 'Expand reach through strategic partnerships and content diversification',
-                'action_items': self._generate_growth_action_items(user_profile, all_trending),
-                'expected_impact': '20-30% follower growth',
-                'time_to_implement': '4-6 weeks',
-                'priority': 'medium'
-            }
-            strategies.append(growth_strategy)
-            
-            # Monetization strategy
-            monetization_strategy = {
-                'strategy_type': 'monetization_optimization',
-                'title': 'Monetization Strategy',
-                'description': 'Optimize revenue through better pricing and partnership strategies',
-                'action_items': self._generate_monetization_action_items(user_profile),
-                'expected_impact': '25-40% revenue increase',
-                'time_to_implement': '3-4 weeks',
-                'priority': 'medium'
-            }
-            strategies.append(monetization_strategy)
-            
-            # Cache the results
-            self.cache[cache_key] = {
-                'data': strategies,
-                'timestamp': datetime.now()
-            }
-            
-            return strategies
-            
+            return await self.cache.get_or_set(
+                f"growth_strategies_{user_id}",
+                lambda: self._build_growth_strategies(user_id)
+            )
         except Exception as e:
             logger.error(f"Failed to get growth strategies: {e}")
             return []
@@ -327,15 +122,182 @@ class InfluencerMarketingService(IInfluencerMarketingService, IRealTimeDataServi
             return {}
     
     # Helper methods
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache entry is still valid"""
-        if cache_key not in self.cache:
-            return False
+    async def _find_brand_partnership_opportunities(self, user_id: int) -> List[Dict[str, Any]]:
+        # Get user profile and metrics
+        user_profile = await self._get_user_profile(user_id)
+        engagement_trends = await self.analytics_service.get_engagement_trends(user_id, days=30)
+        
+        # Search for brand opportunities
+        search_service = self.web_search_factory.create_search_service()
+        
+        async with search_service:
+            # Search for brand partnership opportunities
+            opportunities = []
+            
+            # Search for brands looking for influencers
+            brand_search_queries = [
+                f"brands looking for {user_profile.get('niche', 'influencers')} influencers",
+                f"brand partnerships {user_profile.get('platform', 'social media')}",
+                f"influencer marketing opportunities {user_profile.get('location', '')}",
+                f"brand collaborations {user_profile.get('follower_range', '')} followers"
+            ]
+            
+            for query in brand_search_queries:
+                search_results = await search_service.search(query, max_results=5)
+                
+                for result in search_results:
+                    opportunity = {
+                        'title': result.title,
+                        'description': result.snippet,
+                        'url': result.url,
+                        'source': result.source,
+                        'relevance_score': self._calculate_relevance_score(result, user_profile),
+                        'opportunity_type': self._classify_opportunity_type(result),
+                        'requirements': self._extract_requirements(result),
+                        'compensation_range': self._extract_compensation_range(result),
+                        'discovered_at': datetime.now()
+                    }
+                    opportunities.append(opportunity)
+        
+        # Sort by relevance score
+        opportunities.sort(key=lambda x: x['relevance_score'], reverse=True)
+        
+        return opportunities[:20]
+    
+    async def _build_content_recommendations(self, user_id: int, platform: str) -> List[Dict[str, Any]]:
+        # Get trending content for the platform
+        trending_content = await self.analytics_service.get_trending_content(platform)
+        
+        # Get user's niche and audience
+        user_profile = await self._get_user_profile(user_id)
         
-        cache_entry = self.cache[cache_key]
-        age = (datetime.now() - cache_entry['timestamp']).seconds
+        # Generate content recommendations
+        recommendations = []
+        
+        for trend in trending_content:
+            if self._is_relevant_to_user(trend, user_profile):
+                recommendation = {
+                    'trending_hashtag': trend.hashtag,
+                    'platform': platform,
+                    'trend_score': trend.trend_score,
+                    'engagement_rate': trend.engagement_rate,
+                    'content_ideas': self._generate_content_ideas(trend, user_profile),
+                    'posting_timing': self._get_optimal_posting_time(platform),
+                    'hashtag_strategy': self._get_hashtag_strategy(trend),
+                    'content_format': self._get_optimal_content_format(platform),
+                    'estimated_reach': self._estimate_reach(user_profile, trend),
+                    'discovered_at': datetime.now()
+                }
+                recommendations.append(recommendation)
+        
+        # Sort by trend score and relevance
+        recommendations.sort(key=lambda x: x['trend_score'], reverse=True)
+        
+        return recommendations[:15]
+    
+    async def _build_pricing_recommendations(self, user_id: int) -> Dict[str, Any]:
+        # Get user metrics and market rates
+        user_profile = await self._get_user_profile(user_id)
+        engagement_trends = await self.analytics_service.get_engagement_trends(user_id, days=30)
+        
+        # Get market rates for user's platforms
+        market_rates = []
+        for platform in user_profile.get('platforms', []):
+            platform_rates = await self.analytics_service.get_market_rates(platform, 'sponsored_post')
+            market_rates.extend(platform_rates)
+        
+        # Calculate recommended pricing
+        pricing_recommendations = {
+            'current_metrics': {
+                'average_engagement_rate': self._calculate_average_engagement(engagement_trends),
+                'follower_count': user_profile.get('total_followers', 0),
+                'platforms': user_profile.get('platforms', [])
+            },
+            'market_analysis': {
+                'average_market_rates': self._calculate_average_market_rates(market_rates),
+                'rate_trends': self._analyze_rate_trends(market_rates),
+                'competitive_positioning': self._analyze_competitive_position(user_profile, market_rates)
+            },
+            'recommended_rates': {
+                'sponsored_post': self._calculate_sponsored_post_rate(user_profile, market_rates),
+                'story_post': self._calculate_story_post_rate(user_profile, market_rates),
+                'video_content': self._calculate_video_content_rate(user_profile, market_rates),
+                'long_term_partnership': self._calculate_long_term_rate(user_profile, market_rates)
+            },
+            'pricing_strategy': {
+                'value_proposition': self._generate_value_proposition(user_profile),
+                'negotiation_tips': self._get_negotiation_tips(user_profile, market_rates),
+                'rate_adjustment_factors': self._get_rate_adjustment_factors(user_profile)
+            },
+            'generated_at': datetime.now()
+        }
+        
+        return pricing_recommendations
+    
+    async def _build_growth_strategies(self, user_id: int) -> List[Dict[str, Any]]:
+        # Get user profile and competitor analysis
+        user_profile = await self._get_user_profile(user_id)
+        competitors = user_profile.get('competitors', [])
+        competitor_analysis = await self.analytics_service.get_competitor_analysis(user_id, competitors)
+        
+        # Get trending content across platforms
+        all_trending = []
+        for platform in user_profile.get('platforms', []):
+            trending = await self.analytics_service.get_trending_content(platform)
+            all_trending.extend(trending)
+        
+        # Generate growth strategies
+        strategies = []
+        
+        # Content strategy
+        content_strategy = {
+            'strategy_type': 'content_optimization',
+            'title': 'Content Optimization Strategy',
+            'description': 'Optimize content based on trending topics and competitor analysis',
+            'action_items': self._generate_content_action_items(all_trending, competitor_analysis),
+            'expected_impact': '15-25% engagement increase',
+            'time_to_implement': '2-4 weeks',
+            'priority': 'high'
+        }
+        strategies.append(content_strategy)
+        
+        # Engagement strategy
+        engagement_strategy = {
+            'strategy_type': 'engagement_optimization',
+            'title': 'Engagement Optimization Strategy',
+            'description': 'Improve engagement rates through better audience interaction',
+            'action_items': self._generate_engagement_action_items(user_profile, competitor_analysis),
+            'expected_impact': '10-20% engagement rate increase',
+            'time_to_implement': '1-2 weeks',
+            'priority': 'high'
+        }
+        strategies.append(engagement_strategy)
+        
+        # Growth strategy
+        growth_strategy = {
+            'strategy_type': 'audience_growth',
+            'title': 'Audience Growth Strategy',
+            'description': 'Expand reach through strategic partnerships and content diversification',
+            'action_items': self._generate_growth_action_items(user_profile, all_trending),
+            'expected_impact': '20-30% follower growth',
+            'time_to_implement': '4-6 weeks',
+            'priority': 'medium'
+        }
+        strategies.append(growth_strategy)
+        
+        # Monetization strategy
+        monetization_strategy = {
+            'strategy_type': 'monetization_optimization',
+            'title': 'Monetization Strategy',
+            'description': 'Optimize revenue through better pricing and partnership strategies',
+            'action_items': self._generate_monetization_action_items(user_profile),
+            'expected_impact': '25-40% revenue increase',
+            'time_to_implement': '3-4 weeks',
+            'priority': 'medium'
+        }
+        strategies.append(monetization_strategy)
         
-        return age < self.cache_ttl
+        return strategies
     
     async def _get_user_profile(self, user_id: int) -> Dict[str, Any]:
         """Get user profile from database"""
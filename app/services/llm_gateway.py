@@ -0,0 +1,227 @@
+"""
+Shared async gateway for Ollama chat calls with per-model concurrency limits
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Sequence
+
+import ollama
+
+from app.core.config import settings
+from app.core.exceptions import LLMQueueTimeoutError
+from app.services.llm_response_cache import LLMCachePolicy, llm_response_cache
+
+logger = logging.getLogger(__name__)
+
+# Recent samples kept per model for the latency percentiles in stats()
+LATENCY_SAMPLE_SIZE = 500
+
+
+class _ModelLane:
+    """Concurrency slot pool and counters for one model"""
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.queued = 0
+        self.in_flight = 0
+        self.max_queue_depth_seen = 0
+        self.requests = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.queue_timeouts = 0
+        self.queue_waits_ms: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self.ttft_ms: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self.durations_ms: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queued,
+            "max_queue_depth_seen": self.max_queue_depth_seen,
+            "requests": self.requests,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "queue_timeouts": self.queue_timeouts,
+            "queue_wait_ms": _summarize(self.queue_waits_ms),
+            "time_to_first_token_ms": _summarize(self.ttft_ms),
+            "duration_ms": _summarize(self.durations_ms)
+        }
+
+
+def _summarize(samples: Sequence[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"avg": None, "p50": None, "p95": None}
+    ordered = sorted(samples)
+    return {
+        "avg": round(sum(ordered) / len(ordered), 1),
+        "p50": round(ordered[len(ordered) // 2], 1),
+        "p95": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 1)
+    }
+
+
+class LLMGateway:
+    """Single responsibility: Run Ollama chat requests without blocking the event loop.
+
+    Each model gets a bounded number of concurrent generations; further requests
+    wait in a queue for a free slot and fail with LLMQueueTimeoutError when the
+    queue is full or the wait exceeds queue_timeout_seconds. Requests are always
+    streamed from Ollama so time-to-first-token can be measured.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_concurrency_per_model: int,
+        max_queue_depth: int,
+        queue_timeout_seconds: float,
+        request_timeout_seconds: float
+    ):
+        self.base_url = base_url
+        self.max_concurrency_per_model = max_concurrency_per_model
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+        self._client: Optional[ollama.AsyncClient] = None
+        self._lanes: Dict[str, _ModelLane] = {}
+
+    def _get_client(self) -> ollama.AsyncClient:
+        if self._client is None:
+            self._client = ollama.AsyncClient(host=self.base_url, timeout=self.request_timeout_seconds)
+            logger.info(f"LLMGateway: Created async Ollama client for {self.base_url}")
+        return self._client
+
+    def _lane(self, model: str) -> _ModelLane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            lane = self._lanes[model] = _ModelLane(self.max_concurrency_per_model)
+        return lane
+
+    @asynccontextmanager
+    async def _slot(self, model: str):
+        """Wait for a concurrency slot for model, giving up after queue_timeout_seconds"""
+        lane = self._lane(model)
+        lane.requests += 1
+        queued_at = time.perf_counter()
+
+        if not lane.semaphore.locked():
+            # A slot is free; acquire() returns without suspending
+            await lane.semaphore.acquire()
+        else:
+            if lane.queued >= self.max_queue_depth:
+                lane.rejected += 1
+                raise LLMQueueTimeoutError(f"LLM queue for model '{model}' is full ({lane.queued} waiting)")
+
+            lane.queued += 1
+            lane.max_queue_depth_seen = max(lane.max_queue_depth_seen, lane.queued)
+            try:
+                await asyncio.wait_for(lane.semaphore.acquire(), timeout=self.queue_timeout_seconds)
+            except asyncio.TimeoutError:
+                lane.queue_timeouts += 1
+                raise LLMQueueTimeoutError(
+                    f"Timed out after {self.queue_timeout_seconds}s waiting for a '{model}' slot"
+                ) from None
+            finally:
+                lane.queued -= 1
+
+        lane.queue_waits_ms.append((time.perf_counter() - queued_at) * 1000)
+        lane.in_flight += 1
+        try:
+            yield lane
+        finally:
+            lane.in_flight -= 1
+            lane.semaphore.release()
+
+    async def stream_chat(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """Yield Ollama chat chunks as they are generated, holding a model slot until done"""
+        async with self._slot(model) as lane:
+            started = time.perf_counter()
+            first_token = False
+            try:
+                stream = await self._get_client().chat(
+                    model=model,
+                    messages=messages,
+                    options=options or {},
+                    stream=True
+                )
+                async for chunk in stream:
+                    if not first_token and chunk.get("message", {}).get("content"):
+                        first_token = True
+                        lane.ttft_ms.append((time.perf_counter() - started) * 1000)
+                    yield chunk
+            except BaseException:
+                lane.failed += 1
+                raise
+            lane.completed += 1
+            lane.durations_ms.append((time.perf_counter() - started) * 1000)
+
+    async def chat(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+        cache: Optional[LLMCachePolicy] = None
+    ) -> Dict[str, Any]:
+        """Run a chat request and return it in Ollama's non-streaming response shape.
+
+        Callers passing a cache policy may be answered from the response cache
+        without taking a model slot.
+        """
+        lookup = None
+        if cache is not None and settings.LLM_RESPONSE_CACHE_ENABLED:
+            lookup = await llm_response_cache.lookup(cache, model, messages, options)
+            if lookup.response is not None:
+                return lookup.response
+
+        parts: List[str] = []
+        tool_calls: List[Any] = []
+        final: Mapping[str, Any] = {}
+        async for chunk in self.stream_chat(model, messages, options):
+            message = chunk.get("message", {})
+            parts.append(message.get("content", ""))
+            tool_calls.extend(message.get("tool_calls") or [])
+            if chunk.get("done"):
+                final = chunk
+
+        response = dict(final)
+        response["model"] = final.get("model", model)
+        response["message"] = {"role": "assistant", "content": "".join(parts)}
+        if tool_calls:
+            response["message"]["tool_calls"] = tool_calls
+
+        # Tool calls depend on live tool results, so only plain answers are cached
+        if lookup is not None and response["message"]["content"] and not tool_calls:
+            llm_response_cache.store(lookup, response)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "max_concurrency_per_model": self.max_concurrency_per_model,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_timeout_seconds": self.queue_timeout_seconds,
+            "models": {model: lane.stats() for model, lane in self._lanes.items()},
+            "response_cache": llm_response_cache.stats()
+        }
+
+
+# Shared by every service so per-model limits apply across the whole process
+llm_gateway = LLMGateway(
+    base_url=settings.OLLAMA_BASE_URL or settings.OLLAMA_HOST,
+    max_concurrency_per_model=settings.LLM_MAX_CONCURRENCY_PER_MODEL,
+    max_queue_depth=settings.LLM_MAX_QUEUE_DEPTH,
+    queue_timeout_seconds=settings.LLM_QUEUE_TIMEOUT_SECONDS,
+    request_timeout_seconds=settings.LLM_REQUEST_TIMEOUT_SECONDS
+)
@@ -0,0 +1,228 @@
+"""
+Response cache placed in front of the LLM gateway
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.embedding_service import EmbeddingService, embedding_service
+
+logger = logging.getLogger(__name__)
+
+_whitespace = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class LLMCachePolicy:
+    """Per-call-site opt-in to the response cache.
+
+    Responses are shared between callers using the same namespace. With semantic
+    enabled, a request whose final user message is close enough in embedding space
+    to a cached one (and otherwise identical) reuses that response.
+    """
+    namespace: str
+    ttl_seconds: Optional[int] = None
+    semantic: bool = False
+
+
+@dataclass
+class _CacheEntry:
+    response: Dict[str, Any]
+    expires_at: float
+    namespace: str
+    group: str
+    vector: Optional[np.ndarray] = None
+
+
+@dataclass
+class CacheLookup:
+    """Result of LLMResponseCache.lookup, passed back to store() on a miss"""
+    policy: LLMCachePolicy
+    key: str
+    group: str
+    vector: Optional[np.ndarray] = None
+    response: Optional[Dict[str, Any]] = None
+
+
+class LLMResponseCache:
+    """Single responsibility: Reuse LLM responses for identical or near-identical requests.
+
+    Requests are keyed by (model, options, normalized messages). Entries expire
+    after their policy TTL and the least recently used entries are evicted once
+    max_entries is reached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        default_ttl_seconds: int,
+        similarity_threshold: float,
+        embedding_dimension: int,
+        embeddings: EmbeddingService
+    ):
+        self.max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.embedding_dimension = embedding_dimension
+        self._embeddings = embeddings
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        # Keys of semantic entries per group, for the near-duplicate scan
+        self._groups: Dict[str, Dict[str, np.ndarray]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    async def lookup(
+        self,
+        policy: LLMCachePolicy,
+        model: str,
+        messages: List[Dict[str, Any]],
+        options: Optional[Dict[str, Any]]
+    ) -> CacheLookup:
+        normalized = [
+            {"role": message.get("role", "user"), "content": self._normalize(message.get("content", ""))}
+            for message in messages
+        ]
+        prefix = normalized[:-1] if normalized else []
+        group = self._digest({"namespace": policy.namespace, "model": model, "options": options or {}, "prefix": prefix})
+        key = self._digest({"group": group, "last": normalized[-1] if normalized else None})
+        lookup = CacheLookup(policy=policy, key=key, group=group)
+        stats = self._namespace_stats(policy.namespace)
+
+        entry = self._live_entry(key)
+        if entry is not None:
+            stats["hits"] += 1
+            lookup.response = copy.deepcopy(entry.response)
+            return lookup
+
+        if policy.semantic and normalized and normalized[-1]["role"] == "user":
+            lookup.vector = await self._embed(normalized[-1]["content"])
+            match = self._nearest(group, lookup.vector) if lookup.vector is not None else None
+            if match is not None:
+                stats["semantic_hits"] += 1
+                self._entries.move_to_end(match)
+                lookup.response = copy.deepcopy(self._entries[match].response)
+                return lookup
+
+        stats["misses"] += 1
+        return lookup
+
+    def store(self, lookup: CacheLookup, response: Dict[str, Any]) -> None:
+        ttl = lookup.policy.ttl_seconds or self.default_ttl_seconds
+        self._drop(lookup.key)
+        self._entries[lookup.key] = _CacheEntry(
+            response=copy.deepcopy(response),
+            expires_at=time.monotonic() + ttl,
+            namespace=lookup.policy.namespace,
+            group=lookup.group,
+            vector=lookup.vector
+        )
+        if lookup.vector is not None:
+            self._groups.setdefault(lookup.group, {})[lookup.key] = lookup.vector
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._namespace_stats(self._entries[oldest].namespace)["evictions"] += 1
+            self._drop(oldest)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        for key in [key for key, entry in self._entries.items() if namespace is None or entry.namespace == namespace]:
+            self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        namespaces = {}
+        for namespace, counters in self._stats.items():
+            lookups = counters["hits"] + counters["semantic_hits"] + counters["misses"]
+            namespaces[namespace] = {
+                **counters,
+                "entries": sum(1 for entry in self._entries.values() if entry.namespace == namespace),
+                "hit_rate": round((counters["hits"] + counters["semantic_hits"]) / lookups, 4) if lookups else 0.0
+            }
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "default_ttl_seconds": self.default_ttl_seconds,
+            "similarity_threshold": self.similarity_threshold,
+            "namespaces": namespaces
+        }
+
+    def _live_entry(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._namespace_stats(entry.namespace)["expirations"] += 1
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _nearest(self, group: str, vector: np.ndarray) -> Optional[str]:
+        """Key of the most similar live entry in group above the similarity threshold"""
+        candidates = self._groups.get(group)
+        if not candidates:
+            return None
+        keys = list(candidates)
+        similarities = np.stack([candidates[key] for key in keys]) @ vector
+        for index in np.argsort(similarities)[::-1]:
+            if similarities[index] < self.similarity_threshold:
+                return None
+            if self._live_entry(keys[index]) is not None:
+                return keys[index]
+        return None
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        try:
+            embedding, vector_space = await asyncio.to_thread(
+                self._embeddings.embed_with_space, text, self.embedding_dimension
+            )
+        except Exception as e:
+            logger.warning(f"LLMResponseCache: Embedding failed, skipping semantic lookup: {e}")
+            return None
+        # Fallback vectors are not comparable with the entries embedded by the primary provider
+        if vector_space != self._embeddings.provider.vector_space:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.vector is not None:
+            group = self._groups.get(entry.group)
+            if group is not None:
+                group.pop(key, None)
+                if not group:
+                    del self._groups[entry.group]
+
+    def _namespace_stats(self, namespace: str) -> Dict[str, int]:
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats[namespace] = {"hits": 0, "semantic_hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        return stats
+
+    @staticmethod
+    def _normalize(content: Any) -> str:
+        return _whitespace.sub(" ", str(content)).strip().casefold()
+
+    @staticmethod
+    def _digest(payload: Any) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+llm_response_cache = LLMResponseCache(
+    max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+    default_ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+    similarity_threshold=settings.LLM_RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+    embedding_dimension=settings.LLM_RESPONSE_CACHE_EMBEDDING_DIM,
+    embeddings=embedding_service
+)
@@ -6,6 +6,7 @@ from app.db.models.location import BusinessOperationalLocation
 from app.db.models.business import Business
 from app.schemas.location import BusinessLocationCreate, BusinessLocationUpdate
 from app.core.exceptions import AuthorizationError, NotFoundError, DuplicateLocationError
+from app.services.location.geo_grid_cache import business_location_grid
 
 class BusinessLocationService(ILocationService):
     """Single responsibility: Handle business location operations"""
@@ -62,6 +63,7 @@ class BusinessLocationService(ILocationService):
         db.add(db_location)
         await db.commit()
         await db.refresh(db_location)
+        await business_location_grid.refresh_locations(db, [db_location.id])
         
         return db_location
     
@@ -134,6 +136,7 @@ class BusinessLocationService(ILocationService):
         
         await db.commit()
         await db.refresh(db_location)
+        await business_location_grid.refresh_locations(db, [db_location.id])
         return db_location
     
     async def delete_location(
@@ -156,8 +159,9 @@ class BusinessLocationService(ILocationService):
         if not await self._verify_business_ownership(db, db_location.business_id, current_user.id):
             raise AuthorizationError("Not authorized to delete this location")
         
-        db.delete(db_location)
+        await db.delete(db_location)
         await db.commit()
+        business_location_grid.remove(location_id)
         return True
     
     async def _verify_business_ownership(self, db: AsyncSession, business_id: int, user_id: int) -> bool:
@@ -0,0 +1,73 @@
+from typing import List, Optional, Sequence, Tuple
+import math
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km_batch(
+    latitude: float,
+    longitude: float,
+    latitudes: Sequence[float],
+    longitudes: Sequence[float]
+) -> np.ndarray:
+    """Vectorized Haversine distance (km) from one origin to many points"""
+    lats = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lngs = np.radians(np.asarray(longitudes, dtype=np.float64))
+    origin_lat = np.radians(latitude)
+    origin_lng = np.radians(longitude)
+
+    a = (
+        np.sin((lats - origin_lat) / 2) ** 2
+        + np.cos(origin_lat) * np.cos(lats) * np.sin((lngs - origin_lng) / 2) ** 2
+    )
+    # Clip guards against a > 1 from floating point error on antipodal points
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def nearest_within_radius(
+    distances: np.ndarray,
+    radius_km: float,
+    limit: Optional[int] = None
+) -> np.ndarray:
+    """Indices of points within radius_km, ordered by distance.
+
+    When limit is given only the closest `limit` points are selected with
+    argpartition, so the full candidate list is never sorted.
+    """
+    indices = np.flatnonzero(distances <= radius_km)
+
+    if limit is not None and limit < len(indices):
+        closest = np.argpartition(distances[indices], limit - 1)[:limit]
+        indices = indices[closest]
+
+    return indices[np.argsort(distances[indices], kind="stable")]
+
+
+def bounding_box(
+    latitude: float,
+    longitude: float,
+    radius_km: float
+) -> Tuple[float, float, Optional[List[Tuple[float, float]]]]:
+    """Return (min_lat, max_lat, lng_ranges) enclosing the search circle.
+
+    lng_ranges is None when the circle covers a pole (every longitude matches),
+    and holds two ranges when the box crosses the antimeridian.
+    """
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    lat_delta = math.degrees(angular_radius)
+    min_lat = latitude - lat_delta
+    max_lat = latitude + lat_delta
+
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), None
+
+    lng_delta = math.degrees(math.asin(math.sin(angular_radius) / math.cos(math.radians(latitude))))
+    min_lng = longitude - lng_delta
+    max_lng = longitude + lng_delta
+
+    if min_lng < -180:
+        return min_lat, max_lat, [(min_lng + 360, 180.0), (-180.0, max_lng)]
+    if max_lng > 180:
+        return min_lat, max_lat, [(min_lng, 180.0), (-180.0, max_lng - 360)]
+    return min_lat, max_lat, [(min_lng, max_lng)]
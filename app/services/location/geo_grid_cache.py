@@ -0,0 +1,293 @@
+import asyncio
+import math
+import time
+import logging
+from array import array
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.location import InfluencerOperationalLocation, BusinessOperationalLocation, LocationPromotionRequest
+from app.services.location.geo_distance import bounding_box, haversine_km_batch, nearest_within_radius
+
+logger = logging.getLogger(__name__)
+
+# (location_id, latitude, longitude, entity_id)
+GridRow = Tuple[int, float, float, int]
+RowLoader = Callable[[AsyncSession, Optional[Sequence[int]]], Awaitable[List[GridRow]]]
+
+Cell = Tuple[int, int]
+
+
+class GeoGridCache:
+    """Single responsibility: Keep an in-memory, grid-bucketed snapshot of location rows.
+
+    Rows are stored column-wise in typed arrays; each grid cell holds the slots of the
+    rows that fall inside it, so radius queries only look at cells overlapping the
+    search bounding box. Deleted rows free their slot for reuse.
+
+    Only coordinates are kept: attributes such as rates, budgets or industries change
+    outside the location write paths, so callers filter on them in SQL instead.
+    """
+
+    def __init__(self, name: str, row_loader: RowLoader, cell_size_deg: float, max_age_seconds: int):
+        self.name = name
+        self.cell_size_deg = cell_size_deg
+        self.max_age_seconds = max_age_seconds
+        self._row_loader = row_loader
+        self._load_lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.full_loads = 0
+        self.incremental_updates = 0
+        self._reset()
+
+    def _reset(self):
+        self._latitudes = array("d")
+        self._longitudes = array("d")
+        self._entity_ids = array("q")
+        self._location_ids = array("q")
+        self._slot_by_location: Dict[int, int] = {}
+        self._free_slots: List[int] = []
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._loaded_at: Optional[float] = None
+        self._last_refresh: Optional[datetime] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.max_age_seconds
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Load a full snapshot when the cache is empty or older than max_age_seconds"""
+        if self.is_fresh:
+            self.hits += 1
+            return
+
+        self.misses += 1
+        async with self._load_lock:
+            # Another request may have finished loading while we waited
+            if self.is_fresh:
+                return
+            rows = await self._row_loader(db, None)
+            self.load(rows)
+            logger.info(f"Geo grid cache '{self.name}' loaded {len(rows)} locations")
+
+    def load(self, rows: Sequence[GridRow]) -> None:
+        """Replace the snapshot with the given rows"""
+        self._reset()
+        for row in rows:
+            self._insert(row)
+        self.full_loads += 1
+        self._loaded_at = time.monotonic()
+        self._last_refresh = datetime.utcnow()
+
+    async def refresh_locations(self, db: AsyncSession, location_ids: Sequence[int]) -> None:
+        """Re-read the given locations from the database and upsert them into the snapshot.
+
+        Nothing is done before the first full load; that load will pick the rows up.
+        """
+        if self._loaded_at is None:
+            return
+        for row in await self._row_loader(db, location_ids):
+            self.upsert(row)
+
+    def upsert(self, row: GridRow) -> None:
+        location_id = row[0]
+        if location_id in self._slot_by_location:
+            self._remove_slot(self._slot_by_location.pop(location_id))
+        self._insert(row)
+        self.incremental_updates += 1
+        self._last_refresh = datetime.utcnow()
+
+    def remove(self, location_id: int) -> None:
+        slot = self._slot_by_location.pop(location_id, None)
+        if slot is None:
+            return
+        self._remove_slot(slot)
+        self.incremental_updates += 1
+        self._last_refresh = datetime.utcnow()
+
+    def query(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: Optional[int] = None
+    ) -> List[Tuple[int, int, float]]:
+        """Return (location_id, entity_id, distance_km) within radius_km, nearest first"""
+        slots = self._candidate_slots(latitude, longitude, radius_km)
+        if not slots:
+            return []
+
+        slot_index = np.fromiter(slots, dtype=np.int64, count=len(slots))
+
+        distances = haversine_km_batch(
+            latitude, longitude,
+            np.frombuffer(self._latitudes, dtype=np.float64)[slot_index],
+            np.frombuffer(self._longitudes, dtype=np.float64)[slot_index]
+        )
+        return [
+            (
+                self._location_ids[int(slot_index[index])],
+                self._entity_ids[int(slot_index[index])],
+                round(float(distances[index]), 2)
+            )
+            for index in nearest_within_radius(distances, radius_km, limit)
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._slot_by_location),
+            "cells": len(self._cells),
+            "cell_size_deg": self.cell_size_deg,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "full_loads": self.full_loads,
+            "incremental_updates": self.incremental_updates,
+            "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at is not None else None,
+            "max_age_seconds": self.max_age_seconds,
+            "is_stale": not self.is_fresh,
+            "last_refresh": self._last_refresh.isoformat() if self._last_refresh else None
+        }
+
+    def _cell_for(self, latitude: float, longitude: float) -> Cell:
+        return (math.floor(latitude / self.cell_size_deg), math.floor(longitude / self.cell_size_deg))
+
+    def _insert(self, row: GridRow) -> None:
+        location_id, latitude, longitude, entity_id = row
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._latitudes[slot] = latitude
+            self._longitudes[slot] = longitude
+            self._entity_ids[slot] = entity_id
+            self._location_ids[slot] = location_id
+        else:
+            slot = len(self._location_ids)
+            self._latitudes.append(latitude)
+            self._longitudes.append(longitude)
+            self._entity_ids.append(entity_id)
+            self._location_ids.append(location_id)
+
+        self._slot_by_location[location_id] = slot
+        self._cells.setdefault(self._cell_for(latitude, longitude), set()).add(slot)
+
+    def _remove_slot(self, slot: int) -> None:
+        cell = self._cell_for(self._latitudes[slot], self._longitudes[slot])
+        members = self._cells.get(cell)
+        if members is not None:
+            members.discard(slot)
+            if not members:
+                del self._cells[cell]
+        self._free_slots.append(slot)
+
+    def _candidate_slots(self, latitude: float, longitude: float, radius_km: float) -> List[int]:
+        """Slots of every row in a cell overlapping the search bounding box"""
+        min_lat, max_lat, lng_ranges = bounding_box(latitude, longitude, radius_km)
+        min_lat_cell = math.floor(min_lat / self.cell_size_deg)
+        max_lat_cell = math.floor(max_lat / self.cell_size_deg)
+
+        lng_cell_ranges = None
+        if lng_ranges is not None:
+            lng_cell_ranges = [
+                (math.floor(low / self.cell_size_deg), math.floor(high / self.cell_size_deg))
+                for low, high in lng_ranges
+            ]
+            box_cells = (max_lat_cell - min_lat_cell + 1) * sum(high - low + 1 for low, high in lng_cell_ranges)
+
+        slots: List[int] = []
+        if lng_cell_ranges is None or box_cells > len(self._cells):
+            # Scanning the occupied cells is cheaper than enumerating the box
+            for (lat_cell, lng_cell), members in self._cells.items():
+                if not min_lat_cell <= lat_cell <= max_lat_cell:
+                    continue
+                if lng_cell_ranges is not None and not any(low <= lng_cell <= high for low, high in lng_cell_ranges):
+                    continue
+                slots.extend(members)
+            return slots
+
+        for lat_cell in range(min_lat_cell, max_lat_cell + 1):
+            for low, high in lng_cell_ranges:
+                for lng_cell in range(low, high + 1):
+                    members = self._cells.get((lat_cell, lng_cell))
+                    if members:
+                        slots.extend(members)
+        return slots
+
+
+async def _load_influencer_rows(db: AsyncSession, location_ids: Optional[Sequence[int]] = None) -> List[GridRow]:
+    query = select(
+        InfluencerOperationalLocation.id,
+        InfluencerOperationalLocation.latitude,
+        InfluencerOperationalLocation.longitude,
+        InfluencerOperationalLocation.influencer_id
+    )
+    if location_ids is not None:
+        query = query.where(InfluencerOperationalLocation.id.in_(location_ids))
+
+    result = await db.execute(query)
+    return [
+        (row.id, float(row.latitude), float(row.longitude), row.influencer_id)
+        for row in result
+    ]
+
+
+async def _load_business_rows(db: AsyncSession, location_ids: Optional[Sequence[int]] = None) -> List[GridRow]:
+    query = select(
+        BusinessOperationalLocation.id,
+        BusinessOperationalLocation.latitude,
+        BusinessOperationalLocation.longitude,
+        BusinessOperationalLocation.business_id
+    )
+    if location_ids is not None:
+        query = query.where(BusinessOperationalLocation.id.in_(location_ids))
+
+    result = await db.execute(query)
+    return [
+        (row.id, float(row.latitude), float(row.longitude), row.business_id)
+        for row in result
+    ]
+
+
+async def _load_promotion_request_rows(db: AsyncSession, location_ids: Optional[Sequence[int]] = None) -> List[GridRow]:
+    query = select(
+        LocationPromotionRequest.id,
+        LocationPromotionRequest.latitude,
+        LocationPromotionRequest.longitude,
+        LocationPromotionRequest.promotion_id
+    )
+    if location_ids is not None:
+        query = query.where(LocationPromotionRequest.id.in_(location_ids))
+
+    result = await db.execute(query)
+    return [
+        (row.id, float(row.latitude), float(row.longitude), row.promotion_id)
+        for row in result
+    ]
+
+
+# Process-wide snapshots shared by every LocationSearchService instance
+influencer_location_grid = GeoGridCache(
+    "influencer_locations", _load_influencer_rows,
+    settings.LOCATION_GRID_CELL_SIZE_DEG, settings.LOCATION_GRID_CACHE_MAX_AGE_SECONDS
+)
+business_location_grid = GeoGridCache(
+    "business_locations", _load_business_rows,
+    settings.LOCATION_GRID_CELL_SIZE_DEG, settings.LOCATION_GRID_CACHE_MAX_AGE_SECONDS
+)
+promotion_request_grid = GeoGridCache(
+    "promotion_requests", _load_promotion_request_rows,
+    settings.LOCATION_GRID_CELL_SIZE_DEG, settings.LOCATION_GRID_CACHE_MAX_AGE_SECONDS
+)
+
+
+def get_geo_grid_stats() -> List[Dict[str, Any]]:
+    return [grid.stats() for grid in (influencer_location_grid, business_location_grid, promotion_request_grid)]
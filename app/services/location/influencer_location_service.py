@@ -6,6 +6,7 @@ from app.db.models.location import InfluencerOperationalLocation
 from app.db.models.influencer import Influencer
 from app.schemas.location import InfluencerLocationCreate, InfluencerLocationUpdate
 from app.core.exceptions import AuthorizationError, NotFoundError, DuplicateLocationError
+from app.services.location.geo_grid_cache import influencer_location_grid
 from fastapi import HTTPException
 
 class InfluencerLocationService(ILocationService):
@@ -64,6 +65,7 @@ class InfluencerLocationService(ILocationService):
         db.add(db_location)
         await db.commit()
         await db.refresh(db_location)
+        await influencer_location_grid.refresh_locations(db, [db_location.id])
         
         return db_location
     
@@ -136,6 +138,7 @@ class InfluencerLocationService(ILocationService):
         
         await db.commit()
         await db.refresh(db_location)
+        await influencer_location_grid.refresh_locations(db, [db_location.id])
         return db_location
     
     async def delete_location(
@@ -158,8 +161,9 @@ class InfluencerLocationService(ILocationService):
         if not await self._verify_influencer_ownership(db, db_location.influencer_id, current_user.id):
             raise AuthorizationError("Not authorized to delete this location")
         
-        db.delete(db_location)
+        await db.delete(db_location)
         await db.commit()
+        influencer_location_grid.remove(location_id)
         return True
     
     async def _verify_influencer_ownership(self, db: AsyncSession, influencer_id: int, user_id: int) -> bool:
@@ -1,11 +1,15 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select
+from sqlalchemy.orm import selectinload
 from app.db.models.location import LocationPromotionRequest
 from app.db.models.business import Business
 from app.db.models.promotions import Promotion
-from app.schemas.location_promotion import *
+from app.schemas.location_promotion import (
+    LocationPromotionRequestCreate, LocationPromotionRequestUpdate, LocationPromotionRequestWithDetails
+)
 from app.core.exceptions import AuthorizationError, NotFoundError
+from app.services.location.geo_grid_cache import promotion_request_grid
 from fastapi import HTTPException
 
 class LocationPromotionService:
@@ -13,30 +17,36 @@ class LocationPromotionService:
     
     async def create_location_promotion_request(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         request: LocationPromotionRequestCreate,
         current_user
     ) -> LocationPromotionRequest:
         """Create a new location promotion request"""
         
         # Verify business ownership
-        business = db.query(Business).filter(
-            and_(
-                Business.id == request.business_id,
-                Business.owner_id == current_user.id
+        result = await db.execute(
+            select(Business).where(
+                and_(
+                    Business.id == request.business_id,
+                    Business.owner_id == current_user.id
+                )
             )
-        ).first()
+        )
+        business = result.scalars().first()
         
         if not business:
             raise AuthorizationError("Not authorized to create requests for this business")
         
         # Verify promotion ownership
-        promotion = db.query(Promotion).filter(
-            and_(
-                Promotion.id == request.promotion_id,
-                Promotion.business_id == request.business_id
+        result = await db.execute(
+            select(Promotion).where(
+                and_(
+                    Promotion.id == request.promotion_id,
+                    Promotion.business_id == request.business_id
+                )
             )
-        ).first()
+        )
+        promotion = result.scalars().first()
         
         if not promotion:
             raise NotFoundError("Promotion not found")
@@ -50,14 +60,15 @@ class LocationPromotionService:
         )
         
         db.add(db_request)
-        db.commit()
-        db.refresh(db_request)
+        await db.commit()
+        await db.refresh(db_request)
+        await promotion_request_grid.refresh_locations(db, [db_request.id])
         
         return db_request
     
     async def get_location_promotion_requests(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         business_id: Optional[int] = None,
         promotion_id: Optional[int] = None,
         country_id: Optional[int] = None,
@@ -66,22 +77,26 @@ class LocationPromotionService:
     ) -> List[LocationPromotionRequestWithDetails]:
         """Get location promotion requests with optional filters"""
         
-        query = db.query(LocationPromotionRequest)
+        query = select(LocationPromotionRequest).options(
+            selectinload(LocationPromotionRequest.business),
+            selectinload(LocationPromotionRequest.promotion),
+            selectinload(LocationPromotionRequest.country)
+        )
         
         # Apply filters
         if business_id:
-            query = query.filter(LocationPromotionRequest.business_id == business_id)
+            query = query.where(LocationPromotionRequest.business_id == business_id)
         
         if promotion_id:
-            query = query.filter(LocationPromotionRequest.promotion_id == promotion_id)
+            query = query.where(LocationPromotionRequest.promotion_id == promotion_id)
         
         if country_id:
-            query = query.filter(LocationPromotionRequest.country_id == country_id)
+            query = query.where(LocationPromotionRequest.country_id == country_id)
         
         if city:
-            query = query.filter(LocationPromotionRequest.city.ilike(f"%{city}%"))
+            query = query.where(LocationPromotionRequest.city.ilike(f"%{city}%"))
         
-        requests = query.all()
+        requests = (await db.execute(query)).scalars().all()
         
         # Convert to response format with details
         result = []
@@ -99,27 +114,33 @@ class LocationPromotionService:
     
     async def update_location_promotion_request(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         request_id: int, 
         request: LocationPromotionRequestUpdate, 
         current_user
     ) -> LocationPromotionRequest:
         """Update a location promotion request"""
         
-        db_request = db.query(LocationPromotionRequest).filter(
-            LocationPromotionRequest.id == request_id
-        ).first()
+        result = await db.execute(
+            select(LocationPromotionRequest).where(
+                LocationPromotionRequest.id == request_id
+            )
+        )
+        db_request = result.scalars().first()
         
         if not db_request:
             raise NotFoundError("Location promotion request not found")
         
         # Verify ownership
-        business = db.query(Business).filter(
-            and_(
-                Business.id == db_request.business_id,
-                Business.owner_id == current_user.id
+        result = await db.execute(
+            select(Business).where(
+                and_(
+                    Business.id == db_request.business_id,
+                    Business.owner_id == current_user.id
+                )
             )
-        ).first()
+        )
+        business = result.scalars().first()
         
         if not business:
             raise AuthorizationError("Not authorized to update this request")
@@ -129,38 +150,46 @@ class LocationPromotionService:
             if hasattr(db_request, field):
                 setattr(db_request, field, value)
         
-        db.commit()
-        db.refresh(db_request)
+        await db.commit()
+        await db.refresh(db_request)
+        await promotion_request_grid.refresh_locations(db, [db_request.id])
         
         return db_request
     
     async def delete_location_promotion_request(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         request_id: int, 
         current_user
     ) -> bool:
         """Delete a location promotion request"""
         
-        db_request = db.query(LocationPromotionRequest).filter(
-            LocationPromotionRequest.id == request_id
-        ).first()
+        result = await db.execute(
+            select(LocationPromotionRequest).where(
+                LocationPromotionRequest.id == request_id
+            )
+        )
+        db_request = result.scalars().first()
         
         if not db_request:
             raise NotFoundError("Location promotion request not found")
         
         # Verify ownership
-        business = db.query(Business).filter(
-            and_(
-                Business.id == db_request.business_id,
-                Business.owner_id == current_user.id
+        result = await db.execute(
+            select(Business).where(
+                and_(
+                    Business.id == db_request.business_id,
+                    Business.owner_id == current_user.id
+                )
             )
-        ).first()
+        )
+        business = result.scalars().first()
         
         if not business:
             raise AuthorizationError("Not authorized to delete this request")
         
-        db.delete(db_request)
-        db.commit()
+        await db.delete(db_request)
+        await db.commit()
+        promotion_request_grid.remove(request_id)
         
         return True
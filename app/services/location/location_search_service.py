@@ -1,19 +1,30 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import contains_eager
 from app.services.interfaces.location_service_interface import ILocationSearchService
 from app.db.models.location import InfluencerOperationalLocation, BusinessOperationalLocation, LocationPromotionRequest
 from app.db.models.influencer import Influencer
 from app.db.models.business import Business
+from app.db.models.promotions import Promotion
+from app.services.location.geo_distance import EARTH_RADIUS_KM, bounding_box, haversine_km_batch, nearest_within_radius
+from app.services.location.geo_grid_cache import (
+    GeoGridCache, influencer_location_grid, business_location_grid, promotion_request_grid
+)
+from app.core.config import settings
 import math
 
+# Max ids per IN (...) when hydrating grid matches, well under asyncpg's bind parameter limit
+HYDRATE_CHUNK_SIZE = 5000
+
 class LocationSearchService(ILocationSearchService):
     """Single responsibility: Handle location-based search operations"""
-    
+
     async def find_entities_nearby(
-        self, 
-        db: Session, 
-        latitude: float, 
-        longitude: float, 
+        self,
+        db: AsyncSession,
+        latitude: float,
+        longitude: float,
         radius_km: float,
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
@@ -21,133 +32,218 @@ class LocationSearchService(ILocationSearchService):
         # This method can be extended for different entity types
         # without modifying the base implementation
         pass
-    
+
     async def find_influencers_nearby(
         self,
-        db: Session,
+        db: AsyncSession,
         latitude: float,
         longitude: float,
         radius_km: float,
         category: Optional[str] = None,
         min_followers: Optional[int] = None,
-        max_rate: Optional[float] = None
+        max_rate: Optional[float] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Find influencers within specified radius"""
-        locations = db.query(InfluencerOperationalLocation).join(Influencer).all()
-        
-        nearby_influencers = []
-        
-        for location in locations:
-            distance = await self.calculate_distance(
-                latitude, longitude,
-                float(location.latitude), float(location.longitude)
-            )
-            
-            if distance <= radius_km:
-                # Apply filters
-                if category and location.influencer.category != category:
-                    continue
-                    
-                if min_followers and location.influencer.total_posts < min_followers:
-                    continue
-                    
-                if max_rate and location.influencer.rate_per_post > max_rate:
-                    continue
-                
-                nearby_influencers.append({
-                    "influencer": location.influencer,
-                    "location": location,
-                    "distance_km": round(distance, 2)
-                })
-        
-        # Sort by distance
-        nearby_influencers.sort(key=lambda x: x["distance_km"])
-        return nearby_influencers
-    
+        query = (
+            select(InfluencerOperationalLocation)
+            .join(InfluencerOperationalLocation.influencer)
+            .options(contains_eager(InfluencerOperationalLocation.influencer))
+        )
+
+        filtered = False
+
+        # Influencer has no category column yet; only filter when the model supports it
+        if category and hasattr(Influencer, "category"):
+            query = query.where(Influencer.category == category)
+            filtered = True
+
+        if min_followers:
+            query = query.where(Influencer.total_posts >= min_followers)
+            filtered = True
+
+        if max_rate:
+            query = query.where(Influencer.rate_per_post <= max_rate)
+            filtered = True
+
+        matches = await self._search_nearby(
+            db, query, InfluencerOperationalLocation, influencer_location_grid,
+            latitude, longitude, radius_km, limit,
+            filtered=filtered
+        )
+        return [
+            {
+                "influencer": location.influencer,
+                "location": location,
+                "distance_km": distance
+            }
+            for location, distance in matches
+        ]
+
     async def find_businesses_nearby(
         self,
-        db: Session,
+        db: AsyncSession,
         latitude: float,
         longitude: float,
         radius_km: float,
         industry: Optional[str] = None,
-        verified_only: bool = False
+        verified_only: bool = False,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Find businesses within specified radius"""
-        query = db.query(BusinessOperationalLocation).join(Business)
-        
+        query = (
+            select(BusinessOperationalLocation)
+            .join(BusinessOperationalLocation.business)
+            .options(contains_eager(BusinessOperationalLocation.business))
+        )
+
         if verified_only:
-            query = query.filter(Business.verified == True)
-        
-        locations = query.all()
-        
-        nearby_businesses = []
-        
-        for location in locations:
-            distance = await self.calculate_distance(
-                latitude, longitude,
-                float(location.latitude), float(location.longitude)
-            )
-            
-            if distance <= radius_km:
-                if industry and location.business.industry != industry:
-                    continue
-                
-                nearby_businesses.append({
-                    "business": location.business,
-                    "location": location,
-                    "distance_km": round(distance, 2)
-                })
-        
-        nearby_businesses.sort(key=lambda x: x["distance_km"])
-        return nearby_businesses
-    
+            query = query.where(Business.verified == True)
+
+        if industry:
+            query = query.where(Business.industry == industry)
+
+        matches = await self._search_nearby(
+            db, query, BusinessOperationalLocation, business_location_grid,
+            latitude, longitude, radius_km, limit,
+            filtered=verified_only or bool(industry)
+        )
+        return [
+            {
+                "business": location.business,
+                "location": location,
+                "distance_km": distance
+            }
+            for location, distance in matches
+        ]
+
     async def find_promotion_requests_nearby(
         self,
-        db: Session,
+        db: AsyncSession,
         latitude: float,
         longitude: float,
         radius_km: float,
         min_budget: Optional[float] = None,
-        max_budget: Optional[float] = None
+        max_budget: Optional[float] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Find promotion requests within specified radius"""
-        requests = db.query(LocationPromotionRequest).all()
-        
-        nearby_requests = []
-        
-        for request in requests:
-            distance = await self.calculate_distance(
-                latitude, longitude,
-                float(request.latitude), float(request.longitude)
+        query = (
+            select(LocationPromotionRequest)
+            .join(LocationPromotionRequest.business)
+            .join(LocationPromotionRequest.promotion)
+            .options(
+                contains_eager(LocationPromotionRequest.business),
+                contains_eager(LocationPromotionRequest.promotion)
             )
-            
-            if distance <= radius_km:
-                if min_budget and request.promotion.budget and request.promotion.budget < min_budget:
-                    continue
-                    
-                if max_budget and request.promotion.budget and request.promotion.budget > max_budget:
-                    continue
-                
-                nearby_requests.append({
-                    "request": request,
-                    "business": request.business,
-                    "promotion": request.promotion,
-                    "distance_km": round(distance, 2)
-                })
-        
-        nearby_requests.sort(key=lambda x: x["distance_km"])
-        return nearby_requests
-    
+        )
+
+        # Promotions without a budget are never excluded by the budget filters
+        if min_budget:
+            query = query.where(or_(Promotion.budget.is_(None), Promotion.budget >= min_budget))
+
+        if max_budget:
+            query = query.where(or_(Promotion.budget.is_(None), Promotion.budget <= max_budget))
+
+        matches = await self._search_nearby(
+            db, query, LocationPromotionRequest, promotion_request_grid,
+            latitude, longitude, radius_km, limit,
+            filtered=bool(min_budget) or bool(max_budget)
+        )
+        return [
+            {
+                "request": request,
+                "business": request.business,
+                "promotion": request.promotion,
+                "distance_km": distance
+            }
+            for request, distance in matches
+        ]
+
     async def calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """Calculate distance between two points using Haversine formula"""
-        R = 6371  # Earth's radius in kilometers
-        
         lat1, lng1, lat2, lng2 = map(math.radians, [lat1, lng1, lat2, lng2])
         dlat = lat2 - lat1
         dlng = lng2 - lng1
-        
+
         a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
         c = 2 * math.asin(math.sqrt(a))
-        
-        return R * c
+
+        return EARTH_RADIUS_KM * c
+
+    async def _search_nearby(
+        self,
+        db: AsyncSession,
+        query,
+        model,
+        grid: GeoGridCache,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: Optional[int] = None,
+        filtered: bool = False
+    ) -> List[Tuple[Any, float]]:
+        """Run the spatial part of a nearby search and hydrate the matching rows with query.
+
+        With the grid cache enabled the radius search runs in memory and only the
+        matching ids are loaded; otherwise the bounding-box SQL prefilter is used.
+        The grid only knows coordinates; pass filtered=True when query adds WHERE
+        clauses, so the limit is applied after SQL has dropped non-matching rows.
+        """
+        if not settings.LOCATION_GRID_CACHE_ENABLED:
+            result = await db.execute(query.where(self._bounding_box_clause(model, latitude, longitude, radius_km)))
+            return self._rank_by_distance(result.scalars().all(), latitude, longitude, radius_km, limit)
+
+        await grid.ensure_loaded(db)
+        grid_limit = None if filtered else limit
+        distances = {
+            location_id: distance
+            for location_id, _, distance in grid.query(latitude, longitude, radius_km, limit=grid_limit)
+        }
+        if not distances:
+            return []
+
+        candidates = []
+        location_ids = list(distances)
+        for start in range(0, len(location_ids), HYDRATE_CHUNK_SIZE):
+            chunk = location_ids[start:start + HYDRATE_CHUNK_SIZE]
+            result = await db.execute(query.where(model.id.in_(chunk)))
+            candidates.extend(result.scalars().unique().all())
+
+        ranked = sorted(((candidate, distances[candidate.id]) for candidate in candidates), key=lambda x: x[1])
+        return ranked[:limit] if limit else ranked
+
+    @staticmethod
+    def _rank_by_distance(
+        candidates: Sequence[Any],
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: Optional[int] = None
+    ) -> List[Tuple[Any, float]]:
+        """Pair candidates inside radius_km with their distance, nearest first"""
+        if not candidates:
+            return []
+
+        distances = haversine_km_batch(
+            latitude, longitude,
+            [float(candidate.latitude) for candidate in candidates],
+            [float(candidate.longitude) for candidate in candidates]
+        )
+        return [
+            (candidates[index], round(float(distances[index]), 2))
+            for index in nearest_within_radius(distances, radius_km, limit)
+        ]
+
+    def _bounding_box_clause(self, model, latitude: float, longitude: float, radius_km: float):
+        """Build an index-friendly WHERE clause restricting model rows to the search bounding box"""
+        min_lat, max_lat, lng_ranges = bounding_box(latitude, longitude, radius_km)
+        lat_clause = model.latitude.between(min_lat, max_lat)
+
+        if lng_ranges is None:
+            return lat_clause
+
+        return and_(
+            lat_clause,
+            or_(*[model.longitude.between(low, high) for low, high in lng_ranges])
+        )
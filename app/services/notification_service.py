@@ -1,14 +1,16 @@
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+import uuid
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, insert
 from fastapi import BackgroundTasks
 import time
 import traceback
 
+from app.core.config import settings
 from app.db.models.notification import Notification, NotificationPreference, TwitterPost
 from app.db.models.user import User
 from app.core.query_helpers import safe_scalar_one_or_none
@@ -97,6 +99,76 @@ class NotificationService:
             logger.error(f"Stack trace: {traceback.format_exc()}")
             raise
     
+    async def create_notifications_bulk(
+        self,
+        db: AsyncSession,
+        notifications_data: List[NotificationCreate],
+        background_tasks: BackgroundTasks
+    ) -> List[int]:
+        """Create many notifications of one event type and schedule a single batched delivery job.
+
+        Preferences are read and rows written with multi-row INSERT ... RETURNING
+        a chunk of NOTIFICATION_BULK_CHUNK_SIZE at a time in a single commit, instead of a
+        preference query, INSERT, commit and background task per recipient.
+        Returns the new notification IDs.
+        """
+        start_time = time.time()
+        if not notifications_data:
+            return []
+        
+        event_type = notifications_data[0].event_type
+        if any(data.event_type != event_type for data in notifications_data):
+            raise ValueError("create_notifications_bulk expects notifications of a single event type")
+        
+        logger.info(f"🚀 NOTIFICATION_BULK_START: Creating {len(notifications_data)} {event_type} notifications")
+        
+        try:
+            user_prefs = await self._get_users_preferences(
+                db, {data.recipient_user_id for data in notifications_data}, event_type
+            )
+            
+            rows = []
+            for data in notifications_data:
+                prefs = user_prefs.get(data.recipient_user_id, {})
+                rows.append({
+                    "uuid": uuid.uuid4(),
+                    "event_type": data.event_type,
+                    "recipient_user_id": data.recipient_user_id,
+                    "recipient_type": data.recipient_type,
+                    "title": data.title,
+                    "message": data.message,
+                    "event_metadata": data.event_metadata or {},
+                    "email_enabled": data.email_enabled and prefs.get('email_enabled', True),
+                    "twitter_enabled": data.twitter_enabled and prefs.get('twitter_enabled', True)
+                })
+            
+            # SQLAlchemy sends each chunk as one multi-row INSERT ... RETURNING
+            notification_ids: List[int] = []
+            chunk_size = settings.NOTIFICATION_BULK_CHUNK_SIZE
+            for offset in range(0, len(rows), chunk_size):
+                result = await db.execute(
+                    insert(Notification).returning(Notification.id),
+                    rows[offset:offset + chunk_size]
+                )
+                notification_ids.extend(result.scalars().all())
+            await db.commit()
+            
+            creation_time = time.time() - start_time
+            logger.info(f"✅ NOTIFICATION_BULK_CREATED: count={len(notification_ids)}, type={event_type}, time={creation_time:.3f}s")
+            
+            logger.info(f"📤 NOTIFICATION_DISPATCH: Scheduling one batched delivery job for {len(notification_ids)} notifications")
+            background_tasks.add_task(self._process_notification_batch_background, notification_ids)
+            
+            return notification_ids
+            
+        except Exception as e:
+            await db.rollback()
+            creation_time = time.time() - start_time
+            logger.error(f"❌ NOTIFICATION_BULK_CREATION_FAILED: count={len(notifications_data)}, type={event_type}, time={creation_time:.3f}s")
+            logger.error(f"Exception details: {str(e)}")
+            logger.error(f"Stack trace: {traceback.format_exc()}")
+            raise
+    
     async def _process_notification_background(self, notification_id: int):
         """Background task to process notification (email, Twitter, WebSocket)"""
         start_time = time.time()
@@ -179,6 +251,86 @@ class NotificationService:
             logger.error(f"Critical exception: {str(e)}")
             logger.error(f"Full stack trace: {traceback.format_exc()}")
 
+    async def _process_notification_batch_background(self, notification_ids: List[int]):
+        """Background task delivering one broadcast event to many recipients.
+
+        Notifications and their users are loaded a chunk at a time with one
+        query, emails and WebSocket messages are sent with bounded concurrency
+        and delivery status is committed once per chunk. The notifications in a
+        batch carry the same event, so the Twitter post is made once and its ID
+        recorded on every Twitter-enabled notification.
+        """
+        start_time = time.time()
+        logger.info(f"🔄 NOTIFICATION_BATCH_START: Processing {len(notification_ids)} notifications in background")
+        
+        semaphore = asyncio.Semaphore(settings.NOTIFICATION_DELIVERY_CONCURRENCY)
+        tweet_id: Optional[str] = None
+        tweet_error: Optional[str] = None
+        tweet_attempted = False
+        counts = {"email_sent": 0, "email_failed": 0, "websocket_sent": 0, "websocket_failed": 0}
+        
+        async def deliver(notification: Notification, user: User):
+            async with semaphore:
+                if notification.email_enabled:
+                    try:
+                        await self.email_service.send_notification_email(notification, user)
+                        notification.email_sent = True
+                        notification.email_sent_at = datetime.utcnow()
+                        counts["email_sent"] += 1
+                    except Exception as e:
+                        notification.email_error = str(e)
+                        counts["email_failed"] += 1
+                        logger.error(f"❌ EMAIL_FAILED: Email failed for notification {notification.id}: {str(e)}")
+                try:
+                    await self.websocket_service.send_notification_to_user(notification, user.id)
+                    counts["websocket_sent"] += 1
+                except Exception as e:
+                    counts["websocket_failed"] += 1
+                    logger.error(f"❌ WEBSOCKET_FAILED: WebSocket failed for notification {notification.id}: {str(e)}")
+        
+        try:
+            from app.db.database import get_db_session
+            chunk_size = settings.NOTIFICATION_BULK_CHUNK_SIZE
+            for offset in range(0, len(notification_ids), chunk_size):
+                async with get_db_session() as db:
+                    result = await db.execute(
+                        select(Notification, User)
+                        .join(User, User.id == Notification.recipient_user_id)
+                        .where(Notification.id.in_(notification_ids[offset:offset + chunk_size]))
+                    )
+                    rows = result.unique().all()
+                    
+                    twitter_notifications = [notification for notification, _ in rows if notification.twitter_enabled]
+                    if twitter_notifications and not tweet_attempted:
+                        tweet_attempted = True
+                        try:
+                            tweet_id = await self.twitter_service.post_notification_tweet(twitter_notifications[0])
+                            if not tweet_id:
+                                raise Exception("Tweet ID not returned from Twitter service")
+                        except Exception as e:
+                            tweet_error = str(e)
+                            logger.error(f"❌ TWITTER_FAILED: Twitter failed for notification batch: {tweet_error}")
+                    for notification in twitter_notifications:
+                        if tweet_id:
+                            notification.twitter_posted = True
+                            notification.twitter_posted_at = datetime.utcnow()
+                            notification.twitter_post_id = tweet_id
+                        else:
+                            notification.twitter_error = tweet_error
+                    
+                    await asyncio.gather(*[deliver(notification, user) for notification, user in rows])
+                    await db.commit()
+            
+            processing_time = time.time() - start_time
+            logger.info(f"🏁 NOTIFICATION_BATCH_COMPLETE: count={len(notification_ids)}")
+            logger.info(f"📊 BATCH_METRICS: time={processing_time:.3f}s, tweet_id={tweet_id}, {counts}")
+            
+        except Exception as e:
+            processing_time = time.time() - start_time
+            logger.error(f"💥 NOTIFICATION_BATCH_EXCEPTION: Critical failure processing {len(notification_ids)} notifications after {processing_time:.3f}s")
+            logger.error(f"Critical exception: {str(e)}")
+            logger.error(f"Full stack trace: {traceback.format_exc()}")
+
     async def _send_email_notification(self, db: AsyncSession, notification: Notification, user: User):
         """Send email notification with comprehensive logging (single attempt)"""
         start_time = time.time()
@@ -288,6 +440,26 @@ class NotificationService:
             'in_app_enabled': True
         }
     
+    async def _get_users_preferences(self, db: AsyncSession, user_ids: Set[int], event_type: str) -> Dict[int, Dict[str, bool]]:
+        """Get notification preferences for many users, one query per chunk; users without any are omitted"""
+        preferences: Dict[int, Dict[str, bool]] = {}
+        id_list = list(user_ids)
+        chunk_size = settings.NOTIFICATION_BULK_CHUNK_SIZE
+        for offset in range(0, len(id_list), chunk_size):
+            result = await db.execute(
+                select(NotificationPreference)
+                .where(and_(
+                    NotificationPreference.user_id.in_(id_list[offset:offset + chunk_size]),
+                    NotificationPreference.event_type == event_type
+                ))
+            )
+            for preference in result.scalars().all():
+                preferences[preference.user_id] = {
+                    'email_enabled': preference.email_enabled,
+                    'in_app_enabled': preference.in_app_enabled
+                }
+        return preferences
+    
     # Event-specific notification creation methods
     async def create_promotion_created_notification(
         self, 
@@ -299,35 +471,35 @@ class NotificationService:
         logger.info(f"🎯 PROMOTION_NOTIFICATION: Creating promotion_created notification for promotion {data.promotion_id}")
         logger.debug(f"Promotion details: name='{data.promotion_name}', business='{data.business_name}', budget={data.budget}")
         
-        # Find all influencers to notify
+        # Find all influencer users to notify
         from app.db.models.influencer import Influencer
-        result = await db.execute(select(Influencer))
-        influencers = result.scalars().all()
-        
-        notifications_created = []
-        
-        for influencer in influencers:
-            if influencer.user_id:
-                notification_data = NotificationCreate(
-                    event_type="promotion_created",
-                    recipient_user_id=influencer.user_id,
-                    recipient_type="influencer",
-                    title=f"New Promotion: {data.promotion_name}",
-                    message=f"{data.business_name} has created a new promotion '{data.promotion_name}' that might interest you!",
-                    event_metadata={
-                        "promotion_id": data.promotion_id,
-                        "promotion_name": data.promotion_name,
-                        "business_id": data.business_id,
-                        "business_name": data.business_name,
-                        "industry": data.industry,
-                        "budget": data.budget
-                    }
-                )
-                
-                notification = await self.create_notification(db, notification_data, background_tasks)
-                notifications_created.append(notification.id)
+        result = await db.execute(
+            select(Influencer.user_id).where(Influencer.user_id.is_not(None)).distinct()
+        )
+        user_ids = result.scalars().all()
+        
+        notifications_data = [
+            NotificationCreate(
+                event_type="promotion_created",
+                recipient_user_id=user_id,
+                recipient_type="influencer",
+                title=f"New Promotion: {data.promotion_name}",
+                message=f"{data.business_name} has created a new promotion '{data.promotion_name}' that might interest you!",
+                event_metadata={
+                    "promotion_id": data.promotion_id,
+                    "promotion_name": data.promotion_name,
+                    "business_id": data.business_id,
+                    "business_name": data.business_name,
+                    "industry": data.industry,
+                    "budget": data.budget
+                }
+            )
+            for user_id in user_ids
+        ]
+        
+        notifications_created = await self.create_notifications_bulk(db, notifications_data, background_tasks)
         
-        logger.info(f"✅ PROMOTION_NOTIFICATIONS_CREATED: promotion={data.promotion_id}, notifications_count={len(notifications_created)}, notification_ids={notifications_created}")
+        logger.info(f"✅ PROMOTION_NOTIFICATIONS_CREATED: promotion={data.promotion_id}, notifications_count={len(notifications_created)}")
         return notifications_created[0] if notifications_created else None
     
     async def create_collaboration_created_notification(
@@ -0,0 +1,54 @@
+"""
+Short-lived cache of authenticated users resolved from access tokens
+"""
+
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.schemas.user import UserRead
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCache:
+    """Single responsibility: Remember the UserRead resolved for a token subject.
+
+    Entries are keyed by username (the token "sub") and include roles and
+    influencer_id. Services that change a user's roles or profile call
+    invalidate_user(); entries held by other worker processes expire after
+    ttl_seconds, which bounds how long a stale principal can be served. Entries
+    have no stale window, so an expired principal is always reloaded before use.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.cache = get_cache("auth_principals", ttl_seconds=ttl_seconds)
+        self._usernames: Dict[int, str] = {}
+
+    async def get_or_load(self, username: str, loader: Callable[[], Awaitable[UserRead]]) -> UserRead:
+        """Return the cached principal for username, resolving it with loader on a miss.
+
+        Loader errors (e.g. an unknown user) are raised and nothing is cached.
+        """
+        if self.ttl_seconds <= 0:
+            return await loader()
+        principal: UserRead = await self.cache.get_or_set(
+            username, loader, ttl_seconds=self.ttl_seconds, stale_seconds=0
+        )
+        self._usernames[principal.id] = username
+        # Callers may modify the principal they are given
+        return principal.model_copy(deep=True)
+
+    async def invalidate_user(self, user_id: int, username: Optional[str] = None) -> None:
+        """Drop the cached principal for user_id; pass username when known so a
+        shared cache backend is cleared even if this process never cached the user"""
+        usernames = {username, self._usernames.pop(user_id, None)} - {None}
+        for cached_username in usernames:
+            await self.cache.delete(cached_username)
+        logger.info(f"PrincipalCache: Invalidated cached principal for user {user_id}")
+
+
+# Shared by every request so one lookup serves all requests with the same token subject
+principal_cache = PrincipalCache(ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
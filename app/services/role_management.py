@@ -5,6 +5,7 @@ from typing import List, Optional
 from app.db.models import User, Role, UserRole
 from app.schemas.user import UserRead
 from app.schemas.role import Role as RoleSchema
+from app.services.principal_cache import principal_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -53,12 +54,15 @@ class RoleManagementService:
             )
             if existing_role.scalars().first():
                 logger.info(f"Role {role_id} already assigned to user {user_id}")
+                # Callers also assign roles after creating profiles, so refresh the principal anyway
+                await principal_cache.invalidate_user(user_id, user.username)
                 return True
 
             # Assign the role
             user_role = UserRole(user_id=user_id, role_id=role_id)
             self.db.add(user_role)
             await self.db.commit()
+            await principal_cache.invalidate_user(user_id, user.username)
             logger.info(f"Role {role_id} assigned to user {user_id}")
             return True
         except Exception as e:
@@ -80,9 +84,14 @@ class RoleManagementService:
                 logger.error(f"Role {role_id} not assigned to user {user_id}")
                 return False
 
+            # Load the username so the shared principal cache entry is cleared as well
+            username_result = await self.db.execute(select(User.username).where(User.id == user_id))
+            username = username_result.scalar_one_or_none()
+
             # Remove the role
             await self.db.delete(user_role)
             await self.db.commit()
+            await principal_cache.invalidate_user(user_id, username)
             logger.info(f"Role {role_id} removed from user {user_id}")
             return True
         except Exception as e:
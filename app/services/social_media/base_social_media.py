@@ -8,6 +8,12 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.core.interfaces import ISocialMediaAPIService, SocialMediaMetrics, TrendingContent
+from app.core.config import settings
+from app.core.exceptions import OutboundRateLimitError
+from app.services.social_media.rate_limiter import (
+    RETRY_STATUSES, backoff_seconds, platform_rate_limiter, rate_limit_reset_seconds, retry_after_seconds
+)
+from app.services.social_media.session_pool import social_media_session_pool
 
 logger = logging.getLogger(__name__)
 
@@ -15,28 +21,24 @@ logger = logging.getLogger(__name__)
 class BaseSocialMediaAPIService(ISocialMediaAPIService):
     """Base implementation for social media API services"""
     
+    # Sustained request rate allowed per platform, shared by every instance
+    requests_per_hour = 300
+    
     def __init__(self, api_key: Optional[str] = None, access_token: Optional[str] = None):
         self.api_key = api_key
         self.access_token = access_token
         self.session: Optional[aiohttp.ClientSession] = None
-        self.rate_limit_info = {
-            "requests_per_hour": 300,
-            "current_requests": 0,
-            "last_reset": datetime.now()
-        }
+        self.rate_limiter = platform_rate_limiter.bucket(self._get_platform_name(), self.requests_per_hour)
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers=self._get_headers()
-        )
+        self.session = social_media_session_pool.get_session(self._get_platform_name())
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        # The pooled session is shared with other services and closed on app shutdown
+        self.session = None
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
@@ -54,24 +56,40 @@ class BaseSocialMediaAPIService(ISocialMediaAPIService):
         return headers
     
     async def _make_request(self, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make HTTP request with rate limiting"""
+        """Make HTTP request through the platform rate limiter, retrying with backoff"""
         if not self.session:
             raise RuntimeError("Service not initialized. Use async context manager.")
         
-        # Check rate limits
-        await self._check_rate_limit()
+        max_wait = settings.SOCIAL_MEDIA_RATE_LIMIT_MAX_WAIT_SECONDS
+        max_retries = settings.SOCIAL_MEDIA_MAX_RETRIES
         
         logger.info(f"Making HTTP request to: {url} with params: {params}")
         try:
-            async with self.session.get(url, params=params) as response:
-                logger.info(f"HTTP response status: {response.status} for {url}")
-                if response.status == 429:  # Rate limited
-                    logger.warning("Rate limited, waiting before retry")
-                    await asyncio.sleep(60)
-                    return await self._make_request(url, params)
+            for attempt in range(max_retries + 1):
+                await self.rate_limiter.acquire(max_wait)
                 
-                response.raise_for_status()
-                return await response.json()
+                async with self.session.get(url, params=params, headers=self._get_headers()) as response:
+                    logger.info(f"HTTP response status: {response.status} for {url}")
+                    reset_in = rate_limit_reset_seconds(response.headers)
+                    if reset_in:
+                        self.rate_limiter.pause(reset_in)
+                    
+                    if response.status not in RETRY_STATUSES or attempt == max_retries:
+                        response.raise_for_status()
+                        return await response.json()
+                    
+                    retry_after = retry_after_seconds(response.headers)
+                    if response.status == 429:
+                        # Every caller for this platform has to wait, not just this one
+                        self.rate_limiter.pause(retry_after or backoff_seconds(attempt))
+                    delay = max(retry_after or 0, backoff_seconds(attempt))
+                
+                if delay > max_wait:
+                    raise OutboundRateLimitError(
+                        f"{self._get_platform_name()} asked to retry in {delay:.0f}s (max wait {max_wait}s)"
+                    )
+                logger.warning(f"HTTP {response.status} from {url}, retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
                 
         except aiohttp.ClientError as e:
             logger.error(f"HTTP request failed: {e}")
@@ -80,21 +98,6 @@ class BaseSocialMediaAPIService(ISocialMediaAPIService):
             logger.error(f"Unexpected error in social media API: {e}")
             raise
     
-    async def _check_rate_limit(self):
-        """Check and update rate limits"""
-        now = datetime.now()
-        
-        # Reset hourly counter if needed
-        if (now - self.rate_limit_info["last_reset"]).seconds >= 3600:
-            self.rate_limit_info["current_requests"] = 0
-            self.rate_limit_info["last_reset"] = now
-        
-        # Check if we're over the limit
-        if self.rate_limit_info["current_requests"] >= self.rate_limit_info["requests_per_hour"]:
-            raise Exception("Hourly rate limit exceeded")
-        
-        self.rate_limit_info["current_requests"] += 1
-    
     def _parse_metrics(self, data: Dict[str, Any]) -> SocialMediaMetrics:
         """Parse API response into standardized metrics"""
         return SocialMediaMetrics(
@@ -126,6 +129,11 @@ class BaseSocialMediaAPIService(ISocialMediaAPIService):
         
         return trending
     
+    @staticmethod
+    def _chunks(items: List[str], size: int) -> List[List[str]]:
+        """Split ids into groups no larger than a platform's per-request limit"""
+        return [items[start:start + size] for start in range(0, len(items), size)]
+    
     def _get_platform_name(self) -> str:
         """Get platform name - to be overridden by subclasses"""
         return "unknown"
@@ -134,6 +142,18 @@ class BaseSocialMediaAPIService(ISocialMediaAPIService):
         """Base implementation - to be overridden by subclasses"""
         raise NotImplementedError("Subclasses must implement get_user_metrics method")
     
+    async def get_user_metrics_batch(self, usernames: List[str]) -> Dict[str, SocialMediaMetrics]:
+        """Look users up concurrently - overridden by platforms with multi-user lookup endpoints"""
+        usernames = list(dict.fromkeys(usernames))
+        results = await asyncio.gather(*(self.get_user_metrics(username) for username in usernames), return_exceptions=True)
+        metrics = {}
+        for username, result in zip(usernames, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Skipping {username} in {self._get_platform_name()} batch: {result}")
+            else:
+                metrics[username] = result
+        return metrics
+    
     async def get_trending_hashtags(self, platform: str, limit: int = 20) -> List[TrendingContent]:
         """Base implementation - to be overridden by subclasses"""
         raise NotImplementedError("Subclasses must implement get_trending_hashtags method")
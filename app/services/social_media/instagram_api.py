@@ -16,14 +16,11 @@ logger = logging.getLogger(__name__)
 class InstagramAPIService(BaseSocialMediaAPIService):
     """Instagram API service implementation"""
     
+    requests_per_hour = 200  # Instagram API limit
+    
     def __init__(self, access_token: str):
         super().__init__(access_token=access_token)
         self.base_url = "https://graph.instagram.com"
-        self.rate_limit_info = {
-            "requests_per_hour": 200,  # Instagram API limit
-            "current_requests": 0,
-            "last_reset": datetime.now()
-        }
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Instagram API requests"""
@@ -0,0 +1,153 @@
+"""
+Shared outbound rate limiting for the social media platform APIs
+"""
+
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from app.core.config import settings
+from app.core.exceptions import OutboundRateLimitError
+from app.core.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying after a backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Token bucket refilled at rate_per_second up to capacity.
+
+    Callers reserve a token and sleep until it is theirs, so a burst beyond the
+    capacity is spread out at the refill rate in arrival order instead of being
+    rejected. A reservation that would wait longer than max_wait fails instead,
+    and one whose waiter is cancelled is returned to the bucket.
+    pause() stops all requests until a platform-imposed reset.
+    """
+
+    def __init__(self, name: str, rate_per_second: float, capacity: int):
+        self.name = name
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+
+    async def acquire(self, max_wait: float) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        # Negative tokens are reservations still waiting for the refill
+        delay = max(self._resume_at - now, -self._tokens / self.rate_per_second, 0)
+        if delay > max_wait:
+            self._tokens += 1
+            raise OutboundRateLimitError(
+                f"{self.name} rate limit: next request slot is {delay:.1f}s away (max wait {max_wait}s)"
+            )
+        try:
+            if delay > 0:
+                logger.info(f"TokenBucket[{self.name}]: Waiting {delay:.2f}s for a request slot")
+                await asyncio.sleep(delay)
+            # A pause imposed while this request was queued still applies
+            while time.monotonic() < self._resume_at:
+                await asyncio.sleep(self._resume_at - time.monotonic())
+        except asyncio.CancelledError:
+            # The request will not be made, so hand its slot back to the callers queued behind it
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + 1)
+            raise
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request until seconds from now, e.g. until a Retry-After or rate limit reset"""
+        resume_at = time.monotonic() + seconds
+        if seconds > 0 and resume_at > self._resume_at:
+            self._resume_at = resume_at
+            logger.warning(f"TokenBucket[{self.name}]: Paused for {seconds:.1f}s by the platform")
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+            self._updated = now
+
+
+class SharedThrottle:
+    """Spaces requests to an outbound API at rate_per_second across every worker.
+
+    Each request reserves the API's next free slot in the shared rate limit
+    storage (RATE_LIMIT_STORAGE_URL) and sleeps until it opens; a slot more
+    than max_wait away fails instead. With memory:// storage the rate applies
+    per worker.
+    """
+
+    def __init__(self, name: str, rate_per_second: float):
+        self.name = name
+        self.rate_per_second = rate_per_second
+
+    async def acquire(self, max_wait: float) -> None:
+        delay = await rate_limiter.reserve_slot(f"outbound:{self.name}", 1 / self.rate_per_second, max_wait)
+        if delay is None:
+            raise OutboundRateLimitError(
+                f"{self.name} rate limit: next shared request slot is more than {max_wait}s away"
+            )
+        if delay > 0:
+            logger.info(f"SharedThrottle[{self.name}]: Waiting {delay:.2f}s for a request slot")
+            await asyncio.sleep(delay)
+
+
+class PlatformRateLimiter:
+    """One token bucket per platform, shared by every service instance in the process"""
+
+    def __init__(self, burst: int):
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, platform: str, requests_per_hour: float) -> TokenBucket:
+        bucket = self._buckets.get(platform)
+        if bucket is None:
+            bucket = self._buckets[platform] = TokenBucket(platform, requests_per_hour / 3600, self.burst)
+        return bucket
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds requested by a Retry-After header, given either as seconds or an HTTP date"""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limit_reset_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds until the quota resets when x-rate-limit headers report it exhausted"""
+    remaining = headers.get("x-rate-limit-remaining") or headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-rate-limit-reset") or headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if int(float(remaining)) > 0:
+            return None
+        reset_value = float(reset)
+    except ValueError:
+        return None
+    # Platforms send either an epoch timestamp (Twitter) or a delay in seconds
+    seconds = reset_value - time.time() if reset_value > 1_000_000_000 else reset_value
+    return max(seconds, 0.0)
+
+
+def backoff_seconds(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given zero-based retry attempt"""
+    ceiling = min(settings.SOCIAL_MEDIA_BACKOFF_MAX_SECONDS, settings.SOCIAL_MEDIA_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+platform_rate_limiter = PlatformRateLimiter(burst=settings.SOCIAL_MEDIA_RATE_LIMIT_BURST)
@@ -0,0 +1,81 @@
+"""
+Application-scoped HTTP connection pools for the social media API services
+"""
+
+import asyncio
+import logging
+from typing import Dict, Tuple
+
+import aiohttp
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SocialMediaSessionPool:
+    """Single responsibility: Share one keep-alive aiohttp session per platform.
+
+    Sessions are created on first use and reused by every service instance for
+    that platform, so connections and DNS lookups survive across requests.
+    Authorization headers are sent per request because tokens differ between
+    service instances. The DuckDuckGo search service borrows a session from the
+    same pool. close() must be awaited on application shutdown.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_connections_per_host: int,
+        keepalive_seconds: float,
+        dns_cache_seconds: int,
+        timeout_seconds: float
+    ):
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_seconds = keepalive_seconds
+        self.dns_cache_seconds = dns_cache_seconds
+        self.timeout_seconds = timeout_seconds
+        self._sessions: Dict[str, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+
+    def get_session(self, platform: str) -> aiohttp.ClientSession:
+        """Return the shared session for platform, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(platform)
+        # aiohttp sessions are bound to the loop they were created on
+        if entry is not None and entry[0] is loop and not entry[1].closed:
+            return entry[1]
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_seconds,
+            ttl_dns_cache=self.dns_cache_seconds,
+            enable_cleanup_closed=True
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+        )
+        self._sessions[platform] = (loop, session)
+        logger.info(f"SocialMediaSessionPool: Created connection pool for {platform}")
+        return session
+
+    async def close(self) -> None:
+        """Close every session created on the running loop"""
+        loop = asyncio.get_running_loop()
+        for platform, (session_loop, session) in list(self._sessions.items()):
+            if session_loop is loop:
+                await session.close()
+                del self._sessions[platform]
+        logger.info("SocialMediaSessionPool: Closed connection pools")
+
+
+# Shared by every social media API service so pools outlive individual requests
+social_media_session_pool = SocialMediaSessionPool(
+    max_connections=settings.SOCIAL_MEDIA_HTTP_MAX_CONNECTIONS,
+    max_connections_per_host=settings.SOCIAL_MEDIA_HTTP_MAX_CONNECTIONS_PER_HOST,
+    keepalive_seconds=settings.SOCIAL_MEDIA_HTTP_KEEPALIVE_SECONDS,
+    dns_cache_seconds=settings.SOCIAL_MEDIA_HTTP_DNS_CACHE_SECONDS,
+    timeout_seconds=settings.SOCIAL_MEDIA_HTTP_TIMEOUT_SECONDS
+)
@@ -16,14 +16,11 @@ logger = logging.getLogger(__name__)
 class TikTokAPIService(BaseSocialMediaAPIService):
     """TikTok API service implementation"""
     
+    requests_per_hour = 1000  # TikTok API limit
+    
     def __init__(self, access_token: str):
         super().__init__(access_token=access_token)
         self.base_url = "https://open-api.tiktok.com"
-        self.rate_limit_info = {
-            "requests_per_hour": 1000,  # TikTok API limit
-            "current_requests": 0,
-            "last_reset": datetime.now()
-        }
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for TikTok API requests"""
@@ -16,14 +16,13 @@ logger = logging.getLogger(__name__)
 class TwitterAPIService(BaseSocialMediaAPIService):
     """Twitter API service implementation"""
     
+    requests_per_hour = 300  # Free tier limit
+    # users/by accepts up to 100 comma-separated usernames
+    USERS_LOOKUP_LIMIT = 100
+    
     def __init__(self, bearer_token: str):
         super().__init__(access_token=bearer_token)
         self.base_url = "https://api.twitter.com/2"
-        self.rate_limit_info = {
-            "requests_per_hour": 300,  # Free tier limit
-            "current_requests": 0,
-            "last_reset": datetime.now()
-        }
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Twitter API requests"""
@@ -53,47 +52,77 @@ class TwitterAPIService(BaseSocialMediaAPIService):
             if not user:
                 raise Exception(f"User {username} not found")
             
-            # Get recent tweets for engagement calculation
-            tweets_url = f"{self.base_url}/users/{user['id']}/tweets"
-            tweets_params = {
-                'max_results': 10,
-                'tweet.fields': 'public_metrics,created_at'
-            }
-            
-            tweets_data = await self._make_request(tweets_url, tweets_params)
-            tweets = tweets_data.get('data', [])
-            
-            # Calculate engagement rate
-            total_engagement = 0
-            total_impressions = 0
-            
-            for tweet in tweets:
-                metrics = tweet.get('public_metrics', {})
-                total_engagement += (
-                    metrics.get('like_count', 0) +
-                    metrics.get('retweet_count', 0) +
-                    metrics.get('reply_count', 0)
-                )
-                total_impressions += metrics.get('impression_count', 0)
-            
-            engagement_rate = (total_engagement / max(total_impressions, 1)) * 100
-            
-            return SocialMediaMetrics(
-                platform="twitter",
-                followers=user.get('public_metrics', {}).get('followers_count', 0),
-                engagement_rate=engagement_rate,
-                reach=user.get('public_metrics', {}).get('followers_count', 0),
-                impressions=total_impressions,
-                likes=sum(t.get('public_metrics', {}).get('like_count', 0) for t in tweets),
-                comments=sum(t.get('public_metrics', {}).get('reply_count', 0) for t in tweets),
-                shares=sum(t.get('public_metrics', {}).get('retweet_count', 0) for t in tweets),
-                timestamp=datetime.now()
-            )
+            return await self._build_user_metrics(user)
             
         except Exception as e:
             logger.error(f"Failed to get Twitter user metrics: {e}")
             raise
     
+    async def get_user_metrics_batch(self, usernames: List[str]) -> Dict[str, SocialMediaMetrics]:
+        """Get metrics for several users, looking them up USERS_LOOKUP_LIMIT usernames per call"""
+        usernames = list(dict.fromkeys(usernames))
+        responses = await asyncio.gather(*(
+            self._make_request(f"{self.base_url}/users/by", {
+                'usernames': ','.join(chunk),
+                'user.fields': 'public_metrics,verified,created_at'
+            })
+            for chunk in self._chunks(usernames, self.USERS_LOOKUP_LIMIT)
+        ))
+        users = {user['username'].lower(): user for data in responses for user in data.get('data', [])}
+        
+        found = [username for username in usernames if username.lower() in users]
+        for username in set(usernames) - set(found):
+            logger.warning(f"Twitter user {username} not found")
+        
+        # Engagement still comes from each user's own recent tweets
+        results = await asyncio.gather(*(self._build_user_metrics(users[username.lower()]) for username in found), return_exceptions=True)
+        metrics = {}
+        for username, result in zip(found, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to get Twitter user metrics for {username}: {result}")
+            else:
+                metrics[username] = result
+        return metrics
+    
+    async def _build_user_metrics(self, user: Dict[str, Any]) -> SocialMediaMetrics:
+        """Metrics for a looked-up user, with engagement from their recent tweets"""
+        # Get recent tweets for engagement calculation
+        tweets_url = f"{self.base_url}/users/{user['id']}/tweets"
+        tweets_params = {
+            'max_results': 10,
+            'tweet.fields': 'public_metrics,created_at'
+        }
+        
+        tweets_data = await self._make_request(tweets_url, tweets_params)
+        tweets = tweets_data.get('data', [])
+        
+        # Calculate engagement rate
+        total_engagement = 0
+        total_impressions = 0
+        
+        for tweet in tweets:
+            metrics = tweet.get('public_metrics', {})
+            total_engagement += (
+                metrics.get('like_count', 0) +
+                metrics.get('retweet_count', 0) +
+                metrics.get('reply_count', 0)
+            )
+            total_impressions += metrics.get('impression_count', 0)
+        
+        engagement_rate = (total_engagement / max(total_impressions, 1)) * 100
+        
+        return SocialMediaMetrics(
+            platform="twitter",
+            followers=user.get('public_metrics', {}).get('followers_count', 0),
+            engagement_rate=engagement_rate,
+            reach=user.get('public_metrics', {}).get('followers_count', 0),
+            impressions=total_impressions,
+            likes=sum(t.get('public_metrics', {}).get('like_count', 0) for t in tweets),
+            comments=sum(t.get('public_metrics', {}).get('reply_count', 0) for t in tweets),
+            shares=sum(t.get('public_metrics', {}).get('retweet_count', 0) for t in tweets),
+            timestamp=datetime.now()
+        )
+    
     async def get_trending_hashtags(self, platform: str, limit: int = 20) -> List[TrendingContent]:
         """Get trending hashtags from Twitter"""
         logger.info(f"Starting Twitter trending hashtags request for {platform} with limit {limit}")
@@ -16,14 +16,13 @@ logger = logging.getLogger(__name__)
 class YouTubeAPIService(BaseSocialMediaAPIService):
     """YouTube API service implementation"""
     
+    requests_per_hour = 10000 / 24  # YouTube API quota is 10,000 requests per day
+    # channels and videos accept up to 50 comma-separated ids
+    MAX_IDS_PER_REQUEST = 50
+    
     def __init__(self, api_key: str):
         super().__init__(api_key=api_key)
         self.base_url = "https://www.googleapis.com/youtube/v3"
-        self.rate_limit_info = {
-            "requests_per_day": 10000,  # YouTube API quota
-            "current_requests": 0,
-            "last_reset": datetime.now()
-        }
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for YouTube API requests"""
@@ -40,88 +39,136 @@ class YouTubeAPIService(BaseSocialMediaAPIService):
     async def get_user_metrics(self, username: str) -> SocialMediaMetrics:
         """Get user metrics from YouTube"""
         try:
-            # Get channel by username
-            search_url = f"{self.base_url}/search"
-            search_params = {
-                'key': self.api_key,
-                'part': 'snippet',
-                'type': 'channel',
-                'q': username,
-                'maxResults': 1
-            }
-            
-            search_data = await self._make_request(search_url, search_params)
-            channels = search_data.get('items', [])
-            
-            if not channels:
+            channel_id = await self._find_channel_id(username)
+            if not channel_id:
                 raise Exception(f"Channel {username} not found")
             
-            channel_id = channels[0]['id']['channelId']
-            
             # Get channel statistics
-            channel_url = f"{self.base_url}/channels"
-            channel_params = {
-                'key': self.api_key,
-                'part': 'statistics',
-                'id': channel_id
-            }
-            
-            channel_data = await self._make_request(channel_url, channel_params)
-            channel = channel_data.get('items', [{}])[0]
-            stats = channel.get('statistics', {})
+            stats = (await self._get_channel_statistics([channel_id])).get(channel_id, {})
             
             # Get recent videos for engagement calculation
-            videos_url = f"{self.base_url}/search"
-            videos_params = {
-                'key': self.api_key,
-                'part': 'snippet',
-                'channelId': channel_id,
-                'type': 'video',
-                'maxResults': 10,
-                'order': 'date'
-            }
+            video_ids = await self._get_recent_video_ids(channel_id)
+            videos = list((await self._get_video_statistics(video_ids)).values())
             
-            videos_data = await self._make_request(videos_url, videos_params)
-            video_ids = [item['id']['videoId'] for item in videos_data.get('items', [])]
-            
-            # Get video statistics
-            if video_ids:
-                video_stats_url = f"{self.base_url}/videos"
-                video_stats_params = {
-                    'key': self.api_key,
-                    'part': 'statistics',
-                    'id': ','.join(video_ids)
-                }
-                
-                video_stats_data = await self._make_request(video_stats_url, video_stats_params)
-                videos = video_stats_data.get('items', [])
-                
-                total_views = sum(int(v.get('statistics', {}).get('viewCount', 0)) for v in videos)
-                total_likes = sum(int(v.get('statistics', {}).get('likeCount', 0)) for v in videos)
-                total_comments = sum(int(v.get('statistics', {}).get('commentCount', 0)) for v in videos)
-                
-                engagement_rate = ((total_likes + total_comments) / max(total_views, 1)) * 100
-            else:
-                engagement_rate = 0.0
-                total_likes = 0
-                total_comments = 0
-            
-            return SocialMediaMetrics(
-                platform="youtube",
-                followers=int(stats.get('subscriberCount', 0)),
-                engagement_rate=engagement_rate,
-                reach=int(stats.get('viewCount', 0)),
-                impressions=int(stats.get('viewCount', 0)),
-                likes=total_likes,
-                comments=total_comments,
-                shares=0,  # Not available in YouTube API
-                timestamp=datetime.now()
-            )
+            return self._build_channel_metrics(stats, videos)
             
         except Exception as e:
             logger.error(f"Failed to get YouTube user metrics: {e}")
             raise
     
+    async def get_user_metrics_batch(self, usernames: List[str]) -> Dict[str, SocialMediaMetrics]:
+        """Get metrics for several channels, fetching channel and video statistics in shared calls"""
+        usernames = list(dict.fromkeys(usernames))
+        
+        # Names can only be resolved to channel ids one search at a time
+        resolved = await asyncio.gather(*(self._find_channel_id(username) for username in usernames), return_exceptions=True)
+        channel_ids = {}
+        for username, channel_id in zip(usernames, resolved):
+            if isinstance(channel_id, str):
+                channel_ids[username] = channel_id
+            else:
+                logger.warning(f"YouTube channel {username} not found: {channel_id or 'no search results'}")
+        if not channel_ids:
+            return {}
+        
+        unique_ids = list(dict.fromkeys(channel_ids.values()))
+        stats_by_channel = await self._get_channel_statistics(unique_ids)
+        
+        recent = await asyncio.gather(*(self._get_recent_video_ids(channel_id) for channel_id in unique_ids), return_exceptions=True)
+        videos_by_channel = {
+            channel_id: video_ids if isinstance(video_ids, list) else []
+            for channel_id, video_ids in zip(unique_ids, recent)
+        }
+        video_stats = await self._get_video_statistics(
+            [video_id for video_ids in videos_by_channel.values() for video_id in video_ids]
+        )
+        
+        return {
+            username: self._build_channel_metrics(
+                stats_by_channel.get(channel_id, {}),
+                [video_stats[video_id] for video_id in videos_by_channel[channel_id] if video_id in video_stats]
+            )
+            for username, channel_id in channel_ids.items()
+        }
+    
+    async def _find_channel_id(self, username: str) -> Optional[str]:
+        """Get channel id by username"""
+        search_url = f"{self.base_url}/search"
+        search_params = {
+            'key': self.api_key,
+            'part': 'snippet',
+            'type': 'channel',
+            'q': username,
+            'maxResults': 1
+        }
+        
+        search_data = await self._make_request(search_url, search_params)
+        channels = search_data.get('items', [])
+        return channels[0]['id']['channelId'] if channels else None
+    
+    async def _get_channel_statistics(self, channel_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Statistics by channel id, looked up MAX_IDS_PER_REQUEST channels per call"""
+        responses = await asyncio.gather(*(
+            self._make_request(f"{self.base_url}/channels", {
+                'key': self.api_key,
+                'part': 'statistics',
+                'id': ','.join(chunk)
+            })
+            for chunk in self._chunks(channel_ids, self.MAX_IDS_PER_REQUEST)
+        ))
+        return {item['id']: item.get('statistics', {}) for data in responses for item in data.get('items', [])}
+    
+    async def _get_recent_video_ids(self, channel_id: str) -> List[str]:
+        videos_url = f"{self.base_url}/search"
+        videos_params = {
+            'key': self.api_key,
+            'part': 'snippet',
+            'channelId': channel_id,
+            'type': 'video',
+            'maxResults': 10,
+            'order': 'date'
+        }
+        
+        videos_data = await self._make_request(videos_url, videos_params)
+        return [item['id']['videoId'] for item in videos_data.get('items', [])]
+    
+    async def _get_video_statistics(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Statistics by video id, looked up MAX_IDS_PER_REQUEST videos per call"""
+        responses = await asyncio.gather(*(
+            self._make_request(f"{self.base_url}/videos", {
+                'key': self.api_key,
+                'part': 'statistics',
+                'id': ','.join(chunk)
+            })
+            for chunk in self._chunks(video_ids, self.MAX_IDS_PER_REQUEST)
+        ))
+        return {item['id']: item.get('statistics', {}) for data in responses for item in data.get('items', [])}
+    
+    def _build_channel_metrics(self, stats: Dict[str, Any], videos: List[Dict[str, Any]]) -> SocialMediaMetrics:
+        """Metrics from channel statistics and the statistics of its recent videos"""
+        if videos:
+            total_views = sum(int(v.get('viewCount', 0)) for v in videos)
+            total_likes = sum(int(v.get('likeCount', 0)) for v in videos)
+            total_comments = sum(int(v.get('commentCount', 0)) for v in videos)
+            
+            engagement_rate = ((total_likes + total_comments) / max(total_views, 1)) * 100
+        else:
+            engagement_rate = 0.0
+            total_likes = 0
+            total_comments = 0
+        
+        return SocialMediaMetrics(
+            platform="youtube",
+            followers=int(stats.get('subscriberCount', 0)),
+            engagement_rate=engagement_rate,
+            reach=int(stats.get('viewCount', 0)),
+            impressions=int(stats.get('viewCount', 0)),
+            likes=total_likes,
+            comments=total_comments,
+            shares=0,  # Not available in YouTube API
+            timestamp=datetime.now()
+        )
+    
     async def get_trending_hashtags(self, platform: str, limit: int = 20) -> List[TrendingContent]:
         """Get trending hashtags from YouTube"""
         try:
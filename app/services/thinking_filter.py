@@ -0,0 +1,100 @@
+"""
+Incremental removal of model thinking/reasoning content from streamed responses
+"""
+
+import re
+from typing import List, Optional
+
+# Block tags whose whole content is dropped, including deepseek-r1's <think>
+THINKING_TAGS = ("think", "thinking", "reasoning", "analysis", "thought", "step", "process")
+
+# Lead-in phrases removed by AIAgentService._strip_thinking_content
+THINKING_PHRASES = (
+    "Let me think about this", "Let me analyze", "First, let me", "To answer this",
+    "Based on my analysis", "After considering", "Now, let me provide", "Here's my thinking",
+    "Let me break this down", "To provide the best answer", "Let me approach this", "In order to",
+    "Let me start by", "Let me begin by", "Let me first", "Let me consider", "Let me examine",
+    "Let me look at", "Let me review", "Let me check", "Let me verify", "Let me confirm",
+    "Let me understand", "Let me clarify", "Let me explain", "Let me describe", "Let me outline",
+    "Let me summarize", "Let me conclude", "Let me finish", "Let me end", "Let me wrap up",
+    "Let me close", "Let me finalize", "Let me complete"
+)
+
+
+class ThinkingStreamFilter:
+    """Strips thinking blocks and lead-in phrases from text that arrives in chunks.
+
+    Text that could still turn into an opening tag, closing tag or phrase is held
+    back until the next chunk decides it, so everything returned by feed() is
+    final and can be forwarded to the client immediately.
+    """
+
+    def __init__(self, tags=THINKING_TAGS, phrases=THINKING_PHRASES):
+        self._opening_tags = [f"<{tag}>" for tag in tags]
+        self._opening_pattern = re.compile("|".join(re.escape(tag) for tag in self._opening_tags), re.IGNORECASE)
+        self._phrases = [phrase.lower() for phrase in phrases]
+        # Longest phrases first so a phrase is never cut short by one of its prefixes
+        self._phrase_pattern = re.compile(
+            "|".join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True)),
+            re.IGNORECASE
+        )
+        self._buffer = ""
+        self._closing_tag: Optional[str] = None
+        self._started = False
+
+    def feed(self, text: str) -> str:
+        """Add a chunk of model output and return the part that is safe to emit"""
+        self._buffer += text
+        emitted: List[str] = []
+
+        while self._buffer:
+            if self._closing_tag is not None:
+                end = self._buffer.lower().find(self._closing_tag)
+                if end == -1:
+                    # Keep only what could be the start of the closing tag
+                    self._buffer = self._buffer[-(len(self._closing_tag) - 1):]
+                    break
+                self._buffer = self._buffer[end + len(self._closing_tag):]
+                self._closing_tag = None
+                continue
+
+            match = self._opening_pattern.search(self._buffer)
+            if match:
+                emitted.append(self._buffer[:match.start()])
+                self._closing_tag = "</" + match.group(0)[1:].lower()
+                self._buffer = self._buffer[match.end():]
+                continue
+
+            self._buffer = self._phrase_pattern.sub("", self._buffer)
+            split = self._pending_start(self._buffer)
+            emitted.append(self._buffer[:split])
+            self._buffer = self._buffer[split:]
+            break
+
+        return self._clean("".join(emitted))
+
+    def flush(self) -> str:
+        """Return whatever is still held back once the stream has ended"""
+        remaining = "" if self._closing_tag is not None else self._phrase_pattern.sub("", self._buffer)
+        self._buffer = ""
+        self._closing_tag = None
+        return self._clean(remaining).rstrip()
+
+    def _pending_start(self, text: str) -> int:
+        """Index from which text is an unfinished opening tag or phrase"""
+        lowered = text.lower()
+        longest = max(max(map(len, self._opening_tags)), max(map(len, self._phrases)))
+        for start in range(max(len(text) - longest, 0), len(text)):
+            suffix = lowered[start:]
+            if any(tag.startswith(suffix) for tag in self._opening_tags):
+                return start
+            if any(phrase.startswith(suffix) for phrase in self._phrases):
+                return start
+        return len(text)
+
+    def _clean(self, text: str) -> str:
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
+
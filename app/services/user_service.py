@@ -6,9 +6,10 @@ from typing import Optional
 import logging
 
 from app.db.models import User as UserModel
-from app.core.security import hash_password, verify_password
+from app.services.auth import hash_password_async, verify_password_async
 from app.api.users.user_models import UserProfileUpdate, UserPasswordUpdate, UserProfileResponse
 from app.api.admin.admin_user_models import AdminUserProfileUpdate
+from app.services.principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +91,7 @@ class UserService:
                     .values(**update_data)
                 )
                 await self.db.commit()
+                await principal_cache.invalidate_user(user_id, user.username)
 
                 # Refresh the user object
                 await self.db.refresh(user)
@@ -122,14 +124,14 @@ class UserService:
                 )
 
             # Verify current password
-            if not verify_password(password_update.current_password, user.hashed_password):
+            if not await verify_password_async(password_update.current_password, user.hashed_password):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Current password is incorrect"
                 )
 
             # Hash new password
-            new_hashed_password = hash_password(password_update.new_password)
+            new_hashed_password = await hash_password_async(password_update.new_password)
 
             # Update password
             await self.db.execute(
@@ -227,7 +229,7 @@ class UserService:
             
             # Handle password update if provided
             if profile_update.new_password is not None:
-                new_hashed_password = hash_password(profile_update.new_password)
+                new_hashed_password = await hash_password_async(profile_update.new_password)
                 update_data['hashed_password'] = new_hashed_password
 
             # Update the user
@@ -238,6 +240,8 @@ class UserService:
                     .values(**update_data)
                 )
                 await self.db.commit()
+                # user still holds the previous username here
+                await principal_cache.invalidate_user(target_user_id, user.username)
 
                 # Refresh the user object
                 await self.db.refresh(user)
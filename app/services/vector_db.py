@@ -1,105 +1,157 @@
 import qdrant_client
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
-import numpy as np
-import hashlib
 import os
-from typing import List, Dict, Any
+import logging
+import threading
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import uuid
 from datetime import datetime
+from app.core.config import settings
+from app.core.exceptions import VectorStoreUnavailableError
+from app.services.embedding_service import EmbeddingService, embedding_service as default_embedding_service
+
+logger = logging.getLogger(__name__)
+
 
 class VectorDatabaseService:
-    def __init__(self):
-        # Initialize Qdrant client
-        self.client = QdrantClient(":memory:")  # In-memory for development, can be changed to URL for production
+    def __init__(self, client: QdrantClient = None, embedding_service: EmbeddingService = None):
+        # Qdrant client is created on first use (see _create_client for backend selection)
+        self._client = client
+        self._client_lock = threading.Lock()
         
-        # Vector dimension for simple hash-based embeddings
-        self.vector_dim = 128
+        # Shared embedding pipeline (provider + LRU cache)
+        self.embedding_service = embedding_service or default_embedding_service
         
         # Collection names
         self.user_conversations_collection = "user_conversations"
         self.agent_contexts_collection = "agent_contexts"
         
-        # Initialize collections
-        self._init_collections()
+        # Vector dimension per collection
+        self.collection_dimensions = {
+            self.user_conversations_collection: settings.VECTOR_DB_USER_CONVERSATIONS_DIM,
+            self.agent_contexts_collection: settings.VECTOR_DB_AGENT_CONTEXTS_DIM
+        }
+        
+        # Collections are created lazily the first time they are used
+        self._ready_collections = set()
+        self._collections_lock = threading.Lock()
     
-    def _generate_simple_embedding(self, text: str) -> List[float]:
-        """Generate a simple hash-based embedding for text"""
-        # Create a hash of the text
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        
-        # Convert hash to a fixed-size vector
-        vector = []
-        for i in range(0, len(text_hash), 2):
-            if len(vector) >= self.vector_dim:
-                break
-            # Convert hex pair to float between -1 and 1
-            hex_pair = text_hash[i:i+2]
-            value = int(hex_pair, 16) / 255.0 * 2 - 1
-            vector.append(value)
-        
-        # Pad or truncate to exact dimension
-        while len(vector) < self.vector_dim:
-            vector.append(0.0)
-        
-        return vector[:self.vector_dim]
+    @property
+    def client(self) -> QdrantClient:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
     
-    def _init_collections(self):
-        """Initialize Qdrant collections"""
-        # Create user conversations collection
-        try:
-            self.client.get_collection(self.user_conversations_collection)
-        except:
-            self.client.create_collection(
-                collection_name=self.user_conversations_collection,
-                vectors_config=VectorParams(size=self.vector_dim, distance=Distance.COSINE)
-            )
+    def _create_client(self) -> QdrantClient:
+        """Create the Qdrant client for the configured backend.
+
+        VECTOR_DB_URL points at a Qdrant server shared by all workers. Otherwise
+        VECTOR_DB_PATH opens an on-disk local store, which Qdrant only allows one
+        process to hold; any other process raises VectorStoreUnavailableError
+        rather than silently keeping its vectors in memory.
+        """
+        if settings.VECTOR_DB_URL:
+            logger.info(f"VectorDatabaseService: Connecting to Qdrant server at {settings.VECTOR_DB_URL}")
+            return QdrantClient(url=settings.VECTOR_DB_URL, api_key=settings.VECTOR_DB_API_KEY or None)
         
-        # Create agent contexts collection
+        if settings.VECTOR_DB_PATH:
+            try:
+                os.makedirs(settings.VECTOR_DB_PATH, exist_ok=True)
+                client = QdrantClient(path=settings.VECTOR_DB_PATH)
+                logger.info(f"VectorDatabaseService: Using on-disk vector store at {settings.VECTOR_DB_PATH}")
+                return client
+            except RuntimeError as e:
+                raise VectorStoreUnavailableError(
+                    f"On-disk vector store at {settings.VECTOR_DB_PATH} is held by another process (pid {os.getpid()} "
+                    f"could not open it). Set VECTOR_DB_URL to a Qdrant server when running more than one worker."
+                ) from e
+        
+        return QdrantClient(":memory:")
+    
+    def _embed_query(self, collection_name: str, text: str) -> Optional[Tuple[List[float], str]]:
+        """Embed a search query with the dimension configured for the collection.
+
+        Returns the vector and the vector space it was embedded in, or None if embedding fails.
+        """
         try:
-            self.client.get_collection(self.agent_contexts_collection)
-        except:
-            self.client.create_collection(
-                collection_name=self.agent_contexts_collection,
-                vectors_config=VectorParams(size=self.vector_dim, distance=Distance.COSINE)
-            )
+            return self.embedding_service.embed_with_space(text, self.collection_dimensions[collection_name])
+        except Exception as e:
+            logger.warning(f"VectorDatabaseService: Embedding the query for '{collection_name}' failed, returning recent points instead: {e}")
+            return None
+    
+    @staticmethod
+    def _vector_space_condition(vector_space: str) -> FieldCondition:
+        """Restrict a similarity search to points embedded in the same vector space as the query"""
+        return FieldCondition(key="embedding_model", match=MatchValue(value=vector_space))
+    
+    def _ensure_collection(self, collection_name: str):
+        """Create the collection on first use, adopting the vector size of an existing one"""
+        if collection_name in self._ready_collections:
+            return
+        
+        with self._collections_lock:
+            if collection_name in self._ready_collections:
+                return
+            
+            dimension = self.collection_dimensions[collection_name]
+            try:
+                collection = self.client.get_collection(collection_name)
+                existing_dimension = collection.config.params.vectors.size
+                if existing_dimension != dimension:
+                    logger.error(
+                        f"VectorDatabaseService: Collection '{collection_name}' stores {existing_dimension}-dim vectors "
+                        f"but {dimension} is configured; keeping {existing_dimension}. Recreate the collection to change it."
+                    )
+                    self.collection_dimensions[collection_name] = existing_dimension
+            except Exception:
+                self.client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=VectorParams(size=dimension, distance=Distance.COSINE)
+                )
+            
+            self._ready_collections.add(collection_name)
+    
+    def warm_up(self) -> Dict[str, int]:
+        """Open the backend and make sure every collection exists; returns point counts per collection"""
+        counts = {}
+        for collection_name in self.collection_dimensions:
+            self._ensure_collection(collection_name)
+            counts[collection_name] = self.client.count(collection_name).count
+        logger.info(f"VectorDatabaseService: Warm-loaded collections {counts}")
+        return counts
 
     def store_user_conversation(self, user_id: int, conversation_text: str, 
                                 conversation_type: str = "general", metadata: Dict = None) -> str:
         """Store user conversation in vector database"""
-        conversation_uuid = str(uuid.uuid4())
-        
-        # Generate embedding
-        embedding = self._generate_simple_embedding(conversation_text)
-        
-        # Prepare payload
-        payload = {
-            "user_id": user_id,
-            "conversation_type": conversation_type,
-            "timestamp": datetime.utcnow().isoformat(),
-            "conversation_uuid": conversation_uuid,
-            "conversation_text": conversation_text
-        }
-        if metadata:
-            payload.update(metadata)
-        
-        # Add to collection
-        self.client.upsert(
+        return self.store_user_conversations(
+            user_id, [conversation_text], conversation_type, [metadata] if metadata else None
+        )[0]
+
+    def store_user_conversations(self, user_id: int, conversation_texts: List[str],
+                                 conversation_type: str = "general", metadatas: List[Dict] = None,
+                                 chunk_size: int = None) -> List[str]:
+        """Store several user conversations with batched embedding and one upsert per chunk"""
+        return self._store_batch(
             collection_name=self.user_conversations_collection,
-            points=[
-                PointStruct(
-                    id=conversation_uuid,
-                    vector=embedding,
-                    payload=payload
-                )
-            ]
+            texts=conversation_texts,
+            metadatas=metadatas,
+            chunk_size=chunk_size,
+            build_payload=lambda point_uuid, text: {
+                "user_id": user_id,
+                "conversation_type": conversation_type,
+                "timestamp": datetime.utcnow().isoformat(),
+                "conversation_uuid": point_uuid,
+                "conversation_text": text
+            }
         )
-        
-        return conversation_uuid
 
     def retrieve_user_conversations(self, user_id: int, query: str = None, 
                                     limit: int = 10, conversation_type: str = None) -> List[Dict]:
         """Retrieve user conversations with optional similarity search"""
+        self._ensure_collection(self.user_conversations_collection)
         # Build filter
         filter_conditions = [FieldCondition(key="user_id", match=MatchValue(value=user_id))]
         if conversation_type:
@@ -107,13 +159,14 @@ class VectorDatabaseService:
         
         filter_query = Filter(must=filter_conditions) if filter_conditions else None
         
-        if query:
+        query_embedding = self._embed_query(self.user_conversations_collection, query) if query else None
+        if query_embedding is not None:
+            query_vector, vector_space = query_embedding
             # Similarity search
-            query_embedding = self._generate_simple_embedding(query)
             results = self.client.search(
                 collection_name=self.user_conversations_collection,
-                query_vector=query_embedding,
-                query_filter=filter_query,
+                query_vector=query_vector,
+                query_filter=Filter(must=filter_conditions + [self._vector_space_condition(vector_space)]),
                 limit=limit,
                 with_payload=True,
                 with_vectors=False
@@ -155,39 +208,67 @@ class VectorDatabaseService:
     def store_agent_context(self, agent_uuid: str, context_text: str, 
                             context_type: str = "memory", metadata: Dict = None) -> str:
         """Store AI agent context in vector database"""
-        context_uuid = str(uuid.uuid4())
-        
-        # Generate embedding
-        embedding = self._generate_simple_embedding(context_text)
-        
-        # Prepare payload
-        payload = {
-            "agent_uuid": agent_uuid,
-            "context_type": context_type,
-            "timestamp": datetime.utcnow().isoformat(),
-            "context_uuid": context_uuid,
-            "context_text": context_text
-        }
-        if metadata:
-            payload.update(metadata)
-        
-        # Add to collection
-        self.client.upsert(
+        return self.store_agent_contexts(
+            agent_uuid, [context_text], context_type, [metadata] if metadata else None
+        )[0]
+
+    def store_agent_contexts(self, agent_uuid: str, context_texts: List[str],
+                             context_type: str = "memory", metadatas: List[Dict] = None,
+                             chunk_size: int = None) -> List[str]:
+        """Store several AI agent contexts with batched embedding and one upsert per chunk"""
+        return self._store_batch(
             collection_name=self.agent_contexts_collection,
-            points=[
-                PointStruct(
-                    id=context_uuid,
-                    vector=embedding,
-                    payload=payload
-                )
-            ]
+            texts=context_texts,
+            metadatas=metadatas,
+            chunk_size=chunk_size,
+            build_payload=lambda point_uuid, text: {
+                "agent_uuid": agent_uuid,
+                "context_type": context_type,
+                "timestamp": datetime.utcnow().isoformat(),
+                "context_uuid": point_uuid,
+                "context_text": text
+            }
         )
+
+    def _store_batch(self, collection_name: str, texts: List[str], metadatas: Optional[List[Dict]],
+                     chunk_size: Optional[int], build_payload: Callable[[str, str], Dict[str, Any]]) -> List[str]:
+        """Embed and upsert texts chunk by chunk: one embedding call and one upsert request per chunk.
+
+        Embedding errors are raised and the chunk is not stored. Each point records
+        the vector space it was embedded in so searches never mix providers.
+        """
+        if metadatas is not None and len(metadatas) != len(texts):
+            raise ValueError("metadatas must have one entry per text")
+        
+        self._ensure_collection(collection_name)
+        chunk_size = chunk_size or settings.VECTOR_DB_UPSERT_CHUNK_SIZE
+        point_uuids = []
+        
+        for start in range(0, len(texts), chunk_size):
+            chunk_texts = texts[start:start + chunk_size]
+            chunk_metadatas = metadatas[start:start + chunk_size] if metadatas else [None] * len(chunk_texts)
+            embeddings, vector_spaces = self.embedding_service.embed_batch_with_spaces(
+                chunk_texts, self.collection_dimensions[collection_name]
+            )
+            
+            points = []
+            for text, metadata, embedding, vector_space in zip(chunk_texts, chunk_metadatas, embeddings, vector_spaces):
+                point_uuid = str(uuid.uuid4())
+                payload = build_payload(point_uuid, text)
+                if metadata:
+                    payload.update(metadata)
+                payload["embedding_model"] = vector_space
+                points.append(PointStruct(id=point_uuid, vector=embedding, payload=payload))
+                point_uuids.append(point_uuid)
+            
+            self.client.upsert(collection_name=collection_name, points=points)
         
-        return context_uuid
+        return point_uuids
 
     def retrieve_agent_context(self, agent_uuid: str, query: str = None, 
                                limit: int = 10, context_type: str = None) -> List[Dict]:
         """Retrieve AI agent context with optional similarity search"""
+        self._ensure_collection(self.agent_contexts_collection)
         # Build filter
         filter_conditions = [FieldCondition(key="agent_uuid", match=MatchValue(value=agent_uuid))]
         if context_type:
@@ -195,13 +276,14 @@ class VectorDatabaseService:
         
         filter_query = Filter(must=filter_conditions) if filter_conditions else None
         
-        if query:
+        query_embedding = self._embed_query(self.agent_contexts_collection, query) if query else None
+        if query_embedding is not None:
+            query_vector, vector_space = query_embedding
             # Similarity search
-            query_embedding = self._generate_simple_embedding(query)
             results = self.client.search(
                 collection_name=self.agent_contexts_collection,
-                query_vector=query_embedding,
-                query_filter=filter_query,
+                query_vector=query_vector,
+                query_filter=Filter(must=filter_conditions + [self._vector_space_condition(vector_space)]),
                 limit=limit,
                 with_payload=True,
                 with_vectors=False
@@ -239,3 +321,17 @@ class VectorDatabaseService:
                 contexts.append(context)
         
         return contexts
+
+
+_shared_vector_db: Optional[VectorDatabaseService] = None
+_shared_vector_db_lock = threading.Lock()
+
+
+def get_vector_db_service() -> VectorDatabaseService:
+    """Process-wide VectorDatabaseService shared by requests, agents and scheduled jobs"""
+    global _shared_vector_db
+    if _shared_vector_db is None:
+        with _shared_vector_db_lock:
+            if _shared_vector_db is None:
+                _shared_vector_db = VectorDatabaseService()
+    return _shared_vector_db
@@ -86,7 +86,8 @@ class BaseWebSearchService(IWebSearchService):
             self.rate_limit_info["current_requests"] = 0
             self.rate_limit_info["last_reset"] = now
         
-        # Check if we're over the limit
+        # Check if we're over the limit. There is no await between the check and
+        # the increment, so concurrent searches cannot overshoot the daily quota.
         if self.rate_limit_info["current_requests"] >= self.rate_limit_info["requests_per_day"]:
             raise Exception("Daily rate limit exceeded")
         
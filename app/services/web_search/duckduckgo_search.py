@@ -9,7 +9,10 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from urllib.parse import quote_plus
 from app.services.web_search.base_web_search import BaseWebSearchService
+from app.core.cache import get_cache
+from app.core.config import settings
 from app.core.interfaces import SearchResult
+from app.services.social_media.session_pool import social_media_session_pool
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +25,40 @@ class DuckDuckGoSearchService(BaseWebSearchService):
         self.base_url = "https://api.duckduckgo.com"
         self.instant_answer_url = "https://api.duckduckgo.com/"
         self.html_search_url = "https://html.duckduckgo.com/html/"
+        self.race_sources = settings.DUCKDUCKGO_RACE_SOURCES
+        self.cache = get_cache("duckduckgo_search", ttl_seconds=settings.WEB_SEARCH_CACHE_TTL_SECONDS)
+    
+    async def __aenter__(self):
+        """Requests go through the shared keep-alive session, so there is nothing to open"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        return social_media_session_pool.get_session("duckduckgo")
     
     async def search(self, query: str, max_results: int = 10) -> List[SearchResult]:
-        """Search using DuckDuckGo API"""
+        """Search using DuckDuckGo API, serving repeated queries from the cache"""
+        cache_key = f"{self._normalize_query(query)}:{max_results}"
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Serving cached DuckDuckGo results for: {query}")
+            return cached
+        
+        results = await self._search_uncached(query, max_results)
+        # Empty results are usually a failed or blocked request, so they are retried next time
+        if results:
+            await self.cache.set(cache_key, results)
+        return results
+    
+    async def _search_uncached(self, query: str, max_results: int) -> List[SearchResult]:
         try:
             logger.info(f"Searching DuckDuckGo for: {query}")
             
+            if self.race_sources:
+                return await self._search_race(query, max_results)
+            
             # Try HTML search first (more reliable)
             html_results = await self._search_html(query, max_results)
             if html_results:
@@ -48,6 +79,31 @@ class DuckDuckGoSearchService(BaseWebSearchService):
             logger.error(f"DuckDuckGo search failed: {e}")
             return []
     
+    async def _search_race(self, query: str, max_results: int) -> List[SearchResult]:
+        """Query the HTML and instant answer endpoints together and keep the first non-empty answer"""
+        pending = {
+            asyncio.create_task(self._search_html(query, max_results)),
+            asyncio.create_task(self._search_instant_answer(query))
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results = task.result()
+                    if results:
+                        logger.info(f"Found {len(results)} results from the first responding source")
+                        return results[:max_results]
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        logger.warning(f"No results found for query: {query}")
+        return []
+    
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+    
     async def _search_instant_answer(self, query: str) -> List[SearchResult]:
         """Search using DuckDuckGo instant answer API"""
         params = {
@@ -58,22 +114,23 @@ class DuckDuckGoSearchService(BaseWebSearchService):
         }
         
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            ) as session:
-                async with session.get(self.instant_answer_url, params=params) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get('content-type', '')
-                        if 'application/json' in content_type:
-                            data = await response.json()
-                            results = self._parse_instant_answer(data, query)
-                            logger.info(f"Instant answer API returned {len(results)} results")
-                            return results
-                        else:
-                            logger.warning(f"Instant answer API returned non-JSON content: {content_type}")
+            async with self._get_session().get(
+                self.instant_answer_url,
+                params=params,
+                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    content_type = response.headers.get('content-type', '')
+                    if 'application/json' in content_type:
+                        data = await response.json()
+                        results = self._parse_instant_answer(data, query)
+                        logger.info(f"Instant answer API returned {len(results)} results")
+                        return results
                     else:
-                        logger.warning(f"Instant answer API returned status {response.status}")
+                        logger.warning(f"Instant answer API returned non-JSON content: {content_type}")
+                else:
+                    logger.warning(f"Instant answer API returned status {response.status}")
         except Exception as e:
             logger.warning(f"Instant answer search failed: {e}")
         
@@ -87,8 +144,9 @@ class DuckDuckGoSearchService(BaseWebSearchService):
         }
         
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=15),
+            async with self._get_session().get(
+                self.html_search_url,
+                params=params,
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -96,16 +154,16 @@ class DuckDuckGoSearchService(BaseWebSearchService):
                     'Accept-Encoding': 'gzip, deflate',
                     'Connection': 'keep-alive',
                     'Upgrade-Insecure-Requests': '1'
-                }
-            ) as session:
-                async with session.get(self.html_search_url, params=params) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        results = self._parse_html_results(html, max_results)
-                        logger.info(f"HTML search returned {len(results)} results")
-                        return results
-                    else:
-                        logger.warning(f"HTML search returned status {response.status}")
+                },
+                timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                if response.status == 200:
+                    html = await response.text()
+                    results = self._parse_html_results(html, max_results)
+                    logger.info(f"HTML search returned {len(results)} results")
+                    return results
+                else:
+                    logger.warning(f"HTML search returned status {response.status}")
         except Exception as e:
             logger.warning(f"HTML search failed: {e}")
         